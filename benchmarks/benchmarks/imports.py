@@ -0,0 +1,27 @@
+"""
+ASV benchmarks for the time to import pvlib and its modules.
+
+Each ``timeraw_`` benchmark runs its code in a new Python process, so that
+modules imported by earlier benchmarks are not reused.
+"""
+
+
+class Imports:
+
+    def timeraw_import_pvlib(self):
+        return "import pvlib"
+
+    def timeraw_import_solarposition(self):
+        return "import pvlib.solarposition"
+
+    def timeraw_import_location(self):
+        return "import pvlib.location"
+
+    def timeraw_import_pvsystem(self):
+        return "import pvlib.pvsystem"
+
+    def timeraw_import_modelchain(self):
+        return "import pvlib.modelchain"
+
+    def timeraw_import_iotools(self):
+        return "from pvlib.iotools import read_tmy3"
@@ -2,8 +2,11 @@
 ASV benchmarks for irradiance.py
 """
 
+import inspect
+
+import numpy as np
 import pandas as pd
-from pvlib import irradiance, location
+from pvlib import atmosphere, irradiance, location, tools
 
 
 class Irradiance:
@@ -66,3 +69,47 @@ class Irradiance:
         irradiance.erbs(self.clearsky_irradiance.ghi,
                         self.solar_position.apparent_zenith,
                         self.times)
+
+
+def set_perez_inputs(obj, nyears):
+    obj.times = pd.date_range(start='20180101', freq='1min',
+                              periods=525600*nyears)
+    solar_position = location.Location(40, -80).get_solarposition(obj.times)
+    obj.solar_zenith = solar_position.apparent_zenith
+    obj.solar_azimuth = solar_position.azimuth
+    obj.airmass = atmosphere.get_relative_airmass(obj.solar_zenith)
+    # simple clear sky irradiance that needs no Linke turbidity data
+    cos_zenith = tools.cosd(obj.solar_zenith).clip(lower=0)
+    obj.dni = 900 * cos_zenith ** 0.3
+    obj.dhi = 100 * cos_zenith
+    obj.dni_extra = irradiance.get_extra_radiation(obj.times)
+
+
+class Perez:
+    params = [1, 4]  # number of years of 1-minute data
+    param_names = ['nyears']
+
+    def setup(self, nyears):
+        set_perez_inputs(self, nyears)
+        self.args = (20, 180, self.dhi, self.dni, self.dni_extra,
+                     self.solar_zenith, self.solar_azimuth, self.airmass)
+        self.array_args = self.args[:2] + tuple(x.to_numpy()
+                                                for x in self.args[2:])
+        self.out = np.empty(len(self.times))
+
+    def time_perez(self, nyears):
+        irradiance.perez(*self.args)
+
+    def time_perez_components(self, nyears):
+        irradiance.perez(*self.args, return_components=True)
+
+    def time_perez_arrays(self, nyears):
+        irradiance.perez(*self.array_args)
+
+    def time_perez_arrays_out(self, nyears):
+        if 'out' not in inspect.signature(irradiance.perez).parameters:
+            raise NotImplementedError
+        irradiance.perez(*self.array_args, out=self.out)
+
+    def peakmem_perez(self, nyears):
+        irradiance.perez(*self.args)
@@ -0,0 +1,36 @@
+"""ASV benchmarks for the Perez model in irradiance.py using numba.
+
+We use a separate module so that we can control the pvlib import process
+using an environment variable. This will force pvlib to compile the numba
+code during setup.
+
+Try to keep relevant sections in sync with benchmarks/irradiance.py
+"""
+
+import os
+os.environ['PVLIB_USE_NUMBA'] = '1'
+
+
+from pvlib import irradiance  # NOQA: E402
+
+from .irradiance import set_perez_inputs  # NOQA: E402
+
+
+class PerezNumba:
+    params = [1, 4]  # number of years of 1-minute data
+    param_names = ['nyears']
+
+    def setup(self, nyears):
+        if not getattr(irradiance, 'USE_NUMBA', False):
+            raise NotImplementedError
+        set_perez_inputs(self, nyears)
+        self.args = (20, 180, self.dhi, self.dni, self.dni_extra,
+                     self.solar_zenith, self.solar_azimuth, self.airmass)
+        # compile outside of the timing
+        irradiance.perez(*self.args)
+
+    def time_perez(self, nyears):
+        irradiance.perez(*self.args)
+
+    def time_perez_components(self, nyears):
+        irradiance.perez(*self.args, return_components=True)
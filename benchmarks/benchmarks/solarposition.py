@@ -62,6 +62,24 @@ class SolarPosition:
         solarposition.nrel_earthsun_distance(self.times_localized)
 
 
+class SolarPositionInterp:
+    params = ([1, 10, 100], ['5min', '15min'])  # number of days, grid step
+    param_names = ['ndays', 'step']
+
+    def setup(self, ndays, step):
+        if not hasattr(solarposition, 'spa_python_interp'):
+            raise NotImplementedError
+        self.times_localized = pd.date_range(
+            start='20180601', freq='1min', periods=1440*ndays,
+            tz='Etc/GMT+7')
+        self.lat = 35.1
+        self.lon = -106.6
+
+    def time_spa_python_interp(self, ndays, step):
+        solarposition.spa_python_interp(self.times_localized, self.lat,
+                                        self.lon, step=step)
+
+
 class SolarPositionCalcTime:
 
     def setup(self):
@@ -1,31 +1,48 @@
-from pvlib.version import __version__  # noqa: F401
+import importlib
 
-from pvlib import (  # noqa: F401
-    # list spectrum first so it's available for atmosphere & pvsystem (GH 1628)
-    spectrum,
+# submodules are imported when first accessed as attributes of pvlib (PEP
+# 562), so that ``import pvlib`` only loads the modules that are used
+_submodules = [
+    'albedo',
+    'atmosphere',
+    'bifacial',
+    'clearsky',
+    'iam',
+    'inverter',
+    'iotools',
+    'irradiance',
+    'ivtools',
+    'location',
+    'modelchain',
+    'pvarray',
+    'pvsystem',
+    'scaling',
+    'shading',
+    'singlediode',
+    'snow',
+    'soiling',
+    'solarposition',
+    'spa',
+    'spectrum',
+    'temperature',
+    'tools',
+    'tracking',
+    'transformer',
+    'version',
+]
 
-    albedo,
-    atmosphere,
-    bifacial,
-    clearsky,
-    iam,
-    inverter,
-    iotools,
-    irradiance,
-    ivtools,
-    location,
-    modelchain,
-    pvarray,
-    pvsystem,
-    scaling,
-    shading,
-    singlediode,
-    snow,
-    soiling,
-    solarposition,
-    spa,
-    temperature,
-    tools,
-    tracking,
-    transformer,
-)
+__all__ = _submodules + ['__version__']
+
+
+def __getattr__(name):
+    if name in _submodules:
+        return importlib.import_module(f'{__name__}.{name}')
+    if name == '__version__':
+        # importlib.metadata is slow to import, so wait until it is needed
+        from pvlib.version import __version__
+        return __version__
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
@@ -0,0 +1,40 @@
+"""
+Switch between compiling functions with numba or running them in python,
+using the ``PVLIB_USE_NUMBA`` environment variable, see spa.py.
+
+The variable is read when this module is first imported. numba itself is
+only imported when a function is compiled.
+"""
+
+import importlib.util
+import os
+import warnings
+
+
+USE_NUMBA = os.getenv('PVLIB_USE_NUMBA', '0') != '0'
+if USE_NUMBA and importlib.util.find_spec('numba') is None:
+    warnings.warn('Could not import numba, falling back to python '
+                  'calculation')
+    USE_NUMBA = False
+
+
+def jcompile(*args, **kwargs):
+    """
+    Decorator compiling a function with ``numba.jit(*args, **kwargs)`` if
+    ``USE_NUMBA``, else returning the function unchanged.
+    """
+    if USE_NUMBA:
+        from numba import jit
+        return jit(*args, **kwargs)
+    return lambda func: func
+
+
+def __getattr__(name):
+    # prange is resolved when accessed, so that importing this module does
+    # not import numba
+    if name == 'prange':
+        if USE_NUMBA:
+            from numba import prange
+            return prange
+        return range
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
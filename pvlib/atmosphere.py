@@ -416,10 +416,16 @@ def tdew_from_rh(temp_air, relative_humidity, coeff=(6.112, 17.62, 243.12)):
     return dewpoint
 
 
-first_solar_spectral_correction = deprecated(
-    since='0.10.0',
-    alternative='pvlib.spectrum.spectral_factor_firstsolar'
-)(pvlib.spectrum.spectral_factor_firstsolar)
+def __getattr__(name):
+    # create the deprecated alias only when it is used, so that importing
+    # atmosphere does not import pvlib.spectrum (PEP 562)
+    if name == 'first_solar_spectral_correction':
+        globals()[name] = deprecated(
+            since='0.10.0',
+            alternative='pvlib.spectrum.spectral_factor_firstsolar'
+        )(pvlib.spectrum.spectral_factor_firstsolar)
+        return globals()[name]
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
 def bird_hulstrom80_aod_bb(aod380, aod500):
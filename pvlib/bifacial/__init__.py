@@ -2,12 +2,30 @@
 The ``bifacial`` submodule contains functions to model bifacial modules.
 """
 
+import importlib
+
 from pvlib._deprecation import deprecated
-from pvlib.bifacial import pvfactors, infinite_sheds, utils  # noqa: F401
 from .loss_models import power_mismatch_deline  # noqa: F401
 
-pvfactors_timeseries = deprecated(
-    since='0.9.1',
-    name='pvlib.bifacial.pvfactors_timeseries',
-    alternative='pvlib.bifacial.pvfactors.pvfactors_timeseries'
-)(pvfactors.pvfactors_timeseries)
+# submodules are imported when first accessed (PEP 562)
+_submodules = ['pvfactors', 'infinite_sheds', 'utils']
+
+__all__ = _submodules + ['power_mismatch_deline', 'pvfactors_timeseries']
+
+
+def __getattr__(name):
+    if name in _submodules:
+        return importlib.import_module(f'{__name__}.{name}')
+    if name == 'pvfactors_timeseries':
+        from pvlib.bifacial import pvfactors
+        globals()[name] = deprecated(
+            since='0.9.1',
+            name='pvlib.bifacial.pvfactors_timeseries',
+            alternative='pvlib.bifacial.pvfactors.pvfactors_timeseries'
+        )(pvfactors.pvfactors_timeseries)
+        return globals()[name]
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
@@ -6,10 +6,10 @@ to calculate clear sky GHI, DNI, and DHI.
 import os
 from collections import OrderedDict
 import calendar
+import threading
 
 import numpy as np
 import pandas as pd
-from scipy.linalg import hankel
 import h5py
 
 from pvlib import atmosphere, tools
@@ -145,7 +145,8 @@ def ineichen(apparent_zenith, airmass_absolute, linke_turbidity,
 
 
 def lookup_linke_turbidity(time, latitude, longitude, filepath=None,
-                           interp_turbidity=True):
+                           interp_turbidity=True, interp_spatial=False,
+                           cache=False):
     """
     Look up the Linke Turibidity from the ``LinkeTurbidities.h5``
     data file supplied with pvlib.
@@ -154,9 +155,11 @@ def lookup_linke_turbidity(time, latitude, longitude, filepath=None,
     ----------
     time : pandas.DatetimeIndex
 
-    latitude : float or int
+    latitude : float, int or array-like
 
-    longitude : float or int
+    longitude : float, int or array-like
+        If `latitude` or `longitude` is array-like, turbidity is looked up
+        for each site given by their broadcast values.
 
     filepath : string, optional
         The path to the ``.h5`` file.
@@ -165,9 +168,24 @@ def lookup_linke_turbidity(time, latitude, longitude, filepath=None,
         If ``True``, interpolates the monthly Linke turbidity values
         found in ``LinkeTurbidities.h5`` to daily values.
 
+    interp_spatial : bool, default False
+        If ``True``, bilinearly interpolates between the four grid cells
+        whose centers surround each site. Otherwise the value of the grid
+        cell containing the site is used.
+
+    cache : bool, default False
+        If ``True``, the complete grid is kept in memory after the first
+        call, memory-mapped if the file stores it contiguously, and reused
+        by later calls with the same `filepath`. The cache can be emptied
+        with :py:func:`clear_linke_turbidity_cache`. Otherwise the file is
+        opened on each call and only the required grid cells are read.
+
     Returns
     -------
-    turbidity : Series
+    turbidity : Series or np.ndarray
+        Series if `latitude` and `longitude` are scalars, otherwise an
+        array with shape of the broadcast sites followed by the length of
+        `time`.
 
     Notes
     -----
@@ -175,6 +193,9 @@ def lookup_linke_turbidity(time, latitude, longitude, filepath=None,
     The returned value for each time is either the monthly value or an
     interpolated value to smooth the transition between months.
     Interpolation is done on the day of year as determined by UTC.
+
+    The grid has 12 values (one per month) for each of 2160 x 4320 cells of
+    1/12 degree and takes 112 MB of memory when cached.
     """
 
     # The .h5 file 'LinkeTurbidities.h5' contains a single 2160 x 4320 x 12
@@ -198,23 +219,112 @@ def lookup_linke_turbidity(time, latitude, longitude, filepath=None,
         pvlib_path = os.path.dirname(os.path.abspath(__file__))
         filepath = os.path.join(pvlib_path, 'data', 'LinkeTurbidities.h5')
 
-    latitude_index = _degrees_to_index(latitude, coordinate='latitude')
-    longitude_index = _degrees_to_index(longitude, coordinate='longitude')
+    scalar = np.ndim(latitude) == 0 and np.ndim(longitude) == 0
+    latitude, longitude = np.broadcast_arrays(
+        np.asarray(latitude, dtype=float), np.asarray(longitude, dtype=float))
+    shape = latitude.shape
 
-    with h5py.File(filepath, 'r') as lt_h5_file:
-        lts = lt_h5_file['LinkeTurbidity'][latitude_index, longitude_index]
+    if interp_spatial:
+        rows, cols, weights = _linke_turbidity_bilinear(latitude.ravel(),
+                                                        longitude.ravel())
+    else:
+        rows = _degrees_to_index(latitude.ravel(), coordinate='latitude')
+        cols = _degrees_to_index(longitude.ravel(), coordinate='longitude')
+        rows, cols = rows[:, np.newaxis], cols[:, np.newaxis]
 
-    if interp_turbidity:
-        linke_turbidity = _interpolate_turbidity(lts, time)
+    if cache:
+        lts = _linke_turbidity_grid(filepath)[rows, cols]
+    else:
+        # read each distinct cell once
+        cells, inverse = np.unique(np.stack([rows.ravel(), cols.ravel()]),
+                                   axis=1, return_inverse=True)
+        with h5py.File(filepath, 'r') as lt_h5_file:
+            dataset = lt_h5_file['LinkeTurbidity']
+            lts = np.stack([dataset[i, j] for i, j in cells.T])
+        lts = lts[inverse.reshape(rows.shape)]
+
+    if interp_spatial:
+        lts = np.einsum('ij,ijk->ik', weights, lts)
+    else:
+        lts = lts[:, 0]
+
+    if scalar:
+        lts = lts[0]
+        if interp_turbidity:
+            linke_turbidity = _interpolate_turbidity(lts, time)
+        else:
+            months = tools._pandas_to_utc(time).month - 1
+            linke_turbidity = pd.Series(lts[months], index=time)
     else:
-        months = tools._pandas_to_utc(time).month - 1
-        linke_turbidity = pd.Series(lts[months], index=time)
+        if interp_turbidity:
+            linke_turbidity = _interpolate_turbidity(lts, time)
+        else:
+            months = tools._pandas_to_utc(time).month - 1
+            linke_turbidity = lts[:, months].astype(float)
+        linke_turbidity = linke_turbidity.reshape(shape + (len(time),))
 
     linke_turbidity /= 20.
 
     return linke_turbidity
 
 
+_linke_turbidity_cache = {}
+_linke_turbidity_cache_lock = threading.Lock()
+
+
+def clear_linke_turbidity_cache():
+    """
+    Release the Linke turbidity grids kept in memory by
+    :py:func:`lookup_linke_turbidity` with ``cache=True``.
+    """
+    with _linke_turbidity_cache_lock:
+        _linke_turbidity_cache.clear()
+
+
+def _linke_turbidity_grid(filepath):
+    """
+    Return the read-only Linke turbidity grid in `filepath`, loading it on
+    first use. A grid stored contiguously in the file is memory-mapped,
+    otherwise (e.g. if it is compressed) it is read into memory.
+    """
+    key = os.path.abspath(filepath)
+    with _linke_turbidity_cache_lock:
+        grid = _linke_turbidity_cache.get(key)
+        if grid is None:
+            grid = tools._read_h5_grid(filepath, 'LinkeTurbidity')
+            _linke_turbidity_cache[key] = grid
+    return grid
+
+
+def _linke_turbidity_bilinear(latitude, longitude):
+    """
+    Rows, columns and weights of the four Linke turbidity grid cells
+    surrounding each site, each with shape (number of sites, 4).
+
+    Sites beyond the outermost cell centers in latitude take the values of
+    the outermost cells, and longitudes wrap around the antimeridian.
+    """
+    # validate the ranges
+    _degrees_to_index(latitude, coordinate='latitude')
+    _degrees_to_index(longitude, coordinate='longitude')
+    # fractional index of the cell centers, see _degrees_to_index
+    row = (90 - latitude) * 12 - 0.5
+    col = (longitude + 180) * 12 - 0.5
+    row0 = np.clip(np.floor(row), 0, 2158)
+    row_weight = np.clip(row - row0, 0, 1)
+    col0 = np.floor(col)
+    col_weight = col - col0
+    row0 = row0.astype(int)
+    col0 = col0.astype(int)
+    rows = np.stack([row0, row0, row0 + 1, row0 + 1], axis=1)
+    cols = np.stack([col0, col0 + 1, col0, col0 + 1], axis=1) % 4320
+    weights = np.stack([(1 - row_weight) * (1 - col_weight),
+                        (1 - row_weight) * col_weight,
+                        row_weight * (1 - col_weight),
+                        row_weight * col_weight], axis=1)
+    return rows, cols, weights
+
+
 def _is_leap_year(year):
     """Determine if a year is leap year.
 
@@ -238,20 +348,21 @@ def _interpolate_turbidity(lts, time):
     Parameters
     ----------
     lts : np.array
-        Monthly Linke turbidity values.
+        Monthly Linke turbidity values, with shape (12,) or (sites, 12).
     time : pd.DatetimeIndex
         Times to be interpolated onto.
 
     Returns
     -------
-    linke_turbidity : pd.Series
-        The interpolated turbidity.
+    linke_turbidity : pd.Series or np.array
+        The interpolated turbidity. An array with shape (sites, len(time))
+        if `lts` is 2-D.
     """
     # Data covers 1 year. Assume that data corresponds to the value at the
     # middle of each month. This means that we need to add previous Dec and
     # next Jan to the array so that the interpolation will work for
     # Jan 1 - Jan 15 and Dec 16 - Dec 31.
-    lts_concat = np.concatenate([[lts[-1]], lts, [lts[0]]])
+    lts_concat = np.concatenate([lts[..., -1:], lts, lts[..., :1]], axis=-1)
 
     time_utc = tools._pandas_to_utc(time)
 
@@ -261,6 +372,16 @@ def _interpolate_turbidity(lts, time):
     days_leap = _calendar_month_middles(2016)
     days_no_leap = _calendar_month_middles(2015)
 
+    if lts.ndim > 1:
+        # the same interpolation weights apply to all sites
+        months = np.arange(len(days_leap))
+        position = np.where(isleap, np.interp(dayofyear, days_leap, months),
+                            np.interp(dayofyear, days_no_leap, months))
+        lower = np.minimum(np.floor(position).astype(int), len(months) - 2)
+        weight = position - lower
+        return (lts_concat[:, lower] * (1 - weight)
+                + lts_concat[:, lower + 1] * weight)
+
     # Then we map the month value to the day of year value.
     # Do it for both leap and non-leap years.
     lt_leap = np.interp(dayofyear, days_leap, lts_concat)
@@ -535,15 +656,14 @@ def _calc_d(aod700, p):
     return d
 
 
-def _calc_stats(data, samples_per_window, sample_interval, H):
+def _calc_stats(data, samples_per_window, sample_interval):
     """ Calculates statistics for each window, used by Reno-style clear
     sky detection functions. Does not return the line length statistic
     which is provided by _calc_windowed_stat and _line_length.
 
-    Calculations are done on a sliding window defined by the Hankel matrix H.
-    Columns in H define the indices for each window. Each window contains
-    samples_per_window index values. The first window starts with index 0;
-    the last window ends at the last index position in data.
+    Calculations are done on a sliding window of samples_per_window
+    consecutive values, see _windowed_reduce. The first window starts with
+    index 0; the last window ends at the last index position in data.
 
     In the calculation of data_slope_nstd, a choice is made here where [1]_ is
     ambiguous. data_slope_nstd is the standard deviation of slopes divided by
@@ -560,8 +680,6 @@ def _calc_stats(data, samples_per_window, sample_interval, H):
         Number of data points in each window
     sample_interval : float
         Time in minutes in each sample interval
-    H : 2D ndarray
-        Hankel matrix defining the indices for each window.
 
     Returns
     -------
@@ -581,35 +699,73 @@ def _calc_stats(data, samples_per_window, sample_interval, H):
        v90, p. 520-531, 2016.
     """
 
-    data_mean = data.values[H].mean(axis=0)
-    data_mean = _to_centered_series(data_mean, data.index, samples_per_window)
-    data_max = data.values[H].max(axis=0)
+    values = data.to_numpy(dtype=float)
+    mean = _windowed_mean(values, samples_per_window)
+    data_mean = _to_centered_series(mean, data.index, samples_per_window)
+    data_max = _windowed_reduce(np.maximum, values, samples_per_window)
     data_max = _to_centered_series(data_max, data.index, samples_per_window)
     # shift to get forward difference, .diff() is backward difference instead
     data_diff = data.diff().shift(-1)
     data_slope = data_diff / sample_interval
-    data_slope_nstd = _slope_nstd_windowed(data_slope.values[:-1], data, H,
-                                           samples_per_window, sample_interval)
+    data_slope_nstd = _slope_nstd_windowed(data_slope.values[:-1], data,
+                                           samples_per_window,
+                                           sample_interval, mean)
     return data_mean, data_max, data_slope_nstd, data_slope
 
 
-def _slope_nstd_windowed(slopes, data, H, samples_per_window, sample_interval):
+def _windowed_reduce(ufunc, values, samples_per_window):
+    """
+    Reduce each window of samples_per_window consecutive values with ufunc.
+
+    The windows are accumulated one offset at a time, which adds the values
+    in the same order as ``ufunc.reduce(values[H], axis=0)`` with the Hankel
+    index matrix ``H`` of the windows, so results are identical, but only
+    arrays of the size of ``values`` are created.
+    """
+    nwindows = len(values) - samples_per_window + 1
+    out = np.array(values[:nwindows], dtype=float)
+    for k in range(1, samples_per_window):
+        ufunc(out, values[k:k + nwindows], out=out)
+    return out
+
+
+def _windowed_mean(values, samples_per_window):
+    # same operations as np.mean(values[H], axis=0)
+    return _windowed_reduce(np.add, values, samples_per_window) \
+        / samples_per_window
+
+
+def _windowed_std(values, samples_per_window, ddof=0):
+    # same operations as np.std(values[H], axis=0, ddof=ddof)
+    mean = _windowed_mean(values, samples_per_window)
+    nwindows = len(mean)
+    out = np.zeros(nwindows)
+    for k in range(samples_per_window):
+        out += (values[k:k + nwindows] - mean)**2
+    return np.sqrt(out / max(samples_per_window - ddof, 0))
+
+
+def _slope_nstd_windowed(slopes, data, samples_per_window, sample_interval,
+                         data_mean=None):
+    if data_mean is None:
+        data_mean = _windowed_mean(data.to_numpy(dtype=float),
+                                   samples_per_window)
     with np.errstate(divide='ignore', invalid='ignore'):
-        nstd = slopes[H[:-1, ]].std(ddof=1, axis=0) \
-            / data.values[H].mean(axis=0)
+        nstd = _windowed_std(slopes, samples_per_window - 1, ddof=1) \
+            / data_mean
     return _to_centered_series(nstd, data.index, samples_per_window)
 
 
-def _max_diff_windowed(data, H, samples_per_window):
-    raw = np.diff(data)
-    raw = np.abs(raw[H[:-1, ]]).max(axis=0)
+def _max_diff_windowed(data, samples_per_window):
+    raw = np.abs(np.diff(data))
+    raw = _windowed_reduce(np.maximum, raw, samples_per_window - 1)
     return _to_centered_series(raw, data.index, samples_per_window)
 
 
-def _line_length_windowed(data, H, samples_per_window,
+def _line_length_windowed(data, samples_per_window,
                           sample_interval):
     raw = np.sqrt(np.diff(data)**2. + sample_interval**2.)
-    raw = np.sum(raw[H[:-1, ]], axis=0)
+    raw = _windowed_reduce(np.add, raw, samples_per_window - 1)
     return _to_centered_series(raw, data.index, samples_per_window)
 
 
@@ -620,16 +776,14 @@ def _to_centered_series(vals, idx, samples_per_window):
     return pd.Series(index=idx, data=vals).shift(shift)
 
 
-def _clear_sample_index(clear_windows, samples_per_window, align, H):
+def _clear_sample_index(clear_windows, samples_per_window, align):
     """
     Returns indices of clear samples in clear windows
     """
-    # H contains indices for each window, e.g. indices for the first window
-    # are in first column of H.
     # clear_windows contains one boolean for each window and is aligned
     # by 'align', default to center
     # shift clear_windows.index to be aligned left (e.g. first value in the
-    # left-most position) to line up with the first column of H.
+    # left-most position) to line up with the first sample of each window.
 
     # commented if/else block for future align='left', 'right' capability
     # if align == 'right':
@@ -642,9 +796,20 @@ def _clear_sample_index(clear_windows, samples_per_window, align, H):
     idx = clear_windows.shift(shift)
     # drop rows at the end corresponding to windows past the end of data
     idx = idx.drop(clear_windows.index[1 - samples_per_window:])
-    idx = idx.astype(bool)  # shift changed type to object
-    clear_samples = np.unique(H[:, idx])
-    return clear_samples
+    idx = idx.astype(bool).to_numpy()  # shift changed type to object
+    # mark every sample of each clear window
+    clear_samples = _windowed_spread(idx, samples_per_window)
+    return np.flatnonzero(clear_samples)
+
+
+def _windowed_spread(windows, samples_per_window):
+    # samples covered by any of the windows that are True, the inverse of
+    # _windowed_reduce(np.logical_or, ...)
+    nwindows = len(windows)
+    out = np.zeros(nwindows + samples_per_window - 1, dtype=bool)
+    for k in range(samples_per_window):
+        out[k:k + nwindows] |= windows
+    return out
 
 
 def _clearsky_get_threshold(sample_interval):
@@ -835,24 +1000,20 @@ def detect_clearsky(measured, clearsky, times=None, infer_limits=False,
         _, samples_per_window = \
             tools._get_sample_intervals(times, window_length)
 
-    # check that we have enough data to produce a nonempty hankel matrix
+    # check that we have enough data to fill at least one window
     if len(times) < samples_per_window:
         raise ValueError(f"times has only {len(times)} entries, but it must \
                            have at least {samples_per_window} entries")
 
-    # generate matrix of integers for creating windows with indexing
-    H = hankel(np.arange(samples_per_window),
-               np.arange(samples_per_window-1, len(times)))
-
     # calculate measurement statistics
     meas_mean, meas_max, meas_slope_nstd, meas_slope = _calc_stats(
-        meas, samples_per_window, sample_interval, H)
+        meas, samples_per_window, sample_interval)
     meas_line_length = _line_length_windowed(
-        meas, H, samples_per_window, sample_interval)
+        meas, samples_per_window, sample_interval)
 
     # calculate clear sky statistics
     clear_mean, clear_max, _, clear_slope = _calc_stats(
-        clear, samples_per_window, sample_interval, H)
+        clear, samples_per_window, sample_interval)
 
     # find a scaling factor for the clear sky time series that minimizes the
     # RMSE between the clear times identified in the measured data and the
@@ -864,11 +1025,11 @@ def detect_clearsky(measured, clearsky, times=None, infer_limits=False,
     for iteration in range(max_iterations):
         scaled_clear = alpha * clear
         clear_line_length = _line_length_windowed(
-            scaled_clear, H, samples_per_window, sample_interval)
+            scaled_clear, samples_per_window, sample_interval)
 
         line_diff = meas_line_length - clear_line_length
         slope_max_diff = _max_diff_windowed(
-            meas - scaled_clear, H, samples_per_window)
+            meas - scaled_clear, samples_per_window)
         # evaluate comparison criteria
         c1 = np.abs(meas_mean - alpha*clear_mean) < mean_diff
         c2 = np.abs(meas_max - alpha*clear_max) < max_diff
@@ -881,8 +1042,7 @@ def detect_clearsky(measured, clearsky, times=None, infer_limits=False,
         # create array to return
         clear_samples = np.full_like(meas, False, dtype='bool')
         # find the samples contained in any window classified as clear
-        idx = _clear_sample_index(clear_windows, samples_per_window, 'center',
-                                  H)
+        idx = _clear_sample_index(clear_windows, samples_per_window, 'center')
         clear_samples[idx] = True
 
         # find a new alpha
@@ -927,6 +1087,203 @@ def detect_clearsky(measured, clearsky, times=None, infer_limits=False,
         return clear_samples
 
 
+def _clear_windows(meas, clear, samples_per_window, sample_interval,
+                   mean_diff, max_diff, lower_line_length, upper_line_length,
+                   var_diff, slope_dev):
+    """
+    Evaluates the detect_clearsky criteria with ``alpha=1`` for every
+    complete window in the arrays ``meas`` and ``clear``, using the same
+    operations as detect_clearsky so that results are identical.
+    """
+    meas_mean = _windowed_mean(meas, samples_per_window)
+    meas_max = _windowed_reduce(np.maximum, meas, samples_per_window)
+    clear_mean = _windowed_mean(clear, samples_per_window)
+    clear_max = _windowed_reduce(np.maximum, clear, samples_per_window)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        meas_slope_nstd = _windowed_std(np.diff(meas) / sample_interval,
+                                        samples_per_window - 1, ddof=1) \
+            / meas_mean
+
+    def line_length(data):
+        raw = np.sqrt(np.diff(data)**2. + sample_interval**2.)
+        return _windowed_reduce(np.add, raw, samples_per_window - 1)
+
+    line_diff = line_length(meas) - line_length(clear)
+    slope_max_diff = _windowed_reduce(
+        np.maximum, np.abs(np.diff(meas - clear)), samples_per_window - 1)
+    c1 = np.abs(meas_mean - clear_mean) < mean_diff
+    c2 = np.abs(meas_max - clear_max) < max_diff
+    c3 = (line_diff > lower_line_length) & (line_diff < upper_line_length)
+    c4 = meas_slope_nstd < var_diff
+    c5 = slope_max_diff < slope_dev
+    c6 = (clear_mean != 0) & ~np.isnan(clear_mean)
+    return c1 & c2 & c3 & c4 & c5 & c6
+
+
+class ClearskyDetector:
+    """
+    Detects clear sky times in streaming data using the algorithm developed
+    by Reno and Hansen.
+
+    Samples are added with :py:meth:`append`, which evaluates only the
+    windows completed by the new samples and returns the flags of samples
+    that no further window can contain, i.e. each sample is flagged once
+    ``samples_per_window - 1`` later samples have been appended.
+    :py:meth:`flush` returns the flags of the remaining samples based on
+    the windows completed so far.
+
+    The criteria and thresholds are those of :py:func:`detect_clearsky`,
+    but ``clearsky`` is scaled by a fixed ``alpha`` instead of iteratively
+    rescaled, because the rescaling uses all clear times in the data. The
+    flags returned by :py:meth:`append` followed by :py:meth:`flush` are
+    identical to those of ``detect_clearsky(measured, alpha * clearsky,
+    max_iterations=1)`` for the same data.
+
+    Parameters
+    ----------
+    sample_interval : float
+        Time between consecutive samples. [minutes]
+    infer_limits : bool, default False
+        If True, does not use passed in kwargs (or defaults), but instead
+        interpolates these values from Table 1 in [2]_.
+    window_length : int, default 10
+        Length of sliding time window in minutes. Each window must contain at
+        least three data points.
+    mean_diff : float, default 75
+        Threshold value for agreement between mean values of measured
+        and clearsky in each interval, see Eq. 6 in [1]. [W/m2]
+    max_diff : float, default 75
+        Threshold value for agreement between maxima of measured and
+        clearsky values in each interval, see Eq. 7 in [1]. [W/m2]
+    lower_line_length : float, default -5
+        Lower limit of line length criterion from Eq. 8 in [1].
+    upper_line_length : float, default 10
+        Upper limit of line length criterion from Eq. 8 in [1].
+    var_diff : float, default 0.005
+        Threshold value in Hz for the agreement between normalized
+        standard deviations of rate of change in irradiance, see Eqs. 9
+        through 11 in [1].
+    slope_dev : float, default 8
+        Threshold value for agreement between the largest magnitude of
+        change in successive values, see Eqs. 12 through 14 in [1].
+    alpha : float, default 1
+        Scaling factor applied to ``clearsky``.
+
+    Attributes
+    ----------
+    samples_per_window : int
+        Number of samples in each window.
+
+    Raises
+    ------
+    ValueError
+        If a window contains less than three data points.
+
+    See also
+    --------
+    detect_clearsky
+
+    References
+    ----------
+    .. [1] Reno, M.J. and C.W. Hansen, "Identification of periods of clear
+       sky irradiance in time series of GHI measurements" Renewable Energy,
+       v90, p. 520-531, 2016.
+    .. [2] Jordan, D.C. and C. Hansen, "Clear-sky detection for PV
+       degradation analysis using multiple regression", Renewable Energy,
+       v209, p. 393-400, 2023. :doi:`10.1016/j.renene.2023.04.035`
+    """
+
+    def __init__(self, sample_interval, infer_limits=False, window_length=10,
+                 mean_diff=75, max_diff=75, lower_line_length=-5,
+                 upper_line_length=10, var_diff=0.005, slope_dev=8,
+                 alpha=1):
+        if infer_limits:
+            window_length, mean_diff, max_diff, lower_line_length, \
+                upper_line_length, var_diff, slope_dev = \
+                _clearsky_get_threshold(sample_interval)
+        samples_per_window = int(window_length / sample_interval)
+        if samples_per_window < 3:
+            raise ValueError(f"Samples per window of {samples_per_window}"
+                             " found. Each window must contain at least 3"
+                             " data points."
+                             f" Window length of {window_length} found;"
+                             " increase window length to"
+                             f" {3*sample_interval} or longer.")
+        self.sample_interval = sample_interval
+        self.samples_per_window = samples_per_window
+        self.alpha = alpha
+        self._thresholds = (mean_diff, max_diff, lower_line_length,
+                            upper_line_length, var_diff, slope_dev)
+        # the samples that are still in an incomplete window, with the
+        # flags from the complete windows that contain them
+        self._meas = np.empty(0)
+        self._clear = np.empty(0)
+        self._flags = np.empty(0, dtype=bool)
+        self._times = None
+
+    def append(self, measured, clearsky):
+        """
+        Add samples and return the flags of samples that are final.
+
+        Parameters
+        ----------
+        measured : numeric or Series
+            New measured GHI values. [W/m2]
+        clearsky : numeric or Series
+            Expected clearsky GHI at the same times. [W/m2]
+
+        Returns
+        -------
+        clear_samples : array or Series
+            Boolean array of whether or not each final sample is clear, in
+            order, starting with the oldest sample not returned yet. A
+            Series indexed by time if ``measured`` is a Series.
+        """
+        if isinstance(measured, pd.Series):
+            times = measured.index
+            if self._times is not None:
+                times = self._times.append(times)
+            self._times = times
+        meas = np.append(self._meas, np.asarray(measured, dtype=float))
+        clear = np.append(self._clear,
+                          self.alpha * np.asarray(clearsky, dtype=float))
+        flags = np.zeros(len(meas), dtype=bool)
+        flags[:len(self._flags)] = self._flags
+        nfinal = max(len(meas) - self.samples_per_window + 1, 0)
+        if nfinal:
+            clear_windows = _clear_windows(
+                meas, clear, self.samples_per_window, self.sample_interval,
+                *self._thresholds)
+            flags |= _windowed_spread(clear_windows, self.samples_per_window)
+        self._meas = meas[nfinal:]
+        self._clear = clear[nfinal:]
+        self._flags = flags[nfinal:]
+        ispandas = isinstance(measured, pd.Series)
+        return self._output(flags[:nfinal], nfinal, ispandas)
+
+    def flush(self):
+        """
+        Return the flags of samples that are not final yet.
+
+        The flags are based on the complete windows appended so far, and
+        the samples remain in the detector.
+
+        Returns
+        -------
+        clear_samples : array or Series
+            Boolean array of whether or not each remaining sample is clear.
+            A Series indexed by time if Series were appended.
+        """
+        return self._output(self._flags.copy(), 0, self._times is not None)
+
+    def _output(self, flags, nfinal, ispandas):
+        if not ispandas:
+            return flags
+        index = self._times[:len(flags)]
+        self._times = self._times[nfinal:]
+        return pd.Series(flags, index=index)
+
+
 def bird(zenith, airmass_relative, aod380, aod500, precipitable_water,
          ozone=0.3, pressure=101325., dni_extra=1364., asymmetry=0.85,
          albedo=0.2):
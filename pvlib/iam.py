@@ -8,6 +8,9 @@ IAM is typically a function of the angle of incidence (AOI) of the direct
 irradiance to the module's surface.
 """
 
+import threading
+from collections import OrderedDict
+
 import numpy as np
 import pandas as pd
 import functools
@@ -568,7 +571,75 @@ def sapm(aoi, module, upper=None):
     return iam
 
 
-def marion_diffuse(model, surface_tilt, **kwargs):
+# maximum number of tables of diffuse IAM by surface tilt held in the cache
+# used by marion_diffuse when tilt_step is given
+MARION_CACHE_MAXSIZE = 128
+
+_marion_cache = OrderedDict()
+_marion_cache_lock = threading.Lock()
+
+
+def clear_marion_cache():
+    """
+    Remove all entries from the cache of diffuse IAM tables used by
+    :py:func:`marion_diffuse` when ``tilt_step`` is given.
+    """
+    with _marion_cache_lock:
+        _marion_cache.clear()
+
+
+def _marion_cache_key(value):
+    # hashable representation of the IAM model parameters
+    if isinstance(value, (dict, pd.Series)):
+        return tuple(sorted((str(k), _marion_cache_key(v))
+                            for k, v in value.items()))
+    if isinstance(value, (list, tuple, np.ndarray)):
+        value = np.asarray(value)
+        return (value.shape, tuple(value.ravel().tolist()))
+    return value
+
+
+def _marion_table(model, iam_function, tilt_step, kwargs):
+    """
+    Get the diffuse IAM of each region at surface tilts from 0 to 180
+    degrees in steps of at most ``tilt_step`` degrees, integrating the IAM
+    function only if the table is not in the cache.
+    """
+    nsteps = int(np.ceil(180 / tilt_step))
+    try:
+        key = (model, nsteps, _marion_cache_key(kwargs))
+        hash(key)
+    except TypeError:
+        # parameters that cannot be hashed are not cached
+        key = None
+
+    if key is not None:
+        with _marion_cache_lock:
+            table = _marion_cache.get(key)
+            if table is not None:
+                _marion_cache.move_to_end(key)
+                return table
+
+    tilts = np.linspace(0, 180, nsteps + 1)
+    table = {'surface_tilt': tilts}
+    for region in ['sky', 'horizon', 'ground']:
+        # integrate a few tilts at a time to bound the memory of the
+        # solid angle grid
+        table[region] = np.concatenate([
+            marion_integrate(iam_function, chunk, region)
+            for chunk in np.array_split(tilts, -(-tilts.size // 16))])
+    for values in table.values():
+        values.flags.writeable = False
+
+    if key is not None:
+        with _marion_cache_lock:
+            _marion_cache[key] = table
+            while len(_marion_cache) > MARION_CACHE_MAXSIZE:
+                _marion_cache.popitem(last=False)
+    return table
+
+
+def marion_diffuse(model, surface_tilt, tilt_step=None, **kwargs):
     """
     Determine diffuse irradiance incidence angle modifiers using Marion's
     method of integrating over solid angle.
@@ -577,13 +648,23 @@ def marion_diffuse(model, surface_tilt, **kwargs):
     ----------
     model : str
         The IAM function to evaluate across solid angle. Must be one of
-        `'ashrae', 'physical', 'martin_ruiz', 'sapm', 'schlick'`.
+        `'ashrae', 'physical', 'martin_ruiz', 'sapm', 'schlick', 'interp'`.
 
     surface_tilt : numeric
         Surface tilt angles in decimal degrees.
         The tilt angle is defined as degrees from horizontal
         (e.g. surface facing up = 0, surface facing horizon = 90).
 
+    tilt_step : float, optional
+        If given, the IAM function is integrated at surface tilts from 0 to
+        180 degrees in steps of at most ``tilt_step`` degrees and the
+        results are linearly interpolated to ``surface_tilt``, which must
+        then be between 0 and 180 degrees. The table is cached by model,
+        parameters and step, so later calls with the same model only
+        interpolate. This is much faster when ``surface_tilt`` takes many
+        values, e.g. for single-axis trackers. See
+        :py:func:`clear_marion_cache`.
+
     **kwargs
         Extra parameters passed to the IAM function.
 
@@ -629,6 +710,7 @@ def marion_diffuse(model, surface_tilt, **kwargs):
         'sapm': sapm,
         'martin_ruiz': martin_ruiz,
         'schlick': schlick,
+        'interp': interp,
     }
 
     try:
@@ -638,8 +720,24 @@ def marion_diffuse(model, surface_tilt, **kwargs):
 
     iam_function = functools.partial(iam_model, **kwargs)
     iam = {}
+    if tilt_step is None:
+        for region in ['sky', 'horizon', 'ground']:
+            iam[region] = marion_integrate(iam_function, surface_tilt,
+                                           region)
+        return iam
+
+    if not tilt_step > 0:
+        raise ValueError('tilt_step must be positive')
+    table = _marion_table(model, iam_function, tilt_step, kwargs)
     for region in ['sky', 'horizon', 'ground']:
-        iam[region] = marion_integrate(iam_function, surface_tilt, region)
+        values = np.interp(surface_tilt, table['surface_tilt'],
+                           table[region])
+        # preserve input type
+        if np.isscalar(surface_tilt):
+            values = values.item()
+        elif isinstance(surface_tilt, pd.Series):
+            values = pd.Series(values, surface_tilt.index)
+        iam[region] = values
 
     return iam
 
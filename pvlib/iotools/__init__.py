@@ -1,36 +1,72 @@
-from pvlib.iotools.tmy import read_tmy2, read_tmy3  # noqa: F401
-from pvlib.iotools.epw import read_epw, parse_epw  # noqa: F401
-from pvlib.iotools.srml import read_srml  # noqa: F401
-from pvlib.iotools.srml import get_srml  # noqa: F401
-from pvlib.iotools.surfrad import read_surfrad  # noqa: F401
-from pvlib.iotools.midc import read_midc  # noqa: F401
-from pvlib.iotools.midc import read_midc_raw_data_from_nrel  # noqa: F401
-from pvlib.iotools.crn import read_crn  # noqa: F401
-from pvlib.iotools.solrad import read_solrad  # noqa: F401
-from pvlib.iotools.solrad import get_solrad  # noqa: F401
-from pvlib.iotools.psm3 import get_psm3  # noqa: F401
-from pvlib.iotools.psm3 import read_psm3  # noqa: F401
-from pvlib.iotools.psm3 import parse_psm3  # noqa: F401
-from pvlib.iotools.pvgis import get_pvgis_tmy, read_pvgis_tmy  # noqa: F401
-from pvlib.iotools.pvgis import read_pvgis_hourly  # noqa: F401
-from pvlib.iotools.pvgis import get_pvgis_hourly  # noqa: F401
-from pvlib.iotools.pvgis import get_pvgis_horizon  # noqa: F401
-from pvlib.iotools.bsrn import get_bsrn  # noqa: F401
-from pvlib.iotools.bsrn import read_bsrn  # noqa: F401
-from pvlib.iotools.bsrn import parse_bsrn  # noqa: F401
-from pvlib.iotools.sodapro import get_cams  # noqa: F401
-from pvlib.iotools.sodapro import read_cams  # noqa: F401
-from pvlib.iotools.sodapro import parse_cams  # noqa: F401
-from pvlib.iotools.panond import read_panond  # noqa: F401
-from pvlib.iotools.acis import get_acis_prism  # noqa: F401
-from pvlib.iotools.acis import get_acis_nrcc  # noqa: F401
-from pvlib.iotools.acis import get_acis_mpe  # noqa: F401
-from pvlib.iotools.acis import get_acis_station_data  # noqa: F401
-from pvlib.iotools.acis import get_acis_available_stations  # noqa: F401
-from pvlib.iotools.solaranywhere import get_solaranywhere  # noqa: F401
-from pvlib.iotools.solaranywhere import read_solaranywhere  # noqa: F401
-from pvlib.iotools.solcast import get_solcast_forecast  # noqa: F401
-from pvlib.iotools.solcast import get_solcast_live  # noqa: F401
-from pvlib.iotools.solcast import get_solcast_historic  # noqa: F401
-from pvlib.iotools.solcast import get_solcast_tmy  # noqa: F401
-from pvlib.iotools.solargis import get_solargis  # noqa: F401
+"""
+The ``iotools`` module contains functions to read and retrieve weather and
+irradiance data. Each function is imported from its submodule when first
+accessed, so that ``requests`` and other dependencies are only loaded when
+needed.
+"""
+
+import importlib
+
+# maps each public function to the submodule that defines it
+_functions = {
+    'read_tmy2': 'tmy',
+    'read_tmy3': 'tmy',
+    'read_tmy3_chunks': 'tmy',
+    'read_epw': 'epw',
+    'parse_epw': 'epw',
+    'read_epw_chunks': 'epw',
+    'read_srml': 'srml',
+    'get_srml': 'srml',
+    'read_surfrad': 'surfrad',
+    'read_midc': 'midc',
+    'read_midc_raw_data_from_nrel': 'midc',
+    'read_crn': 'crn',
+    'read_solrad': 'solrad',
+    'get_solrad': 'solrad',
+    'get_psm3': 'psm3',
+    'read_psm3': 'psm3',
+    'parse_psm3': 'psm3',
+    'read_psm3_chunks': 'psm3',
+    'get_pvgis_tmy': 'pvgis',
+    'read_pvgis_tmy': 'pvgis',
+    'read_pvgis_hourly': 'pvgis',
+    'get_pvgis_hourly': 'pvgis',
+    'get_pvgis_horizon': 'pvgis',
+    'get_bsrn': 'bsrn',
+    'read_bsrn': 'bsrn',
+    'parse_bsrn': 'bsrn',
+    'get_cams': 'sodapro',
+    'read_cams': 'sodapro',
+    'parse_cams': 'sodapro',
+    'read_panond': 'panond',
+    'get_acis_prism': 'acis',
+    'get_acis_nrcc': 'acis',
+    'get_acis_mpe': 'acis',
+    'get_acis_station_data': 'acis',
+    'get_acis_available_stations': 'acis',
+    'get_solaranywhere': 'solaranywhere',
+    'read_solaranywhere': 'solaranywhere',
+    'get_solcast_forecast': 'solcast',
+    'get_solcast_live': 'solcast',
+    'get_solcast_historic': 'solcast',
+    'get_solcast_tmy': 'solcast',
+    'get_solargis': 'solargis',
+}
+
+_submodules = sorted(set(_functions.values()))
+
+__all__ = list(_functions)
+
+
+def __getattr__(name):
+    if name in _functions:
+        module = importlib.import_module(f'{__name__}.{_functions[name]}')
+        globals()[name] = getattr(module, name)
+        return globals()[name]
+    if name in _submodules:
+        return importlib.import_module(f'{__name__}.{name}')
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__) | set(_submodules))
@@ -5,6 +5,20 @@ Import functions for EPW data files.
 import io
 from urllib.request import urlopen, Request
 import pandas as pd
+from pvlib import tools
+
+_EPW_COLUMNS = [
+    'year', 'month', 'day', 'hour', 'minute', 'data_source_unct',
+    'temp_air', 'temp_dew', 'relative_humidity',
+    'atmospheric_pressure', 'etr', 'etrn', 'ghi_infrared', 'ghi',
+    'dni', 'dhi', 'global_hor_illum', 'direct_normal_illum',
+    'diffuse_horizontal_illum', 'zenith_luminance',
+    'wind_direction', 'wind_speed', 'total_sky_cover',
+    'opaque_sky_cover', 'visibility', 'ceiling_height',
+    'present_weather_observation', 'present_weather_codes',
+    'precipitable_water', 'aerosol_optical_depth', 'snow_depth',
+    'days_since_last_snowfall', 'albedo',
+    'liquid_precipitation_depth', 'liquid_precipitation_quantity']
 
 
 def read_epw(filename, coerce_year=None):
@@ -270,8 +284,60 @@ def parse_epw(csvdata, coerce_year=None):
     pvlib.iotools.read_epw
     """
     # Read line with metadata
-    firstline = csvdata.readline()
+    meta = _parse_epw_meta(csvdata.readline())
 
+    # We only have to skip 6 rows instead of 7 because we have already used
+    # the realine call above.
+    data = pd.read_csv(csvdata, skiprows=6, header=0, names=_EPW_COLUMNS)
+    data.index = _epw_index(data, coerce_year, meta['TZ'])
+
+    return data, meta
+
+
+def read_epw_chunks(filename, chunksize, coerce_year=None):
+    """
+    Read an Energy Plus Weather (EPW) file in chunks of rows.
+
+    This generator reads the same local files as :py:func:`read_epw`, but
+    yields the data in DataFrames of at most ``chunksize`` rows, so that the
+    whole file is never held in memory. Concatenating the chunks gives the
+    same data as :py:func:`read_epw`.
+
+    Parameters
+    ----------
+    filename : String
+        Path to a local EPW file.
+
+    chunksize : int
+        Number of rows in each chunk. The last chunk may be shorter.
+
+    coerce_year : int, optional
+        If supplied, the year of the data will be set to this value.
+
+    Yields
+    ------
+    data : DataFrame
+        The next ``chunksize`` rows of the file. See :py:func:`read_epw`
+        for the columns.
+
+    metadata : dict
+        The site metadata available in the file. It is parsed once, and the
+        same dict is yielded with every chunk.
+
+    See Also
+    --------
+    pvlib.iotools.read_epw
+    """
+    with open(str(filename), 'r') as csvdata:
+        meta = _parse_epw_meta(csvdata.readline())
+        with pd.read_csv(csvdata, skiprows=6, header=0, names=_EPW_COLUMNS,
+                         chunksize=chunksize) as reader:
+            for data in reader:
+                data.index = _epw_index(data, coerce_year, meta['TZ'])
+                yield data, meta
+
+
+def _parse_epw_meta(firstline):
     head = ['loc', 'city', 'state-prov', 'country', 'data_type', 'WMO_code',
             'latitude', 'longitude', 'TZ', 'altitude']
     meta = dict(zip(head, firstline.rstrip('\n').split(",")))
@@ -280,33 +346,16 @@ def parse_epw(csvdata, coerce_year=None):
     meta['latitude'] = float(meta['latitude'])
     meta['longitude'] = float(meta['longitude'])
     meta['TZ'] = float(meta['TZ'])
+    return meta
 
-    colnames = ['year', 'month', 'day', 'hour', 'minute', 'data_source_unct',
-                'temp_air', 'temp_dew', 'relative_humidity',
-                'atmospheric_pressure', 'etr', 'etrn', 'ghi_infrared', 'ghi',
-                'dni', 'dhi', 'global_hor_illum', 'direct_normal_illum',
-                'diffuse_horizontal_illum', 'zenith_luminance',
-                'wind_direction', 'wind_speed', 'total_sky_cover',
-                'opaque_sky_cover', 'visibility', 'ceiling_height',
-                'present_weather_observation', 'present_weather_codes',
-                'precipitable_water', 'aerosol_optical_depth', 'snow_depth',
-                'days_since_last_snowfall', 'albedo',
-                'liquid_precipitation_depth', 'liquid_precipitation_quantity']
-
-    # We only have to skip 6 rows instead of 7 because we have already used
-    # the realine call above.
-    data = pd.read_csv(csvdata, skiprows=6, header=0, names=colnames)
 
+def _epw_index(data, coerce_year, tz):
     # Change to single year if requested
     if coerce_year is not None:
         data["year"] = coerce_year
 
-    # create index that supplies correct date and time zone information
-    dts = data[['month', 'day']].astype(str).apply(lambda x: x.str.zfill(2))
-    hrs = (data['hour'] - 1).astype(str).str.zfill(2)
-    dtscat = data['year'].astype(str) + dts['month'] + dts['day'] + hrs
-    idx = pd.to_datetime(dtscat, format='%Y%m%d%H')
-    idx = idx.dt.tz_localize(int(meta['TZ'] * 3600))
-    data.index = idx
-
-    return data, meta
+    # create index that supplies correct date and time zone information.
+    # EPW hours are 1 to 24, for the hour ending at that time
+    idx = tools._components_to_datetimeindex(
+        data['year'], data['month'], data['day'], data['hour'] - 1)
+    return idx.tz_localize(int(tz * 3600))
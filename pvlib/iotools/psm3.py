@@ -8,6 +8,7 @@ import requests
 import pandas as pd
 from json import JSONDecodeError
 import warnings
+from pvlib import tools
 from pvlib._deprecation import pvlibDeprecationWarning
 
 NSRDB_API_BASE = "https://developer.nrel.gov"
@@ -316,6 +317,18 @@ def parse_psm3(fbuf, map_variables=True):
     .. [2] `Standard Time Series Data File Format
        <https://web.archive.org/web/20170207203107/https://sam.nrel.gov/sites/default/files/content/documents/pdf/wfcsv.pdf>`_
     """
+    metadata, columns, dtypes = _parse_psm3_header(fbuf, map_variables)
+    data = pd.read_csv(
+        fbuf, header=None, names=columns, usecols=columns, dtype=dtypes,
+        delimiter=',', lineterminator='\n')  # skip carriage returns \r
+    data.index = _psm3_index(data, metadata)
+    if map_variables:
+        data = data.rename(columns=VARIABLE_MAP)
+
+    return data, metadata
+
+
+def _parse_psm3_header(fbuf, map_variables):
     # The first 2 lines of the response are headers with metadata
     metadata_fields = fbuf.readline().split(',')
     metadata_fields[-1] = metadata_fields[-1].strip()  # strip trailing newline
@@ -328,6 +341,10 @@ def parse_psm3(fbuf, map_variables=True):
     metadata['Latitude'] = float(metadata['Latitude'])
     metadata['Longitude'] = float(metadata['Longitude'])
     metadata['Elevation'] = int(metadata['Elevation'])
+    if map_variables:
+        metadata['latitude'] = metadata.pop('Latitude')
+        metadata['longitude'] = metadata.pop('Longitude')
+        metadata['altitude'] = metadata.pop('Elevation')
     # get the column names so we can set the dtypes
     columns = fbuf.readline().split(',')
     columns[-1] = columns[-1].strip()  # strip trailing newline
@@ -338,23 +355,17 @@ def parse_psm3(fbuf, map_variables=True):
     dtypes.update(Year=int, Month=int, Day=int, Hour=int, Minute=int)
     dtypes['Cloud Type'] = int
     dtypes['Fill Flag'] = int
-    data = pd.read_csv(
-        fbuf, header=None, names=columns, usecols=columns, dtype=dtypes,
-        delimiter=',', lineterminator='\n')  # skip carriage returns \r
+    return metadata, columns, dtypes
+
+
+def _psm3_index(data, metadata):
     # the response 1st 5 columns are a date vector, convert to datetime
-    dtidx = pd.to_datetime(
-        data[['Year', 'Month', 'Day', 'Hour', 'Minute']])
+    dtidx = tools._components_to_datetimeindex(
+        data['Year'], data['Month'], data['Day'], data['Hour'],
+        data['Minute'])
     # in USA all timezones are integers
     tz = 'Etc/GMT%+d' % -metadata['Time Zone']
-    data.index = pd.DatetimeIndex(dtidx).tz_localize(tz)
-
-    if map_variables:
-        data = data.rename(columns=VARIABLE_MAP)
-        metadata['latitude'] = metadata.pop('Latitude')
-        metadata['longitude'] = metadata.pop('Longitude')
-        metadata['altitude'] = metadata.pop('Elevation')
-
-    return data, metadata
+    return dtidx.tz_localize(tz)
 
 
 def read_psm3(filename, map_variables=True):
@@ -397,3 +408,49 @@ def read_psm3(filename, map_variables=True):
     with open(str(filename), 'r') as fbuf:
         content = parse_psm3(fbuf, map_variables)
     return content
+
+
+def read_psm3_chunks(filename, chunksize, map_variables=True):
+    """
+    Read an NSRDB PSM3 weather file (formatted as SAM CSV) in chunks of
+    rows.
+
+    This generator reads the same files as :py:func:`read_psm3`, but yields
+    the data in DataFrames of at most ``chunksize`` rows, so that memory use
+    stays bounded for large files such as multi-year 5-minute data.
+    Concatenating the chunks gives the same data as :py:func:`read_psm3`.
+
+    Parameters
+    ----------
+    filename: str
+        Filename of a file containing data to read.
+    chunksize: int
+        Number of rows in each chunk. The last chunk may be shorter.
+    map_variables: bool, default True
+        When true, renames columns of the Dataframe to pvlib variable names
+        where applicable. See variable :const:`VARIABLE_MAP`.
+
+    Yields
+    ------
+    data : pandas.DataFrame
+        The next ``chunksize`` rows of timeseries data from NREL PSM3
+    metadata : dict
+        metadata from NREL PSM3 about the record, see
+        :func:`pvlib.iotools.parse_psm3` for fields. It is parsed once, and
+        the same dict is yielded with every chunk.
+
+    See Also
+    --------
+    pvlib.iotools.read_psm3, pvlib.iotools.parse_psm3
+    """
+    with open(str(filename), 'r') as fbuf:
+        metadata, columns, dtypes = _parse_psm3_header(fbuf, map_variables)
+        with pd.read_csv(
+                fbuf, header=None, names=columns, usecols=columns,
+                dtype=dtypes, delimiter=',', lineterminator='\n',
+                chunksize=chunksize) as reader:
+            for data in reader:
+                data.index = _psm3_index(data, metadata)
+                if map_variables:
+                    data = data.rename(columns=VARIABLE_MAP)
+                yield data, metadata
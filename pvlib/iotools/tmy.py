@@ -2,8 +2,10 @@
 
 import datetime
 import re
+import numpy as np
 import pandas as pd
 import warnings
+from pvlib import tools
 from pvlib._deprecation import pvlibDeprecationWarning
 
 # Dictionary mapping TMY3 names to pvlib names
@@ -191,48 +193,14 @@ def read_tmy3(filename, coerce_year=None, map_variables=None, recolumn=None,
     .. [3] `SolarAnywhere file formats
        <https://www.solaranywhere.com/support/historical-data/file-formats/>`_
     """  # noqa: E501
-    head = ['USAF', 'Name', 'State', 'TZ', 'latitude', 'longitude', 'altitude']
-
     with open(str(filename), 'r', encoding=encoding) as fbuf:
         # header information on the 1st line (0 indexing)
-        firstline = fbuf.readline()
+        meta = _parse_tmy3_meta(fbuf.readline())
         # use pandas to read the csv file buffer
         # header is actually the second line, but tell pandas to look for
         data = pd.read_csv(fbuf, header=0)
 
-    meta = dict(zip(head, firstline.rstrip('\n').split(",")))
-    # convert metadata strings to numeric types
-    meta['altitude'] = float(meta['altitude'])
-    meta['latitude'] = float(meta['latitude'])
-    meta['longitude'] = float(meta['longitude'])
-    meta['TZ'] = float(meta['TZ'])
-    meta['USAF'] = int(meta['USAF'])
-
-    # get the date column as a pd.Series of numpy datetime64
-    data_ymd = pd.to_datetime(data['Date (MM/DD/YYYY)'], format='%m/%d/%Y')
-    # extract minutes
-    minutes = data['Time (HH:MM)'].str.split(':').str[1].astype(int)
-    # shift the time column so that midnite is 00:00 instead of 24:00
-    shifted_hour = data['Time (HH:MM)'].str.split(':').str[0].astype(int) % 24
-    # shift the dates at midnight (24:00) so they correspond to the next day.
-    # If midnight is specified as 00:00 do not shift date.
-    data_ymd[data['Time (HH:MM)'].str[:2] == '24'] += datetime.timedelta(days=1)  # noqa: E501
-    # NOTE: as of pandas>=0.24 the pd.Series.array has a month attribute, but
-    # in pandas-0.18.1, only DatetimeIndex has month, but indices are immutable
-    # so we need to continue to work with the panda series of dates `data_ymd`
-    data_index = pd.DatetimeIndex(data_ymd)
-    # use indices to check for a leap day and advance it to March 1st
-    leapday = (data_index.month == 2) & (data_index.day == 29)
-    data_ymd[leapday] += datetime.timedelta(days=1)
-    # shifted_hour is a pd.Series, so use pd.to_timedelta to get a pd.Series of
-    # timedeltas
-    if coerce_year is not None:
-        data_ymd = data_ymd.map(lambda dt: dt.replace(year=coerce_year))
-        data_ymd.iloc[-1] = data_ymd.iloc[-1].replace(year=coerce_year+1)
-    # NOTE: as of pvlib-0.6.3, min req is pandas-0.18.1, so pd.to_timedelta
-    # unit must be in (D,h,m,s,ms,us,ns), but pandas>=0.24 allows unit='hour'
-    data.index = data_ymd + pd.to_timedelta(shifted_hour, unit='h') \
-        + pd.to_timedelta(minutes, unit='min')
+    data.index = _tmy3_index(data, coerce_year)
     # shouldnt' specify both recolumn and map_variables
     if recolumn is not None and map_variables is not None:
         msg = "`map_variables` and `recolumn` cannot both be specified"
@@ -259,6 +227,97 @@ def read_tmy3(filename, coerce_year=None, map_variables=None, recolumn=None,
     return data, meta
 
 
+def read_tmy3_chunks(filename, chunksize, coerce_year=None,
+                     map_variables=True, encoding=None):
+    """
+    Read a TMY3 file in chunks of rows.
+
+    This generator reads the same files as :py:func:`read_tmy3`, but yields
+    the data in DataFrames of at most ``chunksize`` rows, so that the whole
+    file is never held in memory. Concatenating the chunks gives the same
+    data as :py:func:`read_tmy3`.
+
+    Parameters
+    ----------
+    filename : str
+        A relative file path or absolute file path.
+    chunksize : int
+        Number of rows in each chunk. The last chunk may be shorter.
+    coerce_year : int, optional
+        If supplied, the year of the index will be set to ``coerce_year``,
+        except for the last index value of the file which will be set to the
+        *next* year, as in :py:func:`read_tmy3`.
+    map_variables : bool, default True
+        When True, renames columns of the DataFrame to pvlib variable names
+        where applicable. See variable :const:`VARIABLE_MAP`.
+    encoding : str, optional
+        Encoding of the file, see :py:func:`read_tmy3`.
+
+    Yields
+    ------
+    data : DataFrame
+        The next ``chunksize`` rows of the file, with a timezone aware
+        index. See :py:func:`read_tmy3` for the columns.
+    metadata : dict
+        The site metadata available in the file. It is parsed once, and the
+        same dict is yielded with every chunk.
+
+    See Also
+    --------
+    read_tmy3
+    """
+    with open(str(filename), 'r', encoding=encoding) as fbuf:
+        meta = _parse_tmy3_meta(fbuf.readline())
+        with pd.read_csv(fbuf, header=0, chunksize=chunksize) as reader:
+            # hold back each chunk until the next one is read, because
+            # coerce_year treats the last row of the file differently
+            data = next(reader, None)
+            while data is not None:
+                next_data = next(reader, None)
+                data.index = _tmy3_index(data, coerce_year,
+                                         last=next_data is None)
+                if map_variables:
+                    data = data.rename(columns=VARIABLE_MAP)
+                yield data.tz_localize(int(meta['TZ'] * 3600)), meta
+                data = next_data
+
+
+def _parse_tmy3_meta(firstline):
+    head = ['USAF', 'Name', 'State', 'TZ', 'latitude', 'longitude', 'altitude']
+    meta = dict(zip(head, firstline.rstrip('\n').split(",")))
+    # convert metadata strings to numeric types
+    meta['altitude'] = float(meta['altitude'])
+    meta['latitude'] = float(meta['latitude'])
+    meta['longitude'] = float(meta['longitude'])
+    meta['TZ'] = float(meta['TZ'])
+    meta['USAF'] = int(meta['USAF'])
+    return meta
+
+
+def _tmy3_index(data, coerce_year=None, last=True):
+    """
+    Build the index of TMY3 data from its date and time columns, shifting
+    leap days to March 1st. If ``last`` is True, the last row is the end of
+    the file.
+    """
+    date = data['Date (MM/DD/YYYY)']
+    mdy = date.str.split('/', expand=True).astype(int)
+    hm = data['Time (HH:MM)'].str.split(':', expand=True).astype(int)
+    # midnight given as 24:00 (NREL format) carries over to the next day,
+    # and as 00:00 (SolarAnywhere format) stays on the same day
+    index = tools._components_to_datetimeindex(mdy[2], mdy[0], mdy[1],
+                                               hm[0], hm[1])
+    leapday = (index.month == 2) & (index.day == 29)
+    index = index + pd.to_timedelta(leapday.astype(int), unit='D')
+    if coerce_year is not None:
+        year = np.full(len(index), coerce_year)
+        if last and len(index):
+            year[-1] += 1
+        index = tools._components_to_datetimeindex(
+            year, index.month, index.day, index.hour, index.minute)
+    return index
+
+
 def _recolumn(tmy3_dataframe):
     """
     Rename the columns of the TMY3 DataFrame.
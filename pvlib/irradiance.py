@@ -5,15 +5,15 @@ irradiance, and total irradiance under various conditions.
 """
 
 import datetime
+import math
 from collections import OrderedDict
 from functools import partial
 
 import numpy as np
 import pandas as pd
 from scipy.interpolate import splev
-from scipy.optimize import bisect
 
-from pvlib import atmosphere, solarposition, tools
+from pvlib import _numba, atmosphere, solarposition, tools
 import pvlib  # used to avoid dni name collision in complete_irradiance
 
 from pvlib._deprecation import pvlibDeprecationWarning, renamed_kwarg_warning
@@ -263,7 +263,8 @@ def get_total_irradiance(surface_tilt, surface_azimuth,
                          dni, ghi, dhi, dni_extra=None, airmass=None,
                          albedo=0.25, surface_type=None,
                          model='isotropic',
-                         model_perez='allsitescomposite1990'):
+                         model_perez='allsitescomposite1990',
+                         return_components=False):
     r"""
     Determine total in-plane irradiance and its beam, sky diffuse and ground
     reflected components, using the specified sky diffuse irradiance model.
@@ -312,12 +313,18 @@ def get_total_irradiance(surface_tilt, surface_azimuth,
         ``'perez-driesse'``.
     model_perez : str, default 'allsitescomposite1990'
         Used only if ``model='perez'``. See :py:func:`~pvlib.irradiance.perez`.
+    return_components : bool, default False
+        If True, also return the isotropic, circumsolar and horizon
+        components of the sky diffuse irradiance, see
+        :py:func:`~pvlib.irradiance.get_sky_diffuse`.
 
     Returns
     -------
     total_irrad : OrderedDict or DataFrame
         Contains keys/columns ``'poa_global', 'poa_direct', 'poa_diffuse',
-        'poa_sky_diffuse', 'poa_ground_diffuse'``.
+        'poa_sky_diffuse', 'poa_ground_diffuse'``, and if
+        ``return_components=True``, ``'poa_isotropic', 'poa_circumsolar',
+        'poa_horizon'``.
 
     Notes
     -----
@@ -333,12 +340,18 @@ def get_total_irradiance(surface_tilt, surface_azimuth,
     poa_sky_diffuse = get_sky_diffuse(
         surface_tilt, surface_azimuth, solar_zenith, solar_azimuth,
         dni, ghi, dhi, dni_extra=dni_extra, airmass=airmass, model=model,
-        model_perez=model_perez)
+        model_perez=model_perez, return_components=return_components)
+    if return_components:
+        sky_components = poa_sky_diffuse
+        poa_sky_diffuse = sky_components['sky_diffuse']
 
     poa_ground_diffuse = get_ground_diffuse(surface_tilt, ghi, albedo,
                                             surface_type)
     aoi_ = aoi(surface_tilt, surface_azimuth, solar_zenith, solar_azimuth)
     irrads = poa_components(aoi_, dni, poa_sky_diffuse, poa_ground_diffuse)
+    if return_components:
+        for key in ['isotropic', 'circumsolar', 'horizon']:
+            irrads['poa_' + key] = sky_components[key]
     return irrads
 
 
@@ -346,7 +359,8 @@ def get_sky_diffuse(surface_tilt, surface_azimuth,
                     solar_zenith, solar_azimuth,
                     dni, ghi, dhi, dni_extra=None, airmass=None,
                     model='isotropic',
-                    model_perez='allsitescomposite1990'):
+                    model_perez='allsitescomposite1990',
+                    return_components=False):
     r"""
     Determine in-plane sky diffuse irradiance component
     using the specified sky diffuse irradiance model.
@@ -386,17 +400,27 @@ def get_sky_diffuse(surface_tilt, surface_azimuth,
         ``'perez-driesse'``.
     model_perez : str, default 'allsitescomposite1990'
         Used only if ``model='perez'``. See :py:func:`~pvlib.irradiance.perez`.
+    return_components : bool, default False
+        If True, return the isotropic, circumsolar and horizon components of
+        the sky diffuse irradiance. Only available for models
+        ``'isotropic'``, ``'haydavies'``, ``'perez'`` and
+        ``'perez-driesse'``.
 
     Returns
     -------
-    poa_sky_diffuse : numeric
-        Sky diffuse irradiance in the plane of array. [W/m2]
+    poa_sky_diffuse : numeric, OrderedDict or DataFrame
+        Sky diffuse irradiance in the plane of array. [W/m2] If
+        ``return_components=True``, keys/columns ``'sky_diffuse'``,
+        ``'isotropic'``, ``'circumsolar'`` and ``'horizon'``.
 
     Raises
     ------
     ValueError
         If model is one of ``'haydavies'``, ``'reindl'``, ``'perez'``,  or
         ``'perez_driesse'`` and ``dni_extra`` is not specified.
+    ValueError
+        If ``return_components=True`` and model is one of ``'klucher'``,
+        ``'reindl'`` or ``'king'``.
 
     Notes
     -----
@@ -419,15 +443,21 @@ def get_sky_diffuse(surface_tilt, surface_azimuth,
     if dni_extra is None and model in {'haydavies', 'reindl',
                                        'perez', 'perez-driesse'}:
         raise ValueError(f'dni_extra is required for model {model}')
+    if return_components and model in {'klucher', 'reindl', 'king'}:
+        raise ValueError(f'return_components is not available for model '
+                         f'{model}')
 
     if model == 'isotropic':
         sky = isotropic(surface_tilt, dhi)
+        if return_components:
+            sky = _isotropic_components(sky)
     elif model == 'klucher':
         sky = klucher(surface_tilt, surface_azimuth, dhi, ghi,
                       solar_zenith, solar_azimuth)
     elif model == 'haydavies':
         sky = haydavies(surface_tilt, surface_azimuth, dhi, dni, dni_extra,
-                        solar_zenith, solar_azimuth)
+                        solar_zenith, solar_azimuth,
+                        return_components=return_components)
     elif model == 'reindl':
         sky = reindl(surface_tilt, surface_azimuth, dhi, dni, ghi, dni_extra,
                      solar_zenith, solar_azimuth)
@@ -438,17 +468,32 @@ def get_sky_diffuse(surface_tilt, surface_azimuth,
             airmass = atmosphere.get_relative_airmass(solar_zenith)
         sky = perez(surface_tilt, surface_azimuth, dhi, dni, dni_extra,
                     solar_zenith, solar_azimuth, airmass,
-                    model=model_perez)
+                    model=model_perez, return_components=return_components)
     elif model == 'perez-driesse':
         # perez_driesse will calculate its own airmass if needed
         sky = perez_driesse(surface_tilt, surface_azimuth, dhi, dni, dni_extra,
-                            solar_zenith, solar_azimuth, airmass)
+                            solar_zenith, solar_azimuth, airmass,
+                            return_components=return_components)
     else:
         raise ValueError(f'invalid model selection {model}')
 
     return sky
 
 
+def _isotropic_components(sky_diffuse):
+    """Sky diffuse components of the isotropic model, in the format of
+    :py:func:`haydavies` with ``return_components=True``."""
+    diffuse_components = OrderedDict()
+    diffuse_components['sky_diffuse'] = sky_diffuse
+    diffuse_components['isotropic'] = sky_diffuse
+    diffuse_components['circumsolar'] = np.where(
+        np.isnan(sky_diffuse), np.nan, 0.)
+    diffuse_components['horizon'] = diffuse_components['circumsolar']
+    if isinstance(sky_diffuse, pd.Series):
+        diffuse_components = pd.DataFrame(diffuse_components)
+    return diffuse_components
+
+
 def poa_components(aoi, dni, poa_sky_diffuse, poa_ground_diffuse):
     r'''
     Determine in-plane irradiance components.
@@ -1028,7 +1073,7 @@ def king(surface_tilt, dhi, ghi, solar_zenith):
 
 def perez(surface_tilt, surface_azimuth, dhi, dni, dni_extra,
           solar_zenith, solar_azimuth, airmass,
-          model='allsitescomposite1990', return_components=False):
+          model='allsitescomposite1990', return_components=False, out=None):
     '''
     Determine diffuse irradiance from the sky on a tilted surface using
     one of the Perez models.
@@ -1106,6 +1151,11 @@ def perez(surface_tilt, surface_azimuth, dhi, dni, dni_extra,
         Flag used to decide whether to return the calculated diffuse components
         or not.
 
+    out : numpy.ndarray, optional
+        Array in which to place `sky_diffuse`. Must be a C-contiguous float64
+        array with the broadcast shape of the inputs. If the inputs include
+        a Series, the returned Series shares memory with `out`.
+
     Returns
     --------
     numeric, OrderedDict, or DataFrame
@@ -1141,88 +1191,260 @@ def perez(surface_tilt, surface_azimuth, dhi, dni, dni_extra,
 
     .. [4] Perez, R. et. al 1988. "The Development and Verification of the
        Perez Diffuse Radiation Model". SAND88-7030
+
+    Notes
+    -----
+    The calculation is done in a single pass over the inputs that reuses
+    its intermediate arrays. If the environment variable
+    ``PVLIB_USE_NUMBA`` is set to a value other than ``'0'`` when
+    :py:mod:`pvlib.irradiance` is first imported and numba is installed, the
+    pass is compiled with numba on the first call and run in parallel;
+    results can then differ from the numpy calculation by a few units in the
+    last place.
     '''
 
+    inputs = (surface_tilt, surface_azimuth, dhi, dni, dni_extra,
+              solar_zenith, solar_azimuth, airmass)
+    shape = np.broadcast(*[np.empty(np.shape(x)) for x in inputs]).shape
+    if out is None:
+        out = np.empty(shape)
+    elif (out.shape != shape or out.dtype != np.float64
+            or not out.flags.c_contiguous):
+        raise ValueError('out must be a C-contiguous float64 array with '
+                         f'shape {shape}')
+
+    # The various possible sets of Perez coefficients are contained
+    # in a subfunction to clean up the code.
+    F1c, F2c = _get_perez_coefficients(model)
+
+    sky_diffuse = out.reshape(-1)
+    if return_components:
+        components = np.empty((3, sky_diffuse.size))
+    else:
+        components = np.empty((3, 0))
+    _get_perez_kernel()(*[_perez_ravel(x, shape) for x in inputs], F1c,
+                        F2c, sky_diffuse, *components)
+
+    # we've preserved the input type until now, so don't ruin it!
+    index = next((x.index for x in inputs if isinstance(x, pd.Series)),
+                 None)
+    if index is not None:
+        sky_diffuse = pd.Series(out, index=index)
+    else:
+        sky_diffuse = out
+
+    if return_components:
+        diffuse_components = OrderedDict()
+        diffuse_components['sky_diffuse'] = sky_diffuse
+        for key, component in zip(['isotropic', 'circumsolar', 'horizon'],
+                                  components):
+            diffuse_components[key] = component.reshape(shape)
+        if index is not None:
+            diffuse_components = pd.DataFrame(diffuse_components,
+                                              index=index)
+        else:
+            diffuse_components = dict(diffuse_components)
+        return diffuse_components
+    else:
+        return sky_diffuse
+
+
+def _perez_ravel(x, shape):
+    """
+    Flatten an input of :py:func:`perez` for the Perez kernel. Inputs with
+    one element are kept at size one, all other inputs are broadcast to
+    ``shape``; arrays that already have ``shape`` are not copied.
+    """
+    x = np.asarray(x, dtype=np.float64)
+    if x.size == 1:
+        return x.reshape(1)
+    return np.ascontiguousarray(np.broadcast_to(x, shape)).reshape(-1)
+
+
+def _perez_numpy(surface_tilt, surface_azimuth, dhi, dni, dni_extra,
+                 solar_zenith, solar_azimuth, airmass, F1c, F2c,
+                 sky_diffuse, isotropic, circumsolar, horizon):
+    """
+    Perez sky diffuse irradiance calculated with numpy.
+
+    All inputs are 1-D arrays with either one element or the length of
+    ``sky_diffuse``. The sky diffuse irradiance is placed in
+    ``sky_diffuse`` and, unless they are empty, the components are placed
+    in ``isotropic``, ``circumsolar`` and ``horizon``. Temporary arrays are
+    reused with in-place operations where possible.
+    """
     kappa = 1.041  # for solar_zenith in radians
+    n = sky_diffuse.size
     z = np.radians(solar_zenith)  # convert to radians
+    kz3 = z ** 3
+    kz3 *= kappa
 
     # delta is the sky's "brightness"
-    delta = dhi * airmass / dni_extra
+    delta = np.multiply(dhi, airmass, out=np.empty(n))
+    delta /= dni_extra
 
     # epsilon is the sky's "clearness"
+    eps = np.add(dhi, dni, out=np.empty(n))
     with np.errstate(invalid='ignore'):
-        eps = ((dhi + dni) / dhi + kappa * (z ** 3)) / (1 + kappa * (z ** 3))
-
-    # numpy indexing below will not work with a Series
-    if isinstance(eps, pd.Series):
-        eps = eps.values
+        eps /= dhi
+    eps += kz3
+    kz3 += 1
+    eps /= kz3
 
     # Perez et al define clearness bins according to the following
     # rules. 1 = overcast ... 8 = clear (these names really only make
     # sense for small zenith angles, but...) these values will
     # eventually be used as indicies for coeffecient look ups
-    ebin = np.digitize(eps, (0., 1.065, 1.23, 1.5, 1.95, 2.8, 4.5, 6.2))
-    ebin = np.array(ebin)  # GH 642
-    ebin[np.isnan(eps)] = 0
-
-    # correct for 0 indexing in coeffecient lookup
-    # later, ebin = -1 will yield nan coefficients
+    # eps is compared with each bin edge, which is faster than np.digitize
+    # for so few edges. nan eps matches no edge.
+    ebin = np.zeros(n, dtype=np.intp)
+    for edge in (0., 1.065, 1.23, 1.5, 1.95, 2.8, 4.5, 6.2):
+        ebin += eps >= edge
+
+    # correct for 0 indexing in coeffecient lookup. invalid eps (ebin = -1)
+    # is mapped to an appended column of nan coefficients
     ebin -= 1
+    ebin[ebin < 0] = len(F1c)
+    nans = np.array([[np.nan], [np.nan], [np.nan]])
+    F1c = np.concatenate((F1c.T, nans), axis=1)
+    F2c = np.concatenate((F2c.T, nans), axis=1)
 
-    # The various possible sets of Perez coefficients are contained
-    # in a subfunction to clean up the code.
-    F1c, F2c = _get_perez_coefficients(model)
+    F1 = np.multiply(F1c[1].take(ebin), delta)
+    F1 += F1c[0].take(ebin)
+    F1 += np.multiply(F1c[2].take(ebin), z, out=eps)
+    np.maximum(F1, 0, out=F1)
 
-    # results in invalid eps (ebin = -1) being mapped to nans
-    nans = np.array([np.nan, np.nan, np.nan])
-    F1c = np.vstack((F1c, nans))
-    F2c = np.vstack((F2c, nans))
+    F2 = np.multiply(F2c[1].take(ebin), delta, out=delta)
+    F2 += F2c[0].take(ebin)
+    F2 += np.multiply(F2c[2].take(ebin), z, out=eps)
 
-    F1 = (F1c[ebin, 0] + F1c[ebin, 1] * delta + F1c[ebin, 2] * z)
-    F1 = np.maximum(F1, 0)
+    cos_tilt = tools.cosd(surface_tilt)
+    sin_tilt = tools.sind(surface_tilt)
+    cos_zenith = np.cos(z)
 
-    F2 = (F2c[ebin, 0] + F2c[ebin, 1] * delta + F2c[ebin, 2] * z)
+    # aoi_projection, clipped to [0, 1]
+    A = np.multiply(sin_tilt, np.sin(z), out=np.empty(n))
+    A *= tools.cosd(solar_azimuth - surface_azimuth)
+    A += np.multiply(cos_tilt, cos_zenith, out=eps)
+    np.clip(A, 0, 1, out=A)
 
-    A = aoi_projection(surface_tilt, surface_azimuth,
-                       solar_zenith, solar_azimuth)
-    A = np.maximum(A, 0)
-
-    B = tools.cosd(solar_zenith)
-    B = np.maximum(B, tools.cosd(85))
+    B = np.maximum(cos_zenith, tools.cosd(85))
 
     # Calculate Diffuse POA from sky dome
-    term1 = 0.5 * (1 - F1) * (1 + tools.cosd(surface_tilt))
-    term2 = F1 * A / B
-    term3 = F2 * tools.sind(surface_tilt)
-
-    sky_diffuse = np.maximum(dhi * (term1 + term2 + term3), 0)
-
-    # we've preserved the input type until now, so don't ruin it!
-    if isinstance(sky_diffuse, pd.Series):
-        sky_diffuse[np.isnan(airmass)] = 0
-    else:
-        sky_diffuse = np.where(np.isnan(airmass), 0, sky_diffuse)
-
-    if return_components:
-        diffuse_components = OrderedDict()
-        diffuse_components['sky_diffuse'] = sky_diffuse
-
-        # Calculate the different components
-        diffuse_components['isotropic'] = dhi * term1
-        diffuse_components['circumsolar'] = dhi * term2
-        diffuse_components['horizon'] = dhi * term3
-
+    term1 = np.subtract(1, F1, out=eps)
+    term1 *= 0.5
+    term1 *= 1 + cos_tilt
+    term2 = np.multiply(F1, A, out=F1)
+    term2 /= B
+    term3 = np.multiply(F2, sin_tilt, out=F2)
+
+    np.add(term1, term2, out=sky_diffuse)
+    sky_diffuse += term3
+    sky_diffuse *= dhi
+    np.maximum(sky_diffuse, 0, out=sky_diffuse)
+    sky_diffuse[np.broadcast_to(np.isnan(airmass), (n,))] = 0
+
+    if isotropic.size:
         # Set values of components to 0 when sky_diffuse is 0
         mask = sky_diffuse == 0
-        if isinstance(sky_diffuse, pd.Series):
-            diffuse_components = pd.DataFrame(diffuse_components)
-            diffuse_components.loc[mask] = 0
+        for component, term in zip((isotropic, circumsolar, horizon),
+                                   (term1, term2, term3)):
+            np.multiply(dhi, term, out=component)
+            component[mask] = 0
+
+
+def _perez_loop(surface_tilt, surface_azimuth, dhi, dni, dni_extra,
+                solar_zenith, solar_azimuth, airmass, F1c, F2c,
+                sky_diffuse, isotropic, circumsolar, horizon):
+    """
+    Perez sky diffuse irradiance calculated element by element in a single
+    pass. Same arguments as :py:func:`_perez_numpy`. Compiled with numba
+    by :py:func:`_get_perez_kernel`.
+    """
+    kappa = 1.041
+    bins = (0., 1.065, 1.23, 1.5, 1.95, 2.8, 4.5, 6.2)
+    cos85 = math.cos(math.radians(85))
+    components = isotropic.size > 0
+    # inputs with one element are read at index 0 for every element
+    s_tilt = 1 if surface_tilt.size > 1 else 0
+    s_azimuth = 1 if surface_azimuth.size > 1 else 0
+    s_dhi = 1 if dhi.size > 1 else 0
+    s_dni = 1 if dni.size > 1 else 0
+    s_extra = 1 if dni_extra.size > 1 else 0
+    s_zenith = 1 if solar_zenith.size > 1 else 0
+    s_sun_azimuth = 1 if solar_azimuth.size > 1 else 0
+    s_airmass = 1 if airmass.size > 1 else 0
+    for i in _numba.prange(sky_diffuse.size):
+        tilt = surface_tilt[i * s_tilt]
+        azimuth = surface_azimuth[i * s_azimuth]
+        diffuse = dhi[i * s_dhi]
+        direct = dni[i * s_dni]
+        extra = dni_extra[i * s_extra]
+        zenith = solar_zenith[i * s_zenith]
+        sun_azimuth = solar_azimuth[i * s_sun_azimuth]
+        am = airmass[i * s_airmass]
+
+        z = math.radians(zenith)
+        delta = diffuse * am / extra
+        eps = (((diffuse + direct) / diffuse + kappa * (z ** 3))
+               / (1 + kappa * (z ** 3)))
+        ebin = -1
+        for edge in bins:
+            if eps >= edge:
+                ebin += 1
+        if ebin < 0:
+            F1 = np.nan
+            F2 = np.nan
         else:
-            diffuse_components = {k: np.where(mask, 0, v) for k, v in
-                                  diffuse_components.items()}
-        return diffuse_components
-    else:
-        return sky_diffuse
+            F1 = max(F1c[ebin, 0] + F1c[ebin, 1] * delta + F1c[ebin, 2] * z,
+                     0.)
+            F2 = F2c[ebin, 0] + F2c[ebin, 1] * delta + F2c[ebin, 2] * z
+
+        cos_tilt = math.cos(math.radians(tilt))
+        A = (cos_tilt * math.cos(z) + math.sin(math.radians(tilt))
+             * math.sin(z) * math.cos(math.radians(sun_azimuth - azimuth)))
+        A = min(max(A, 0.), 1.)
+        B = max(math.cos(z), cos85)
+
+        term1 = 0.5 * (1 - F1) * (1 + cos_tilt)
+        term2 = F1 * A / B
+        term3 = F2 * math.sin(math.radians(tilt))
+        total = diffuse * (term1 + term2 + term3)
+        if math.isnan(am):
+            total = 0.
+        elif total < 0:
+            total = 0.
+        sky_diffuse[i] = total
+
+        if components:
+            if total == 0:
+                isotropic[i] = 0.
+                circumsolar[i] = 0.
+                horizon[i] = 0.
+            else:
+                isotropic[i] = diffuse * term1
+                circumsolar[i] = diffuse * term2
+                horizon[i] = diffuse * term3
+
+
+# compiled _perez_loop, see _get_perez_kernel
+_perez_kernel = None
+
+
+def _get_perez_kernel():
+    """
+    Return the function calculating the Perez model: :py:func:`_perez_loop`
+    compiled with numba if ``PVLIB_USE_NUMBA`` is set, else
+    :py:func:`_perez_numpy`. The loop is compiled on first use, so that
+    importing this module does not import numba.
+    """
+    global _perez_kernel
+    if not _numba.USE_NUMBA:
+        return _perez_numpy
+    if _perez_kernel is None:
+        _perez_kernel = _numba.jcompile(nopython=True, parallel=True,
+                                        error_model='numpy')(_perez_loop)
+    return _perez_kernel
 
 
 def _calc_delta(dhi, dni_extra, solar_zenith, airmass=None):
@@ -1473,58 +1695,6 @@ def _poa_from_ghi(surface_tilt, surface_azimuth,
     return irrads['poa_global']
 
 
-def _ghi_from_poa(surface_tilt, surface_azimuth,
-                  solar_zenith, solar_azimuth,
-                  poa_global,
-                  dni_extra, airmass, albedo,
-                  xtol=0.01):
-    '''
-    Reverse transposition function that uses the scalar bisection from scipy.
-
-    Helper function for ghi_from_poa_driesse_2023.
-    '''
-    # Contributed by Anton Driesse (@adriesse), PV Performance Labs. Nov., 2023
-
-    # propagate nans and zeros quickly
-    if np.isnan(poa_global):
-        return np.nan, False, 0
-    if poa_global <= 0:
-        return 0.0, True, 0
-
-    # function whose root needs to be found
-    def poa_error(ghi):
-        poa_hat = _poa_from_ghi(surface_tilt, surface_azimuth,
-                                solar_zenith, solar_azimuth,
-                                ghi,
-                                dni_extra, airmass, albedo)
-        return poa_hat - poa_global
-
-    # calculate an upper bound for ghi using clearness index 1.25
-    ghi_clear = dni_extra * tools.cosd(solar_zenith)
-    ghi_high = np.maximum(10, 1.25 * ghi_clear)
-
-    try:
-        result = bisect(poa_error,
-                        a=0,
-                        b=ghi_high,
-                        xtol=xtol,
-                        maxiter=25,
-                        full_output=True,
-                        disp=False,
-                        )
-    except ValueError:
-        # this occurs when poa_error has the same sign at both end points
-        ghi = np.nan
-        conv = False
-        niter = -1
-    else:
-        ghi = result[0]
-        conv = result[1].converged
-        niter = result[1].iterations
-
-    return ghi, conv, niter
-
-
 def ghi_from_poa_driesse_2023(surface_tilt, surface_azimuth,
                               solar_zenith, solar_azimuth,
                               poa_global,
@@ -1575,8 +1745,9 @@ def ghi_from_poa_driesse_2023(surface_tilt, surface_azimuth,
 
     Notes
     -----
-    Since :py:func:`scipy.optimize.bisect` is not vectorized, high-resolution
-    time series can be quite slow to process.
+    The bisection is vectorized: all elements are bisected together and each
+    element takes the same steps as :py:func:`scipy.optimize.bisect`, so
+    elements that converge early are not iterated further.
 
     References
     ----------
@@ -1595,13 +1766,51 @@ def ghi_from_poa_driesse_2023(surface_tilt, surface_azimuth,
     if xtol <= 0:
         raise ValueError(f"xtol too small ({xtol:g} <= 0)")
 
-    ghi_from_poa_array = np.vectorize(_ghi_from_poa)
+    poa = np.asarray(poa_global, dtype=float)
+    shape = np.broadcast(np.empty(np.shape(surface_tilt)),
+                         np.empty(np.shape(surface_azimuth)),
+                         np.empty(np.shape(solar_zenith)),
+                         np.empty(np.shape(solar_azimuth)), poa,
+                         np.empty(np.shape(dni_extra)),
+                         np.empty(np.shape(airmass)),
+                         np.empty(np.shape(albedo))).shape
+    poa = np.broadcast_to(poa, shape)
+
+    # propagate nans and zeros quickly, solve only for the remaining points
+    ghi = np.where(poa <= 0, 0., np.nan)
+    conv = np.array(poa <= 0)
+    niter = np.zeros(shape, dtype=int)
+    solve = poa > 0
+
+    def _select(x):
+        # values of an input at the points being solved
+        return x if np.ndim(x) == 0 else np.broadcast_to(x, shape)[solve]
+
+    surface_tilt, surface_azimuth, solar_zenith, solar_azimuth, poa, \
+        dni_extra, airmass, albedo = map(
+            _select, (surface_tilt, surface_azimuth, solar_zenith,
+                      solar_azimuth, poa, dni_extra, airmass, albedo))
 
-    ghi, conv, niter = ghi_from_poa_array(surface_tilt, surface_azimuth,
-                                          solar_zenith, solar_azimuth,
-                                          poa_global,
-                                          dni_extra, airmass, albedo,
-                                          xtol=xtol)
+    # function whose root needs to be found
+    def poa_error(ghi, surface_tilt, surface_azimuth, solar_zenith,
+                  solar_azimuth, poa, dni_extra, airmass, albedo):
+        poa_hat = _poa_from_ghi(surface_tilt, surface_azimuth,
+                                solar_zenith, solar_azimuth,
+                                ghi,
+                                dni_extra, airmass, albedo)
+        return poa_hat - poa
+
+    # calculate an upper bound for ghi using clearness index 1.25
+    ghi_clear = dni_extra * tools.cosd(solar_zenith)
+    ghi_high = np.maximum(10, 1.25 * ghi_clear)
+
+    # a NaN root with niter -1 occurs when poa_error has the same sign at
+    # both end points
+    ghi[solve], conv[solve], niter[solve] = tools._bisect(
+        poa_error, a=0, b=ghi_high,
+        args=(surface_tilt, surface_azimuth, solar_zenith, solar_azimuth,
+              poa, dni_extra, airmass, albedo),
+        xtol=xtol, maxiter=25)
 
     if isinstance(poa_global, pd.Series):
         ghi = pd.Series(ghi, poa_global.index)
@@ -2444,12 +2653,34 @@ def _gti_dirint_lt_90(poa_global, aoi, aoi_lt_90, solar_zenith, solar_azimuth,
     coeffs[20:] = 0.125
     coeffs = coeffs[:max_iterations]  # covers case where max_iterations < 30
 
-    # initialize diff
-    diff = pd.Series(9999, index=times)
-    best_diff = diff
+    # the iteration is done on arrays, and each iteration only updates the
+    # points whose best modeled GTI is not yet within 1 Wm⁻² of poa_global
+    def as_array(x):
+        return np.asarray(x, dtype=float) if np.ndim(x) > 0 else x
+
+    poa_global = as_array(poa_global)
+    aoi = as_array(aoi)
+    aoi_lt_90 = np.asarray(aoi_lt_90)
+    solar_zenith = as_array(solar_zenith)
+    solar_azimuth = as_array(solar_azimuth)
+    surface_tilt = as_array(surface_tilt)
+    surface_azimuth = as_array(surface_azimuth)
+    albedo = as_array(albedo)
+    I0 = as_array(I0)
+    I0h = as_array(I0h)
+    cos_zenith = as_array(cos_zenith)
+    airmass = as_array(airmass)
+    w = _temp_dew_dirint(temp_dew, times).to_numpy()
+    delta_kt_prime = _delta_kt_prime_dirint(None, False, times).to_numpy()
+
+    n = len(times)
+    best_diff = np.full(n, 9999.)
+    best_ghi, best_dni, best_dhi, best_kt_prime = np.full((4, n), np.nan)
+    # kt_prime of the latest iteration of each point, for delta_kt_prime
+    kt_prime_i = np.full(n, np.nan)
 
     # initialize poa_global_i
-    poa_global_i = poa_global
+    poa_global_i = np.array(np.broadcast_to(poa_global, n), dtype=float)
 
     for iteration, coeff in enumerate(coeffs):
 
@@ -2462,18 +2693,29 @@ def _gti_dirint_lt_90(poa_global, aoi, aoi_lt_90, solar_zenith, solar_azimuth,
             # all aoi < 90 points have a difference <= 1, so break loop
             break
 
+        idx = np.flatnonzero(~best_diff_lte_1)
+
+        def sub(x):
+            return x[idx] if np.ndim(x) > 0 else x
+
         # calculate kt and DNI from GTI
-        kt = clearness_index(poa_global_i, aoi, I0)  # kt from Marion eqn 2
-        disc_dni = np.maximum(_disc_kn(kt, airmass)[0] * I0, 0)
-        kt_prime = clearness_index_zenith_independent(kt, airmass)
+        am = sub(airmass)
+        kt = clearness_index(poa_global_i[idx], sub(aoi), sub(I0))
+        disc_dni = np.maximum(_disc_kn(kt, am)[0] * sub(I0), 0)
+        kt_prime = clearness_index_zenith_independent(kt, am)
+        kt_prime_i[idx] = kt_prime
+        if use_delta_kt_prime:
+            delta_kt_prime = _delta_kt_prime_dirint(
+                pd.Series(kt_prime_i, index=times), True, times).to_numpy()
         # dirint DNI in Marion eqn 3
-        dni = _dirint_from_dni_ktprime(disc_dni, kt_prime, solar_zenith,
-                                       use_delta_kt_prime, temp_dew)
+        dni = disc_dni * _dirint_coeffs(times[idx], kt_prime,
+                                        sub(solar_zenith), w[idx],
+                                        delta_kt_prime[idx])
 
         # calculate DHI using Marion eqn 3 (identify 1st term on RHS as GHI)
         # I0h has a minimum zenith projection, but multiplier of DNI does not
-        ghi = kt * I0h                  # Kt * I0 * max(0.065, cos(zen))
-        dhi = ghi - dni * cos_zenith    # no cos(zen) restriction here
+        ghi = kt * sub(I0h)             # Kt * I0 * max(0.065, cos(zen))
+        dhi = ghi - dni * sub(cos_zenith)  # no cos(zen) restriction here
 
         # following SSC code
         dni = np.maximum(dni, 0)
@@ -2484,50 +2726,50 @@ def _gti_dirint_lt_90(poa_global, aoi, aoi_lt_90, solar_zenith, solar_azimuth,
         # GTI-DIRINT uses perez transposition model, but we allow for
         # any model here
         all_irrad = get_total_irradiance(
-            surface_tilt, surface_azimuth, solar_zenith, solar_azimuth,
-            dni, ghi, dhi, dni_extra=I0, airmass=airmass,
-            albedo=albedo, model=model, model_perez=model_perez)
+            sub(surface_tilt), sub(surface_azimuth), sub(solar_zenith),
+            sub(solar_azimuth), dni, ghi, dhi, dni_extra=sub(I0),
+            airmass=am, albedo=sub(albedo), model=model,
+            model_perez=model_perez)
 
-        gti_model = all_irrad['poa_global']
+        gti_model = np.asarray(all_irrad['poa_global'])
 
         # calculate new diff
-        diff = gti_model - poa_global
+        diff = gti_model - sub(poa_global)
 
         # determine if the new diff is smaller in magnitude
         # than the old diff
-        diff_abs = diff.abs()
-        smallest_diff = diff_abs < best_diff
+        diff_abs = np.abs(diff)
+        smallest_diff = diff_abs < best_diff[idx]
 
         # save the best differences
-        best_diff = diff_abs.where(smallest_diff, best_diff)
+        best_diff[idx[smallest_diff]] = diff_abs[smallest_diff]
 
         # on first iteration, the best values are the only values
         if iteration == 0:
-            best_ghi = ghi
-            best_dni = dni
-            best_dhi = dhi
-            best_kt_prime = kt_prime
-        else:
-            # save new DNI, DHI, DHI if they provide the best consistency
-            # otherwise use the older values.
-            best_ghi = ghi.where(smallest_diff, best_ghi)
-            best_dni = dni.where(smallest_diff, best_dni)
-            best_dhi = dhi.where(smallest_diff, best_dhi)
-            best_kt_prime = kt_prime.where(smallest_diff, best_kt_prime)
+            smallest_diff[:] = True
+        # save new DNI, DHI, DHI if they provide the best consistency
+        # otherwise use the older values.
+        best = idx[smallest_diff]
+        best_ghi[best] = ghi[smallest_diff]
+        best_dni[best] = dni[smallest_diff]
+        best_dhi[best] = dhi[smallest_diff]
+        best_kt_prime[best] = kt_prime[smallest_diff]
 
         # calculate adjusted inputs for next iteration. Marion eqn 4
-        poa_global_i = np.maximum(1.0, poa_global_i - coeff * diff)
+        poa_global_i[idx] = np.maximum(1.0, poa_global_i[idx] - coeff * diff)
     else:
         # we are here because we ran out of coeffs to loop over and
         # therefore we have exceeded max_iterations
-        failed_points = best_diff[aoi_lt_90][~best_diff_lte_1_lt_90]
+        failed_points = pd.Series(best_diff, index=times)[aoi_lt_90][
+            ~best_diff_lte_1_lt_90]
         warnings.warn(
             ('%s points failed to converge after %s iterations. best_diff:\n%s'
              % (len(failed_points), max_iterations, failed_points)),
             RuntimeWarning)
 
     # return the best data, whether or not the solution converged
-    return best_ghi, best_dni, best_dhi, best_kt_prime
+    return tuple(pd.Series(x, index=times) for x in
+                 (best_ghi, best_dni, best_dhi, best_kt_prime))
 
 
 def _gti_dirint_gte_90(poa_global, aoi, solar_zenith, solar_azimuth,
@@ -2597,16 +2839,17 @@ def _gti_dirint_gte_90_kt_prime(aoi, solar_zenith, solar_azimuth, times,
     zenith_lt_90_aoi_gte_90_morning = zenith_lt_90 & aoi_gte_90 & morning
     zenith_lt_90_aoi_gte_90_afternoon = zenith_lt_90 & aoi_gte_90 & afternoon
 
-    kt_prime_gte_90 = []
-    for date, data in kt_prime.groupby(times.date):
-        kt_prime_am_avg = data[aoi_65_80_morning].mean()
-        kt_prime_pm_avg = data[aoi_65_80_afternoon].mean()
+    # average the morning and afternoon values of each day
+    kt_prime = pd.Series(np.asarray(kt_prime), index=times)
+    days = times.normalize()
+    kt_prime_am_avg = kt_prime.where(np.asarray(aoi_65_80_morning)).groupby(
+        days).transform('mean')
+    kt_prime_pm_avg = kt_prime.where(np.asarray(aoi_65_80_afternoon)).groupby(
+        days).transform('mean')
 
-        kt_prime_by_date = pd.Series(np.nan, index=data.index)
-        kt_prime_by_date[zenith_lt_90_aoi_gte_90_morning] = kt_prime_am_avg
-        kt_prime_by_date[zenith_lt_90_aoi_gte_90_afternoon] = kt_prime_pm_avg
-        kt_prime_gte_90.append(kt_prime_by_date)
-    kt_prime_gte_90 = pd.concat(kt_prime_gte_90)
+    kt_prime_gte_90 = kt_prime_am_avg.where(
+        np.asarray(zenith_lt_90_aoi_gte_90_morning),
+        kt_prime_pm_avg.where(np.asarray(zenith_lt_90_aoi_gte_90_afternoon)))
 
     return kt_prime_gte_90
 
@@ -3146,6 +3389,11 @@ def _liujordan(zenith, transmittance, airmass, dni_extra=1367.0):
     return irrads
 
 
+# read-only Perez coefficient tables by model name, filled on first use by
+# _get_perez_coefficients
+_perez_coefficients = {}
+
+
 def _get_perez_coefficients(perezmodel):
     '''
     Find coefficients for the Perez model
@@ -3177,7 +3425,8 @@ def _get_perez_coefficients(perezmodel):
     Returns
     --------
     F1coeffs, F2coeffs : (array, array)
-          F1 and F2 coefficients for the Perez model
+          F1 and F2 coefficients for the Perez model. The arrays are cached
+          and read-only.
 
     References
     ----------
@@ -3197,6 +3446,11 @@ def _get_perez_coefficients(perezmodel):
        Perez Diffuse Radiation Model". SAND88-7030
 
     '''
+    try:
+        return _perez_coefficients[perezmodel]
+    except KeyError:
+        pass
+
     coeffdict = {
         'allsitescomposite1990': [
             [-0.0080,    0.5880,   -0.0620,   -0.0600,    0.0720,   -0.0220],
@@ -3299,10 +3553,13 @@ def _get_perez_coefficients(perezmodel):
             [1.0070,   -2.2920,   -0.4820,  0.3900,  -3.3680,   0.2290]], }
 
     array = np.array(coeffdict[perezmodel])
+    # the tables are shared by all calls, see _perez_coefficients
+    array.flags.writeable = False
 
     F1coeffs = array[:, 0:3]
     F2coeffs = array[:, 3:7]
 
+    _perez_coefficients[perezmodel] = F1coeffs, F2coeffs
     return F1coeffs, F2coeffs
 
 
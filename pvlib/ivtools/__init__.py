@@ -4,4 +4,19 @@ and diode models.
 
 """
 
-from pvlib.ivtools import sde, sdm, utils  # noqa: F401
+import importlib
+
+# submodules are imported when first accessed (PEP 562)
+_submodules = ['sde', 'sdm', 'utils']
+
+__all__ = _submodules
+
+
+def __getattr__(name):
+    if name in _submodules:
+        return importlib.import_module(f'{__name__}.{name}')
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
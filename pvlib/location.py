@@ -6,13 +6,14 @@ This module contains the Location class.
 
 import pathlib
 import datetime
+import threading
 
+import numpy as np
 import pandas as pd
 import pytz
-import h5py
 
 from pvlib import solarposition, clearsky, atmosphere, irradiance
-from pvlib.tools import _degrees_to_index
+from pvlib.tools import _degrees_to_index, _read_h5_grid
 
 
 class Location:
@@ -187,7 +188,10 @@ class Location:
         temperature : float or array-like, default 12
 
         kwargs
-            passed to :py:func:`pvlib.solarposition.get_solarposition`
+            passed to :py:func:`pvlib.solarposition.get_solarposition`.
+            For example, ``cache=True`` reuses the time-only terms of
+            :py:func:`pvlib.solarposition.spa_python` across calls with the
+            same ``times``.
 
         Returns
         -------
@@ -337,7 +341,7 @@ class Location:
         times : DatetimeIndex
             Must be localized to the Location
         method : str, default 'pyephem'
-            'pyephem', 'spa', or 'geometric'
+            'pyephem', 'spa', 'iterative', or 'geometric'
 
         kwargs :
             Passed to the relevant functions. See
@@ -355,6 +359,10 @@ class Location:
         elif method == 'spa':
             result = solarposition.sun_rise_set_transit_spa(
                 times, self.latitude, self.longitude, **kwargs)
+        elif method == 'iterative':
+            result = solarposition.sun_rise_set_transit_iterative(
+                times, self.latitude, self.longitude,
+                altitude=self.altitude, **kwargs)
         elif method == 'geometric':
             sr, ss, tr = solarposition.sun_rise_set_transit_geometric(
                 times, self.latitude, self.longitude, **kwargs)
@@ -364,7 +372,7 @@ class Location:
                                         'transit': tr})
         else:
             raise ValueError('{} is not a valid method. Must be '
-                             'one of pyephem, spa, geometric'
+                             'one of pyephem, spa, iterative, geometric'
                              .format(method))
         return result
 
@@ -382,20 +390,26 @@ def lookup_altitude(latitude, longitude):
     significant errors (100+ meters) introduced by downsampling and
     source data resolution.
 
+    The map is read on the first call and kept in memory (about 9 MB), so
+    that later calls, including the altitude lookups of
+    :py:class:`Location` objects, do not read the file again. It can be
+    released with :py:func:`clear_altitude_cache`.
+
     Parameters
     ----------
-    latitude : float.
+    latitude : float or array-like
         Positive is north of the equator.
         Use decimal degrees notation.
 
-    longitude : float.
+    longitude : float or array-like
         Positive is east of the prime meridian.
         Use decimal degrees notation.
 
     Returns
     -------
-    altitude : float
-        The altitude of the location in meters.
+    altitude : float or np.ndarray
+        The altitude of the location in meters. An array with the broadcast
+        shape of `latitude` and `longitude` if either is array-like.
 
     Notes
     -----------
@@ -435,22 +449,39 @@ def lookup_altitude(latitude, longitude):
 
     """
 
-    pvlib_path = pathlib.Path(__file__).parent
-    filepath = pvlib_path / 'data' / 'Altitude.h5'
-
     latitude_index = _degrees_to_index(latitude, coordinate='latitude')
     longitude_index = _degrees_to_index(longitude, coordinate='longitude')
 
-    with h5py.File(filepath, 'r') as alt_h5_file:
-        alt = alt_h5_file['Altitude'][latitude_index, longitude_index]
+    alt = _altitude_grid()[latitude_index, longitude_index]
 
     # 255 is a special value that means nodata. Fallback to 0 if nodata.
-    if alt == 255:
-        return 0
-    # convert from np.uint8 to float so that the following operations succeed
-    alt = float(alt)
     # Altitude is encoded in 28 meter steps from -450 meters to 6561 meters
     # There are 0-254 possible altitudes, with 255 reserved for nodata.
-    alt *= 28
-    alt -= 450
+    alt = np.where(alt == 255, 0., alt * 28. - 450.)
+    if alt.ndim == 0:
+        return float(alt)
     return alt
+
+
+_altitude_cache = {}
+_altitude_cache_lock = threading.Lock()
+
+
+def clear_altitude_cache():
+    """
+    Release the altitude map kept in memory by
+    :py:func:`lookup_altitude`.
+    """
+    with _altitude_cache_lock:
+        _altitude_cache.clear()
+
+
+def _altitude_grid():
+    """Return the altitude map, loading it on first use."""
+    filepath = pathlib.Path(__file__).parent / 'data' / 'Altitude.h5'
+    with _altitude_cache_lock:
+        grid = _altitude_cache.get(filepath)
+        if grid is None:
+            grid = _read_h5_grid(filepath, 'Altitude')
+            _altitude_cache[filepath] = grid
+    return grid
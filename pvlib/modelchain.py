@@ -6,14 +6,17 @@ library. With great power comes great responsibility: users should take
 the time to read the source code for the module.
 """
 
+import collections
+import copy
 from functools import partial
 import itertools
+import os
 import warnings
 import pandas as pd
-from dataclasses import dataclass, field
+from dataclasses import dataclass, field, fields
 from typing import Union, Tuple, Optional, TypeVar
 
-from pvlib import pvsystem, iam
+from pvlib import pvsystem, iam, clearsky
 import pvlib.irradiance  # avoid name conflict with full import
 from pvlib.pvsystem import _DC_MODEL_PARAMS
 from pvlib.tools import _build_kwargs
@@ -36,6 +39,11 @@ TEMPERATURE_KEYS = ('module_temperature', 'cell_temperature')
 
 DATA_KEYS = WEATHER_KEYS + POA_KEYS + TEMPERATURE_KEYS
 
+# transposition models that can split sky diffuse irradiance into isotropic,
+# circumsolar and horizon components, see irradiance.get_sky_diffuse
+_SKY_DIFFUSE_COMPONENT_MODELS = ('isotropic', 'haydavies', 'perez',
+                                 'perez-driesse')
+
 # these dictionaries contain the default configuration for following
 # established modeling sequences. They can be used in combination with
 # ModelChain, particularly they are used by the methods
@@ -128,9 +136,10 @@ class ModelChainResult:
     # these attributes are used in __setattr__ to determine the correct type.
     _singleton_tuples: bool = field(default=False)
     _per_array_fields = {'total_irrad', 'aoi', 'aoi_modifier',
-                         'spectral_modifier', 'cell_temperature',
-                         'effective_irradiance', 'dc', 'diode_params',
-                         'dc_ohmic_losses', 'weather', 'albedo'}
+                         'diffuse_aoi_modifier', 'spectral_modifier',
+                         'cell_temperature', 'effective_irradiance', 'dc',
+                         'diode_params', 'dc_ohmic_losses', 'weather',
+                         'albedo'}
 
     # system-level information
     solar_position: Optional[pd.DataFrame] = field(default=None)
@@ -181,6 +190,16 @@ class ModelChainResult:
     see :py:meth:`~pvlib.pvsystem.PVSystem.get_iam` for details.
     """
 
+    diffuse_aoi_modifier: Optional[PerArray[Union[pd.DataFrame, float]]] = \
+        field(default=None)
+    """DataFrame (or tuple of DataFrame, one for each array) with columns
+    ``'sky'``, ``'horizon'`` and ``'ground'`` containing incidence angle
+    modifiers (unitless) for diffuse irradiance calculated by
+    ``ModelChain.diffuse_aoi_model``, or 1.0 if diffuse irradiance is not
+    modified; see :py:meth:`~pvlib.pvsystem.PVSystem.get_iam_diffuse` for
+    details.
+    """
+
     spectral_modifier: Optional[PerArray[Union[pd.Series, float]]] = \
         field(default=None)
     """Series (or tuple of Series, one for each array) containing spectral
@@ -275,6 +294,11 @@ class ModelChainResult:
         return (desc1 + desc2 + desc3 + desc4)
 
 
+# names of the results that can be selected with ModelChain.outputs
+_RESULT_FIELDS = frozenset(f.name for f in fields(ModelChainResult)
+                           if f.name not in ('_singleton_tuples', 'times'))
+
+
 class ModelChain:
     """
     The ModelChain class to provides a standardized, high-level
@@ -353,6 +377,38 @@ class ModelChain:
 
     name : str, optional
         Name of ModelChain instance.
+
+    diffuse_aoi_model : str or function, default 'no_loss'
+        Incidence angle modifier for sky and ground-reflected diffuse
+        irradiance. Valid strings are 'physical', 'ashrae', 'martin_ruiz',
+        'sapm', 'interp' and 'schlick', which integrate that IAM model over
+        solid angle with :py:func:`~pvlib.iam.marion_diffuse`, and
+        'no_loss'. For tracking mounts the integrals are interpolated from a
+        cached table at 1 degree steps of surface tilt. The ModelChain
+        instance will be passed as the first argument to a user-defined
+        function.
+
+        With the 'isotropic', 'haydavies', 'perez' and 'perez-driesse'
+        transposition models, sky diffuse irradiance is split into its
+        components: the isotropic component takes the ``'sky'`` modifier,
+        the horizon brightening component the ``'horizon'`` modifier, and
+        the circumsolar component, which arrives from near the sun, takes
+        ``aoi_modifier``. With other transposition models, or when plane
+        of array irradiance is given, the ``'sky'`` modifier is applied to
+        all sky diffuse irradiance.
+
+    outputs : list of str, optional
+        Names of the :py:class:`ModelChainResult` attributes to keep after
+        a run, e.g. ``['ac']``. Other results are removed as soon as the
+        standard models that use them have run, and the input data are not
+        copied, so that peak memory of long runs scales with the requested
+        outputs. Solar position, airmass, tracking, albedo, AOI and the
+        irradiance modifiers are removed once effective irradiance is
+        calculated, weather and plane-of-array irradiance once cell
+        temperature is calculated, effective irradiance and cell temperature
+        once DC power is calculated, and all other results at the end of the
+        run. User-defined models must not depend on removed results. By
+        default all results are kept.
     """
 
     def __init__(self, system, location,
@@ -363,7 +419,8 @@ class ModelChain:
                  dc_model=None, ac_model=None, aoi_model=None,
                  spectral_model=None, temperature_model=None,
                  dc_ohmic_model='no_loss',
-                 losses_model='no_loss', name=None):
+                 losses_model='no_loss', name=None,
+                 diffuse_aoi_model='no_loss', outputs=None):
 
         self.name = name
         self.system = system
@@ -378,12 +435,15 @@ class ModelChain:
         self.dc_model = dc_model
         self.ac_model = ac_model
         self.aoi_model = aoi_model
+        self.diffuse_aoi_model = diffuse_aoi_model
         self.spectral_model = spectral_model
         self.temperature_model = temperature_model
 
         self.dc_ohmic_model = dc_ohmic_model
         self.losses_model = losses_model
 
+        self.outputs = outputs
+
         self.results = ModelChainResult()
 
 
@@ -566,6 +626,29 @@ class ModelChain:
         return ('ModelChain: \n  ' + '\n  '.join(
             f'{attr}: {_getmcattr(self, attr)}' for attr in attrs))
 
+    @property
+    def outputs(self):
+        return self._outputs
+
+    @outputs.setter
+    def outputs(self, outputs):
+        if outputs is not None:
+            outputs = frozenset(outputs)
+            invalid = outputs - _RESULT_FIELDS
+            if invalid:
+                raise ValueError(f'invalid outputs: {sorted(invalid)}')
+        self._outputs = outputs
+
+    def _release(self, *names):
+        """Remove the results in `names` that are not in ``self.outputs``,
+        if outputs are selected."""
+        if self.outputs is None:
+            return self
+        for name in names:
+            if name not in self.outputs:
+                setattr(self.results, name, None)
+        return self
+
     @property
     def dc_model(self):
         return self._dc_model
@@ -849,6 +932,47 @@ class ModelChain:
             self.results.aoi_modifier = (1.0,) * self.system.num_arrays
         return self
 
+    @property
+    def diffuse_aoi_model(self):
+        return self._diffuse_aoi_model
+
+    @diffuse_aoi_model.setter
+    def diffuse_aoi_model(self, model):
+        if isinstance(model, str):
+            model = model.lower()
+            if model in ['physical', 'ashrae', 'martin_ruiz', 'sapm',
+                         'interp', 'schlick']:
+                self._diffuse_aoi_model = partial(
+                    self.marion_diffuse_aoi_loss, model)
+            elif model == 'no_loss':
+                self._diffuse_aoi_model = self.no_diffuse_aoi_loss
+            else:
+                raise ValueError(model + ' is not a valid diffuse aoi loss '
+                                 'model')
+        else:
+            self._diffuse_aoi_model = partial(model, self)
+
+    def marion_diffuse_aoi_loss(self, iam_model):
+        modifiers = tuple(
+            pd.DataFrame(array.get_iam_diffuse(
+                self.results.solar_position['apparent_zenith'],
+                self.results.solar_position['azimuth'],
+                iam_model=iam_model), index=self.results.times)
+            for array in self.system.arrays)
+        if self.system.num_arrays == 1:
+            self.results.diffuse_aoi_modifier = modifiers[0]
+        else:
+            self.results.diffuse_aoi_modifier = modifiers
+        return self
+
+    def no_diffuse_aoi_loss(self):
+        if self.system.num_arrays == 1:
+            self.results.diffuse_aoi_modifier = 1.0
+        else:
+            self.results.diffuse_aoi_modifier = (
+                (1.0,) * self.system.num_arrays)
+        return self
+
     @property
     def spectral_model(self):
         return self._spectral_model
@@ -1096,22 +1220,52 @@ class ModelChain:
         return self
 
     def effective_irradiance_model(self):
-        def _eff_irrad(module_parameters, total_irrad, spect_mod, aoi_mod):
+        def _eff_irrad(module_parameters, total_irrad, spect_mod, aoi_mod,
+                       diffuse_mod):
             fd = module_parameters.get('FD', 1.)
+            if isinstance(diffuse_mod, pd.DataFrame):
+                if 'poa_circumsolar' in total_irrad.columns:
+                    # circumsolar irradiance arrives from near the sun, so
+                    # it takes the beam modifier
+                    poa_diffuse = (
+                        total_irrad['poa_isotropic'] * diffuse_mod['sky'] +
+                        total_irrad['poa_circumsolar'] * aoi_mod +
+                        total_irrad['poa_horizon'] * diffuse_mod['horizon'] +
+                        total_irrad['poa_ground_diffuse'] *
+                        diffuse_mod['ground'])
+                elif {'poa_sky_diffuse', 'poa_ground_diffuse'} <= set(
+                        total_irrad.columns):
+                    poa_diffuse = (
+                        total_irrad['poa_sky_diffuse'] * diffuse_mod['sky'] +
+                        total_irrad['poa_ground_diffuse'] *
+                        diffuse_mod['ground'])
+                else:
+                    # sky and ground diffuse are not known separately
+                    poa_diffuse = (total_irrad['poa_diffuse'] *
+                                   diffuse_mod['sky'])
+            else:
+                poa_diffuse = total_irrad['poa_diffuse']
             return spect_mod * (total_irrad['poa_direct'] * aoi_mod +
-                                fd * total_irrad['poa_diffuse'])
+                                fd * poa_diffuse)
+        # the diffuse modifier is None if diffuse_aoi_model was not run
+        diffuse_modifier = self.results.diffuse_aoi_modifier
         if isinstance(self.results.total_irrad, tuple):
+            if not isinstance(diffuse_modifier, tuple):
+                diffuse_modifier = (diffuse_modifier,) * len(
+                    self.results.total_irrad)
             self.results.effective_irradiance = tuple(
-                _eff_irrad(array.module_parameters, ti, sm, am) for
-                array, ti, sm, am in zip(
+                _eff_irrad(array.module_parameters, ti, sm, am, dm) for
+                array, ti, sm, am, dm in zip(
                     self.system.arrays, self.results.total_irrad,
-                    self.results.spectral_modifier, self.results.aoi_modifier))
+                    self.results.spectral_modifier, self.results.aoi_modifier,
+                    diffuse_modifier))
         else:
             self.results.effective_irradiance = _eff_irrad(
                 self.system.arrays[0].module_parameters,
                 self.results.total_irrad,
                 self.results.spectral_modifier,
-                self.results.aoi_modifier
+                self.results.aoi_modifier,
+                diffuse_modifier
             )
         return self
 
@@ -1329,7 +1483,12 @@ class ModelChain:
     def _assign_weather(self, data):
         def _build_weather(data):
             key_list = [k for k in WEATHER_KEYS if k in data]
-            weather = data[key_list].copy()
+            if self.outputs is None:
+                weather = data[key_list].copy()
+            else:
+                # reference the input columns instead of copying them
+                weather = pd.DataFrame({k: data[k] for k in key_list},
+                                       index=data.index, copy=False)
             if weather.get('wind_speed') is None:
                 weather['wind_speed'] = 0
             if weather.get('temp_air') is None:
@@ -1348,7 +1507,10 @@ class ModelChain:
     def _assign_total_irrad(self, data):
         def _build_irrad(data):
             key_list = [k for k in POA_KEYS if k in data]
-            return data[key_list].copy()
+            if self.outputs is None:
+                return data[key_list].copy()
+            return pd.DataFrame({k: data[k] for k in key_list},
+                                index=data.index, copy=False)
         if isinstance(data, tuple):
             self.results.total_irrad = tuple(
                 _build_irrad(irrad_data) for irrad_data in data
@@ -1415,13 +1577,26 @@ class ModelChain:
         --------
         ModelChain.complete_irradiance
         """
+        return self._prepare_inputs(weather)
+
+    def _prepare_inputs(self, weather, solar_position=None, airmass=None):
+        """
+        :py:meth:`prepare_inputs`, optionally reusing `solar_position` and
+        `airmass` already calculated for the same location and times.
+        """
         weather = _to_tuple(weather)
         self._check_multiple_input(weather, strict=False)
         self._verify_df(weather, required=['ghi', 'dni', 'dhi'])
         self._assign_weather(weather)
 
-        self._prep_inputs_solar_pos(weather)
-        self._prep_inputs_airmass()
+        if solar_position is None:
+            self._prep_inputs_solar_pos(weather)
+        else:
+            self.results.solar_position = solar_position
+        if airmass is None:
+            self._prep_inputs_airmass()
+        else:
+            self.results.airmass = airmass
         self._prep_inputs_albedo(weather)
         self._prep_inputs_fixed()
 
@@ -1433,7 +1608,12 @@ class ModelChain:
             _tuple_from_dfs(self.results.weather, 'dhi'),
             albedo=self.results.albedo,
             airmass=self.results.airmass['airmass_relative'],
-            model=self.transposition_model
+            model=self.transposition_model,
+            # sky diffuse components for the diffuse aoi model
+            return_components=(
+                self.diffuse_aoi_model != self.no_diffuse_aoi_loss
+                and self.transposition_model.lower() in
+                _SKY_DIFFUSE_COMPONENT_MODELS)
         )
 
         return self
@@ -1614,7 +1794,7 @@ class ModelChain:
         )
         return self
 
-    def run_model(self, weather):
+    def run_model(self, weather, chunksize=None, warmup=None, executor=None):
         """
         Run the model chain starting with broadband global, diffuse and/or
         direct irradiance.
@@ -1649,6 +1829,24 @@ class ModelChain:
             If weather is a list or tuple, it must be of the same length and
             order as the Arrays of the ModelChain's PVSystem.
 
+        chunksize : int, optional
+            If given, the time index is split into chunks of `chunksize`
+            timesteps, the model is run on each chunk and the results of the
+            chunks are concatenated. See Notes.
+
+        warmup : timedelta-like, optional
+            Length of the data preceding each chunk that is also simulated and
+            then discarded, so that models which depend on previous timesteps
+            start each chunk from the right state. Only used with `chunksize`.
+            Defaults to one day if `temperature_model` is ``'fuentes'``,
+            otherwise no warmup.
+
+        executor : concurrent.futures.Executor, optional
+            Executor used to run the chunks, for example a
+            :py:class:`~concurrent.futures.ThreadPoolExecutor` or
+            :py:class:`~concurrent.futures.ProcessPoolExecutor`. By default
+            the chunks are run one after another. Only used with `chunksize`.
+
         Returns
         -------
         self
@@ -1660,32 +1858,63 @@ class ModelChain:
             of Arrays in the PVSystem.
         ValueError
             If the DataFrames in `data` have different indexes.
+        ValueError
+            If `chunksize` is not a positive integer.
 
         Notes
         -----
         Assigns attributes to ``results``: ``times``, ``weather``,
         ``solar_position``, ``airmass``, ``total_irrad``, ``aoi``,
-        ``aoi_modifier``, ``spectral_modifier``, and
-        ``effective_irradiance``, ``cell_temperature``, ``dc``, ``ac``,
+        ``aoi_modifier``, ``diffuse_aoi_modifier``, ``spectral_modifier``,
+        and ``effective_irradiance``, ``cell_temperature``, ``dc``, ``ac``,
         ``losses``, ``diode_params`` (if dc_model is a single diode
         model).
 
+        When `chunksize` is given, each chunk is run on a copy of the
+        ModelChain and ``results`` is replaced by the concatenated results of
+        the chunks. Peak memory then scales with `chunksize` rather than with
+        the length of `weather`, and the chunks can run in parallel. The
+        index of `weather` must be sorted. Models that carry state from one
+        timestep to the next, such as the ``'fuentes'`` temperature model or
+        a user-defined model applying :py:func:`pvlib.temperature.prilliman`,
+        need a `warmup` at least as long as their memory. Models whose state
+        depends on the entire history, such as
+        :py:func:`pvlib.soiling.kimber`, are not reproduced exactly when run
+        in chunks. A :py:class:`~concurrent.futures.ProcessPoolExecutor`
+        requires the ModelChain, including any user-defined model functions,
+        to be picklable. At most two chunks per CPU are submitted to
+        `executor` at a time, and only the results in ``outputs`` are kept
+        from each chunk.
+
         See also
         --------
         pvlib.modelchain.ModelChain.run_model_from_poa
         pvlib.modelchain.ModelChain.run_model_from_effective_irradiance
         """
+        if chunksize is not None:
+            return self._run_chunked('run_model', weather, chunksize, warmup,
+                                     executor)
+        return self._run_model(weather)
+
+    def _run_model(self, weather, solar_position=None, airmass=None):
+        """
+        :py:meth:`run_model`, optionally reusing `solar_position` and
+        `airmass` already calculated for the same location and times.
+        """
         weather = _to_tuple(weather)
-        self.prepare_inputs(weather)
+        self._prepare_inputs(weather, solar_position, airmass)
         self.aoi_model()
+        self.diffuse_aoi_model()
         self.spectral_model()
         self.effective_irradiance_model()
+        self._release_irradiance_inputs()
 
         self._run_from_effective_irrad(weather)
 
         return self
 
-    def run_model_from_poa(self, data):
+    def run_model_from_poa(self, data, chunksize=None, warmup=None,
+                           executor=None):
         """
         Run the model starting with broadband irradiance in the plane of array.
 
@@ -1710,6 +1939,10 @@ class ModelChain:
             Arrays. Each element of `data` provides the irradiance and weather
             for the corresponding array.
 
+        chunksize, warmup, executor : optional
+            Run the model in chunks of `chunksize` timesteps; see
+            :py:meth:`ModelChain.run_model`.
+
         Returns
         -------
         self
@@ -1721,13 +1954,15 @@ class ModelChain:
             of Arrays in the PVSystem.
         ValueError
             If the DataFrames in `data` have different indexes.
+        ValueError
+            If `chunksize` is not a positive integer.
 
         Notes
         -----
         Assigns attributes to results: ``times``, ``weather``,
         ``solar_position``, ``airmass``, ``total_irrad``, ``aoi``,
-        ``aoi_modifier``, ``spectral_modifier``, and
-        ``effective_irradiance``, ``cell_temperature``, ``dc``, ``ac``,
+        ``aoi_modifier``, ``diffuse_aoi_modifier``, ``spectral_modifier``,
+        and ``effective_irradiance``, ``cell_temperature``, ``dc``, ``ac``,
         ``losses``, ``diode_params`` (if dc_model is a single diode
         model).
 
@@ -1736,12 +1971,17 @@ class ModelChain:
         pvlib.modelchain.ModelChain.run_model
         pvlib.modelchain.ModelChain.run_model_from_effective_irradiance
         """
+        if chunksize is not None:
+            return self._run_chunked('run_model_from_poa', data, chunksize,
+                                     warmup, executor)
         data = _to_tuple(data)
         self.prepare_inputs_from_poa(data)
 
         self.aoi_model()
+        self.diffuse_aoi_model()
         self.spectral_model()
         self.effective_irradiance_model()
+        self._release_irradiance_inputs()
 
         self._run_from_effective_irrad(data)
 
@@ -1769,14 +2009,25 @@ class ModelChain:
         ``diode_params`` (if dc_model is a single diode model).
         """
         self._prepare_temperature(data)
+        self._release('weather', 'total_irrad')
         self.dc_model()
+        self._release('effective_irradiance', 'cell_temperature')
         self.dc_ohmic_model()
         self.losses_model()
         self.ac_model()
+        self._release(*_RESULT_FIELDS)
 
         return self
 
-    def run_model_from_effective_irradiance(self, data):
+    def _release_irradiance_inputs(self):
+        """Remove the results used to calculate effective irradiance that are
+        not in ``self.outputs``."""
+        return self._release('solar_position', 'airmass', 'tracking',
+                             'albedo', 'aoi', 'aoi_modifier',
+                             'diffuse_aoi_modifier', 'spectral_modifier')
+
+    def run_model_from_effective_irradiance(self, data, chunksize=None,
+                                            warmup=None, executor=None):
         """
         Run the model starting with effective irradiance in the plane of array.
 
@@ -1795,6 +2046,10 @@ class ModelChain:
             Arrays. Each element of `data` provides the irradiance and weather
             for the corresponding array.
 
+        chunksize, warmup, executor : optional
+            Run the model in chunks of `chunksize` timesteps; see
+            :py:meth:`ModelChain.run_model`.
+
         Returns
         -------
         self
@@ -1806,6 +2061,8 @@ class ModelChain:
             of Arrays in the PVSystem.
         ValueError
             If the DataFrames in `data` have different indexes.
+        ValueError
+            If `chunksize` is not a positive integer.
 
         Notes
         -----
@@ -1832,6 +2089,9 @@ class ModelChain:
         pvlib.modelchain.ModelChain.run_model
         pvlib.modelchain.ModelChain.run_model_from_poa
         """
+        if chunksize is not None:
+            return self._run_chunked('run_model_from_effective_irradiance',
+                                     data, chunksize, warmup, executor)
         data = _to_tuple(data)
         self._check_multiple_input(data)
         self._verify_df(data, required=['effective_irradiance'])
@@ -1843,6 +2103,309 @@ class ModelChain:
 
         return self
 
+    def _run_chunked(self, method, data, chunksize, warmup, executor):
+        """
+        Run ``method`` on consecutive chunks of `data`, each preceded by a
+        `warmup` period, and assign the concatenated results of the chunks
+        to ``self.results``.
+
+        See :py:meth:`ModelChain.run_model` for a description of the
+        parameters.
+        """
+        if int(chunksize) != chunksize or chunksize < 1:
+            raise ValueError('chunksize must be a positive integer')
+        chunksize = int(chunksize)
+        data = _to_tuple(data)
+        times = data[0].index if isinstance(data, tuple) else data.index
+        if warmup is None:
+            warmup = '1D' if self.temperature_model == self.fuentes_temp else 0
+        warmup = pd.Timedelta(warmup)
+        starts = range(0, len(times), chunksize)
+        if warmup > pd.Timedelta(0):
+            # first timestep of the warmup period preceding each chunk
+            firsts = times.searchsorted(times[list(starts)] - warmup)
+        else:
+            firsts = starts
+
+        def _chunks():
+            for start, first in zip(starts, firsts):
+                stop = start + chunksize
+                if isinstance(data, tuple):
+                    chunk = tuple(df.iloc[first:stop] for df in data)
+                else:
+                    chunk = data.iloc[first:stop]
+                # each chunk gets its own copy of the ModelChain, starting
+                # from empty results
+                mc = copy.deepcopy(
+                    self, {id(self.results): ModelChainResult()})
+                yield mc, method, chunk, start - first
+
+        if not starts:
+            # empty input, nothing to split
+            return getattr(self, method)(data)
+        if executor is None:
+            chunk_results = itertools.starmap(_run_chunk, _chunks())
+        else:
+            # copies of the ModelChain and data are made only for the chunks
+            # that are submitted, a few per worker at a time
+            chunk_results = _map_bounded(executor, _run_chunk, _chunks(),
+                                         window=2 * (os.cpu_count() or 1))
+        results = {}
+        for chunk_result in chunk_results:
+            for name, value in chunk_result.items():
+                results.setdefault(name, []).append(value)
+        self.results = ModelChainResult()
+        for name in list(results):
+            # release the chunks of each result once it is concatenated
+            setattr(self.results, name, _concat_results(results.pop(name)))
+        return self
+
+
+def run_fleet(fleet, weather=None, times=None, outputs=('ac',),
+              executor=None, batchsize=100, **kwargs):
+    """
+    Run a ModelChain for each plant in a fleet.
+
+    Plants at the same location that use the same weather data share one
+    solar position and airmass calculation. Plants without weather data are
+    run with clear sky irradiance, with the Linke turbidity of all their
+    locations looked up in one call of
+    :py:func:`~pvlib.clearsky.lookup_linke_turbidity`, which reads each cell
+    of the Linke turbidity grid once.
+
+    Parameters
+    ----------
+    fleet : DataFrame
+        One row per plant, indexed by unique plant names. Column
+        ``'system'`` contains a :py:class:`~pvlib.pvsystem.PVSystem` and
+        column ``'location'`` a :py:class:`~pvlib.location.Location` for
+        each plant. Optional column ``'weather'`` contains a key of
+        `weather`. Plants without a key are run with clear sky irradiance.
+
+    weather : dict, optional
+        Weather data by key, each a DataFrame or a tuple of DataFrame as
+        described in :py:meth:`ModelChain.run_model`.
+
+    times : DatetimeIndex, optional
+        Times for the plants run with clear sky irradiance. Required if any
+        plant has no weather key.
+
+    outputs : list of str, default ('ac',)
+        Names of the :py:class:`ModelChainResult` attributes to return.
+
+    executor : concurrent.futures.Executor, optional
+        Executor used to run the calculations, for example a
+        :py:class:`~concurrent.futures.ThreadPoolExecutor` or
+        :py:class:`~concurrent.futures.ProcessPoolExecutor`. By default
+        the calculations are run one after another.
+
+    batchsize : int, default 100
+        Maximum number of plants run by one task of `executor`.
+
+    **kwargs
+        Passed to :py:class:`ModelChain`, for example ``aoi_model`` or
+        ``temperature_model``. The same options are used for all plants.
+
+    Returns
+    -------
+    dict of DataFrame
+        For each name in `outputs`, a DataFrame indexed by time with one
+        column for each plant, in the order of `fleet`. Results that are
+        DataFrames, or tuples with one element for each Array, have
+        MultiIndex columns starting with the plant name, followed by the
+        Array index and column name where applicable. Constant results,
+        e.g. ``aoi_modifier`` with ``aoi_model='no_loss'``, are repeated
+        for each time. Results that the models of a plant do not produce,
+        e.g. ``tracking`` for a fixed system or ``diode_params`` for a DC
+        model other than a single diode model, are NaN. Plants with
+        different times are aligned by time.
+
+    Raises
+    ------
+    ValueError
+        If the index of `fleet` is not unique, if `outputs` contains a name
+        that is not a time series attribute of :py:class:`ModelChainResult`,
+        or if `times` is needed but not given.
+
+    Notes
+    -----
+    Clear sky irradiance is calculated with the ModelChain's
+    ``clearsky_model`` from the shared solar position and airmass, with air
+    temperature of 20 C and wind speed of 0 m/s.
+
+    See also
+    --------
+    pvlib.modelchain.ModelChain.run_model
+    """
+    if not fleet.index.is_unique:
+        raise ValueError('fleet index must be unique')
+    invalid = set(outputs) - _RESULT_FIELDS
+    if invalid:
+        raise ValueError(f'invalid outputs: {sorted(invalid)}')
+
+    # group plants by weather key and location, which determine the solar
+    # position, airmass and clear sky irradiance
+    groups = {}
+    for name, plant in fleet.iterrows():
+        key = plant.get('weather')
+        if pd.api.types.is_scalar(key) and pd.isna(key):
+            key = None
+        location = plant['location']
+        site = (location.latitude, location.longitude, location.altitude)
+        groups.setdefault((key, site), []).append(
+            (name, plant['system'], location))
+
+    # Linke turbidity for the groups without weather, in one lookup that
+    # reads each grid cell once
+    clearsky_groups = [i for i, (key, _) in enumerate(groups) if key is None]
+    group_turbidity = [None] * len(groups)
+    if clearsky_groups and times is None:
+        raise ValueError('times must be given for plants without weather')
+    if clearsky_groups and kwargs.get('clearsky_model',
+                                      'ineichen') == 'ineichen':
+        sites = [site for key, site in groups if key is None]
+        turbidity = clearsky.lookup_linke_turbidity(
+            times, [site[0] for site in sites], [site[1] for site in sites])
+        for i, values in zip(clearsky_groups, turbidity):
+            group_turbidity[i] = pd.Series(values, index=times)
+
+    def _map(func, *iterables):
+        if executor is None:
+            return map(func, *iterables)
+        return executor.map(func, *iterables)
+
+    # shared inputs for each group
+    group_plants = list(groups.values())
+    group_inputs = list(_map(
+        _fleet_inputs,
+        [plants[0] for plants in group_plants],
+        [None if key is None else weather[key] for key, _ in groups],
+        group_turbidity, itertools.repeat(times), itertools.repeat(kwargs)))
+
+    # plants, in batches
+    batches = [(plants[i:i + batchsize], inputs)
+               for plants, inputs in zip(group_plants, group_inputs)
+               for i in range(0, len(plants), batchsize)]
+    results = {}
+    for batch_results in _map(_run_fleet_batch,
+                              [plants for plants, _ in batches],
+                              [inputs for _, inputs in batches],
+                              itertools.repeat(outputs),
+                              itertools.repeat(kwargs)):
+        results.update(batch_results)
+
+    return {output: pd.concat({name: results[name][output]
+                               for name in fleet.index}, axis=1)
+            for output in outputs}
+
+
+def _fleet_inputs(plant, weather, linke_turbidity, times, kwargs):
+    """Calculate the weather, solar position and airmass shared by the plants
+    of a fleet at the same location that use the same weather."""
+    _, system, location = plant
+    mc = ModelChain(system, location, **kwargs)
+    if weather is None:
+        mc.results.times = times
+        mc.results.solar_position = location.get_solarposition(
+            times, method=mc.solar_position_method)
+    else:
+        weather = _to_tuple(weather)
+        mc.results.times = (weather[0] if isinstance(weather, tuple)
+                            else weather).index
+        mc._prep_inputs_solar_pos(weather)
+    mc._prep_inputs_airmass()
+    if weather is None:
+        cs_kwargs = {}
+        if mc.clearsky_model == 'ineichen':
+            cs_kwargs = {
+                'linke_turbidity': linke_turbidity,
+                'airmass_absolute': mc.results.airmass['airmass_absolute']}
+        weather = location.get_clearsky(
+            times, model=mc.clearsky_model,
+            solar_position=mc.results.solar_position, **cs_kwargs)
+    return weather, mc.results.solar_position, mc.results.airmass
+
+
+def _run_fleet_batch(plants, inputs, outputs, kwargs):
+    """Run the ModelChain of each plant with shared inputs and return the
+    requested outputs of each plant."""
+    weather, solar_position, airmass = inputs
+    results = {}
+    for name, system, location in plants:
+        mc = ModelChain(system, location, outputs=outputs, **kwargs)
+        mc._run_model(weather, solar_position, airmass)
+        results[name] = {
+            output: _fleet_output(getattr(mc.results, output),
+                                  mc.results.times)
+            for output in outputs}
+    return results
+
+
+def _fleet_output(value, times):
+    """Convert a result to a Series or DataFrame indexed by `times`. Results
+    that are None, e.g. ``tracking`` for a fixed system, are all NaN."""
+    if isinstance(value, tuple):
+        return pd.concat({i: _fleet_output(v, times)
+                          for i, v in enumerate(value)}, axis=1)
+    if value is None:
+        return pd.Series(float('nan'), index=times)
+    if isinstance(value, (pd.Series, pd.DataFrame)):
+        return value
+    return pd.Series(value, index=times)
+
+
+def _run_chunk(mc, method, data, warmup):
+    """Call ``method`` of ModelChain `mc` with `data` and return a dict of the
+    results with the first `warmup` timesteps removed. Results that are None,
+    e.g. those not in ``mc.outputs``, are left out."""
+    getattr(mc, method)(data)
+    results = {f.name: getattr(mc.results, f.name)
+               for f in fields(ModelChainResult)}
+    return {name: _trim_result(value, warmup)
+            for name, value in results.items() if value is not None}
+
+
+def _map_bounded(executor, func, iterable, window):
+    """Like ``executor.map(func, *zip(*iterable))``, but consume `iterable`
+    lazily, with at most `window` calls submitted and not yet returned."""
+    pending = collections.deque()
+    try:
+        for args in iterable:
+            pending.append(executor.submit(func, *args))
+            if len(pending) >= window:
+                yield pending.popleft().result()
+        while pending:
+            yield pending.popleft().result()
+    finally:
+        for future in pending:
+            future.cancel()
+
+
+def _trim_result(value, n):
+    """Remove the first `n` timesteps from a result, or from each element of
+    a tuple of results. Scalars and None are returned unchanged."""
+    if isinstance(value, tuple):
+        return tuple(_trim_result(v, n) for v in value)
+    if isinstance(value, (pd.Series, pd.DataFrame)):
+        return value.iloc[n:]
+    if isinstance(value, pd.Index):
+        return value[n:]
+    return value
+
+
+def _concat_results(values):
+    """Concatenate the results of consecutive chunks. Results which are not
+    time series, e.g. a constant loss factor, are taken from the first
+    chunk."""
+    first = values[0]
+    if isinstance(first, tuple):
+        return tuple(_concat_results(list(v)) for v in zip(*values))
+    if isinstance(first, (pd.Series, pd.DataFrame)):
+        return pd.concat(values)
+    if isinstance(first, pd.Index):
+        return first.append(values[1:])
+    return first
+
 
 def _irrad_for_celltemp(total_irrad, effective_irradiance):
     """
@@ -5,13 +5,19 @@ performance of PV modules and inverters.
 
 from collections import OrderedDict
 import functools
+import hashlib
 import io
 import itertools
+import os
 from pathlib import Path
+import pickle
 import inspect
+import tempfile
+import threading
 from urllib.request import urlopen
+import warnings
 import numpy as np
-from scipy import constants
+from scipy import constants, interpolate
 import pandas as pd
 from dataclasses import dataclass
 from abc import ABC, abstractmethod
@@ -415,6 +421,50 @@ class PVSystem:
         return tuple(array.get_iam(aoi, iam_model)
                      for array, aoi in zip(self.arrays, aoi))
 
+    @_unwrap_single_value
+    def get_iam_diffuse(self, solar_zenith, solar_azimuth,
+                        iam_model='physical', tilt_step=1.):
+        """
+        Determine the incidence angle modifiers for diffuse irradiance by
+        integrating the IAM model specified by ``iam_model`` over solid
+        angle with :py:func:`pvlib.iam.marion_diffuse`.
+
+        Parameters for the selected IAM model are expected to be in
+        ``PVSystem.module_parameters``.
+
+        Parameters
+        ----------
+        solar_zenith : numeric
+            Solar zenith angle. [degree]
+
+        solar_azimuth : numeric
+            Solar azimuth angle. [degree]
+
+        iam_model : string, default 'physical'
+            The IAM model to be integrated. Valid strings are 'physical',
+            'ashrae', 'martin_ruiz', 'sapm', 'interp' and 'schlick'.
+
+        tilt_step : float, default 1
+            Passed to :py:func:`pvlib.iam.marion_diffuse` when the surface
+            tilt changes with the solar position, e.g. for single-axis
+            trackers. Fixed tilts are integrated directly.
+
+        Returns
+        -------
+        iam : dict or tuple of dict
+            IAM for the ``'sky'``, ``'horizon'`` and ``'ground'`` regions,
+            see :py:func:`pvlib.iam.marion_diffuse`.
+
+        Raises
+        ------
+        ValueError
+            if `iam_model` is not a valid model name.
+        """
+        return tuple(
+            array.get_iam_diffuse(solar_zenith, solar_azimuth, iam_model,
+                                  tilt_step)
+            for array in self.arrays)
+
     @_unwrap_single_value
     def get_cell_temperature(self, poa_global, temp_air, wind_speed, model,
                              effective_irradiance=None):
@@ -1201,6 +1251,66 @@ class Array:
         else:
             raise ValueError(model + ' is not a valid IAM model')
 
+    def get_iam_diffuse(self, solar_zenith, solar_azimuth,
+                        iam_model='physical', tilt_step=1.):
+        """
+        Determine the incidence angle modifiers for diffuse irradiance by
+        integrating the IAM model specified by ``iam_model`` over solid
+        angle with :py:func:`pvlib.iam.marion_diffuse`.
+
+        Parameters for the selected IAM model are expected to be in
+        ``Array.module_parameters``. Default parameters are available for
+        the 'physical', 'ashrae' and 'martin_ruiz' models.
+
+        Parameters
+        ----------
+        solar_zenith : numeric
+            Solar zenith angle. [degree]
+
+        solar_azimuth : numeric
+            Solar azimuth angle. [degree]
+
+        iam_model : string, default 'physical'
+            The IAM model to be integrated. Valid strings are 'physical',
+            'ashrae', 'martin_ruiz', 'sapm', 'interp' and 'schlick'.
+
+        tilt_step : float, default 1
+            Passed to :py:func:`pvlib.iam.marion_diffuse` when the surface
+            tilt changes with the solar position, e.g. for single-axis
+            trackers. Fixed tilts are integrated directly.
+
+        Returns
+        -------
+        iam : dict
+            IAM for the ``'sky'``, ``'horizon'`` and ``'ground'`` regions,
+            see :py:func:`pvlib.iam.marion_diffuse`.
+
+        Raises
+        ------
+        ValueError
+            if `iam_model` is not a valid model name.
+        """
+        model = iam_model.lower()
+        if model in ['ashrae', 'physical', 'martin_ruiz', 'interp']:
+            func = getattr(iam, model)
+            params = set(inspect.signature(func).parameters.keys())
+            params.discard('aoi')
+            kwargs = _build_kwargs(params, self.module_parameters)
+        elif model == 'sapm':
+            kwargs = {'module': _build_kwargs(iam._IAM_MODEL_PARAMS['sapm'],
+                                              self.module_parameters)}
+        elif model == 'schlick':
+            kwargs = {}
+        else:
+            raise ValueError(model + ' is not a valid IAM model')
+
+        surface_tilt = self.mount.get_orientation(
+            solar_zenith, solar_azimuth)['surface_tilt']
+        if np.ndim(surface_tilt) == 0:
+            tilt_step = None
+        return iam.marion_diffuse(model, surface_tilt, tilt_step=tilt_step,
+                                  **kwargs)
+
     def get_cell_temperature(self, poa_global, temp_air, wind_speed, model,
                              effective_irradiance=None):
         """
@@ -1989,7 +2099,15 @@ def calcparams_pvsyst(effective_irradiance, temp_cell,
     return tuple(pd.Series(a, index=index).rename(None) for a in out)
 
 
-def retrieve_sam(name=None, path=None):
+# maximum number of databases held in the in-process cache of retrieve_sam
+SAM_CACHE_MAXSIZE = 8
+
+# in-process LRU cache of parsed SAM databases, keyed by a hash of the file
+_sam_databases = OrderedDict()
+_sam_databases_lock = threading.Lock()
+
+
+def retrieve_sam(name=None, path=None, product=None, cache_dir=None):
     """
     Retrieve latest module and inverter info from a file bundled with pvlib,
     a path or an URL (like SAM's website).
@@ -2003,6 +2121,13 @@ def retrieve_sam(name=None, path=None):
 
     and return it as a pandas DataFrame.
 
+    Parsed databases are kept in memory, keyed by a hash of the file
+    contents, so later calls for the same file only read and hash it. At
+    most ``SAM_CACHE_MAXSIZE`` databases are kept, evicting the least
+    recently used. If ``cache_dir`` is given, parsed databases are also
+    saved to and loaded from that directory, which lets other processes skip
+    parsing.
+
     .. note::
         Only provide one of ``name`` or ``path``.
 
@@ -2023,12 +2148,22 @@ def retrieve_sam(name=None, path=None):
     path : string, optional
         Path to a CSV file or a URL.
 
+    product : string, optional
+        Name of a single module or inverter, i.e. a column of the database,
+        to return instead of the whole database.
+
+    cache_dir : path-like, optional
+        Directory where the parsed database is saved as a pickle file, and
+        from which it is loaded if it was saved before. Only use a
+        directory with trusted contents.
+
     Returns
     -------
-    DataFrame
+    DataFrame or Series
         A DataFrame containing all the elements of the desired database.
         Each column represents a module or inverter, and a specific
-        dataset can be retrieved by the command
+        dataset can be retrieved by the command. If ``product`` is given,
+        a Series with the parameters of that module or inverter.
 
     Raises
     ------
@@ -2038,6 +2173,12 @@ def retrieve_sam(name=None, path=None):
         If both ``name`` and ``path`` are provided.
     KeyError
         If the provided ``name`` is not a valid database name.
+    KeyError
+        If the provided ``product`` is not in the database.
+
+    See Also
+    --------
+    clear_sam_cache
 
     Notes
     -----
@@ -2070,6 +2211,11 @@ def retrieve_sam(name=None, path=None):
     CEC_Type     Utility Interactive
     Name: AE_Solar_Energy__AE6_0__277V_, dtype: object
 
+    Retrieving a single inverter:
+
+    >>> inverter = pvsystem.retrieve_sam(
+    ...     name='CECInverter', product='AE_Solar_Energy__AE6_0__277V_')
+
     Using a remote database, via URL:
 
     >>> url = "https://raw.githubusercontent.com/NREL/SAM/refs/heads/develop/deploy/libraries/CEC%20Inverters.csv"
@@ -2102,13 +2248,74 @@ def retrieve_sam(name=None, path=None):
                 f"Invalid name {name}. "
                 + f"Provide one of {list(internal_dbs.keys())}."
             ) from None
+        data = csvdata_path.read_bytes()
+        is_url = False
     else:  # path is not None
-        if path.lower().startswith("http"):  # URL check is not case-sensitive
+        # URL check is not case-sensitive
+        is_url = path.lower().startswith("http")
+        if is_url:
             response = urlopen(path)  # URL is case-sensitive
-            csvdata_path = io.StringIO(response.read().decode(errors="ignore"))
+            data = response.read()
         else:
-            csvdata_path = path
-    return _parse_raw_sam_df(csvdata_path)
+            data = Path(path).read_bytes()
+
+    key = hashlib.blake2b(data, digest_size=16).hexdigest()
+    with _sam_databases_lock:
+        df = _sam_databases.get(key)
+        if df is not None:
+            _sam_databases.move_to_end(key)
+    if df is None:
+        # parse outside the lock, other threads can use the cache meanwhile
+        df = _load_sam_database(key, data, is_url, cache_dir)
+        with _sam_databases_lock:
+            _sam_databases[key] = df
+            while len(_sam_databases) > SAM_CACHE_MAXSIZE:
+                _sam_databases.popitem(last=False)
+
+    # copies keep callers from modifying the cached database
+    if product is not None:
+        try:
+            return df[product].copy()
+        except KeyError:
+            raise KeyError(
+                f"{product} not found in the database") from None
+    return df.copy()
+
+
+def clear_sam_cache():
+    """
+    Remove the databases kept in memory by :py:func:`retrieve_sam`.
+
+    Files saved to a ``cache_dir`` are not removed.
+    """
+    with _sam_databases_lock:
+        _sam_databases.clear()
+
+
+def _load_sam_database(key, data, is_url, cache_dir):
+    cache_file = None
+    if cache_dir is not None:
+        cache_file = Path(cache_dir) / f'sam_database_{key}.pkl'
+        if cache_file.exists():
+            return pd.read_pickle(cache_file)
+    if is_url:
+        csvdata = io.StringIO(data.decode(errors="ignore"))
+    else:
+        csvdata = io.BytesIO(data)
+    df = _parse_raw_sam_df(csvdata)
+    if cache_file is not None:
+        # write to a temporary file first so that other processes never
+        # read a partially written file
+        cache_file.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp = tempfile.mkstemp(dir=cache_file.parent, suffix='.tmp')
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                pickle.dump(df, f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp, cache_file)
+        except BaseException:
+            os.unlink(tmp)
+            raise
+    return df
 
 
 def _normalize_sam_product_names(names):
@@ -2465,6 +2672,7 @@ def singlediode(photocurrent, saturation_current, resistance_series,
     calcparams_cec
     calcparams_pvsyst
     sapm
+    SingleDiodeTable
     pvlib.singlediode.bishop88
 
     Notes
@@ -2481,6 +2689,16 @@ def singlediode(photocurrent, saturation_current, resistance_series,
     that guarantees convergence by bounding the voltage between zero and
     open-circuit.
 
+    If the environment variable ``PVLIB_USE_NUMBA`` is set to a value other
+    than ``'0'`` when :py:mod:`pvlib.singlediode` is first imported and numba
+    is installed, the ``'lambertw'`` method, :py:func:`i_from_v` and
+    :py:func:`v_from_i` use compiled loops that solve each IV curve in
+    parallel. The maximum power point is then found with Newton's method on
+    :math:`dP/dV` instead of a golden section search. Unlike
+    ``how='numba'`` in :py:func:`pvlib.solarposition.spa_python`, the
+    variable is only read at that first import; changing it later has no
+    effect.
+
     References
     ----------
     .. [1] S.R. Wenham, M.A. Green, M.E. Watt, "Applied Photovoltaics" ISBN
@@ -2658,7 +2876,10 @@ def v_from_i(current, photocurrent, saturation_current, resistance_series,
 
     method : str
         Method to use: ``'lambertw'``, ``'newton'``, or ``'brentq'``. *Note*:
-        ``'brentq'`` is limited to 1st quadrant only.
+        ``'brentq'`` is limited to 1st quadrant only. ``'lambertw'`` is
+        compiled with numba if ``PVLIB_USE_NUMBA`` is set when
+        :py:mod:`pvlib.singlediode` is first imported, see
+        :py:func:`singlediode`.
 
     Returns
     -------
@@ -2740,7 +2961,10 @@ def i_from_v(voltage, photocurrent, saturation_current, resistance_series,
 
     method : str
         Method to use: ``'lambertw'``, ``'newton'``, or ``'brentq'``. *Note*:
-        ``'brentq'`` is limited to 1st quadrant only.
+        ``'brentq'`` is limited to 1st quadrant only. ``'lambertw'`` is
+        compiled with numba if ``PVLIB_USE_NUMBA`` is set when
+        :py:mod:`pvlib.singlediode` is first imported, see
+        :py:func:`singlediode`.
 
     Returns
     -------
@@ -2767,6 +2991,517 @@ def i_from_v(voltage, photocurrent, saturation_current, resistance_series,
         return np.broadcast_to(current, shape)
 
 
+def ivcurve(photocurrent, saturation_current, resistance_series,
+            resistance_shunt, nNsVth, ivcurve_pnts, method='lambertw',
+            out=None, chunksize=10000):
+    '''
+    Calculate IV curves with voltage evenly spaced from zero to open circuit.
+
+    Curves are calculated in chunks of ``chunksize`` curves, and each chunk
+    is written to the output arrays before the next one is started, so the
+    temporary memory needed does not grow with the number of curves. The
+    output arrays can be supplied with ``out``, e.g. as
+    :py:class:`numpy.memmap` arrays for datasets that do not fit in memory.
+
+    Parameters
+    ----------
+    photocurrent : numeric
+        Light-generated current (photocurrent) in amperes under desired
+        IV curve conditions. Often abbreviated ``I_L``.
+        0 <= photocurrent
+
+    saturation_current : numeric
+        Diode saturation current in amperes under desired IV curve
+        conditions. Often abbreviated ``I_0``.
+        0 < saturation_current
+
+    resistance_series : numeric
+        Series resistance in ohms under desired IV curve conditions.
+        Often abbreviated ``Rs``.
+        0 <= resistance_series < numpy.inf
+
+    resistance_shunt : numeric
+        Shunt resistance in ohms under desired IV curve conditions.
+        Often abbreviated ``Rsh``.
+        0 < resistance_shunt <= numpy.inf
+
+    nNsVth : numeric
+        The product of three components. 1) The usual diode ideal factor
+        (n), 2) the number of cells in series (Ns), and 3) the cell
+        thermal voltage under the desired IV curve conditions (Vth).
+        0 < nNsVth
+
+    ivcurve_pnts : int
+        Number of points on each IV curve.
+
+    method : str, default 'lambertw'
+        Method to use: ``'lambertw'``, ``'newton'``, or ``'brentq'``.
+
+    out : tuple of two numpy.ndarray, optional
+        Arrays ``(current, voltage)`` in which to place the results. Each
+        must be a C-contiguous float64 array with shape
+        ``shape + (ivcurve_pnts,)``, where ``shape`` is the broadcast shape
+        of the input parameters.
+
+    chunksize : int, default 10000
+        Number of IV curves calculated at once.
+
+    Returns
+    -------
+    current : numpy.ndarray
+        Current in amperes, with shape ``shape + (ivcurve_pnts,)``. [A]
+    voltage : numpy.ndarray
+        Voltage in volts, with shape ``shape + (ivcurve_pnts,)``. [V]
+
+    See also
+    --------
+    ivcurve_chunks
+    singlediode
+    i_from_v
+    '''
+    args = (photocurrent, saturation_current, resistance_series,
+            resistance_shunt, nNsVth)
+    shape = np.broadcast(*args).shape + (ivcurve_pnts,)
+    if out is None:
+        out = (np.empty(shape), np.empty(shape))
+    for o in out:
+        if (o.shape != shape or o.dtype != np.float64
+                or not o.flags.c_contiguous):
+            raise ValueError('out must be C-contiguous float64 arrays with '
+                             f'shape {shape}')
+    current, voltage = (o.reshape(-1, ivcurve_pnts) for o in out)
+    for index, i, v in ivcurve_chunks(*args, ivcurve_pnts, method=method,
+                                      chunksize=chunksize):
+        current[index] = i
+        voltage[index] = v
+    return tuple(out)
+
+
+def ivcurve_chunks(photocurrent, saturation_current, resistance_series,
+                   resistance_shunt, nNsVth, ivcurve_pnts, method='lambertw',
+                   chunksize=10000):
+    '''
+    Generate IV curves in chunks, with voltage evenly spaced from zero to
+    open circuit.
+
+    The input parameters are broadcast and flattened, and the curves for
+    ``chunksize`` consecutive elements are calculated and yielded at a time,
+    so that IV curves for long time series can be processed or written to
+    disk without holding all of them in memory.
+
+    Parameters
+    ----------
+    photocurrent : numeric
+        Light-generated current (photocurrent) in amperes under desired
+        IV curve conditions. Often abbreviated ``I_L``.
+        0 <= photocurrent
+
+    saturation_current : numeric
+        Diode saturation current in amperes under desired IV curve
+        conditions. Often abbreviated ``I_0``.
+        0 < saturation_current
+
+    resistance_series : numeric
+        Series resistance in ohms under desired IV curve conditions.
+        Often abbreviated ``Rs``.
+        0 <= resistance_series < numpy.inf
+
+    resistance_shunt : numeric
+        Shunt resistance in ohms under desired IV curve conditions.
+        Often abbreviated ``Rsh``.
+        0 < resistance_shunt <= numpy.inf
+
+    nNsVth : numeric
+        The product of three components. 1) The usual diode ideal factor
+        (n), 2) the number of cells in series (Ns), and 3) the cell
+        thermal voltage under the desired IV curve conditions (Vth).
+        0 < nNsVth
+
+    ivcurve_pnts : int
+        Number of points on each IV curve.
+
+    method : str, default 'lambertw'
+        Method to use: ``'lambertw'``, ``'newton'``, or ``'brentq'``.
+
+    chunksize : int, default 10000
+        Maximum number of IV curves in each chunk.
+
+    Yields
+    ------
+    index : slice
+        Position of the chunk in the flattened input parameters.
+    current : numpy.ndarray
+        Current in amperes, with shape ``(chunk length, ivcurve_pnts)``. [A]
+    voltage : numpy.ndarray
+        Voltage in volts, with shape ``(chunk length, ivcurve_pnts)``. [V]
+
+    See also
+    --------
+    ivcurve
+    '''
+    if chunksize < 1:
+        raise ValueError('chunksize must be a positive integer')
+    args = [np.ravel(a) for a in np.broadcast_arrays(
+        photocurrent, saturation_current, resistance_series,
+        resistance_shunt, nNsVth)]
+    fraction = np.linspace(0., 1., ivcurve_pnts)
+    method = method.lower()
+    size = args[0].size
+    for start in range(0, size, chunksize):
+        index = slice(start, min(start + chunksize, size))
+        params = [a[index, np.newaxis] for a in args]
+        if method == 'lambertw':
+            v_oc = _singlediode._lambertw_v_from_i(0., *params)
+            # Set small elements <0 in v_oc to 0
+            v_oc[(v_oc < 0) & (v_oc > -1e-12)] = 0.
+        else:
+            v_oc = _singlediode.bishop88_v_from_i(0., *params, method=method)
+        voltage = v_oc * fraction
+        if method == 'lambertw':
+            current = _singlediode._lambertw_i_from_v(voltage, *params)
+        else:
+            current = _singlediode.bishop88_i_from_v(voltage, *params,
+                                                     method=method)
+        yield index, current, voltage
+
+
+# keyword arguments taken from module_parameters by each calcparams function,
+# matching the PVSystem.calcparams_* methods
+_CALCPARAMS_KWARGS = {
+    'desoto': ['a_ref', 'I_L_ref', 'I_o_ref', 'R_sh_ref', 'R_s', 'alpha_sc',
+               'EgRef', 'dEgdT', 'irrad_ref', 'temp_ref'],
+    'cec': ['a_ref', 'I_L_ref', 'I_o_ref', 'R_sh_ref', 'R_s', 'alpha_sc',
+            'Adjust', 'EgRef', 'dEgdT', 'irrad_ref', 'temp_ref'],
+    'pvsyst': ['gamma_ref', 'mu_gamma', 'I_L_ref', 'I_o_ref', 'R_sh_ref',
+               'R_sh_0', 'R_sh_exp', 'R_s', 'alpha_sc', 'EgRef',
+               'irrad_ref', 'temp_ref', 'cells_in_series'],
+}
+
+_SINGLEDIODE_COLUMNS = ('i_sc', 'v_oc', 'i_mp', 'v_mp', 'p_mp', 'i_x', 'i_xx')
+
+# maximum number of tables held in the in-process cache of SingleDiodeTable
+SINGLEDIODE_TABLE_CACHE_MAXSIZE = 32
+
+# in-process LRU cache of computed tables, keyed by SingleDiodeTable.key
+_singlediode_tables = OrderedDict()
+_singlediode_tables_lock = threading.Lock()
+
+
+def clear_singlediode_table_cache():
+    """
+    Remove all tables from the in-process cache of
+    :py:class:`SingleDiodeTable`.
+
+    Files saved to a ``cache_dir`` are not removed.
+    """
+    with _singlediode_tables_lock:
+        _singlediode_tables.clear()
+
+
+class SingleDiodeTable:
+    """
+    Lookup table of single diode IV curve points on a grid of effective
+    irradiance and cell temperature.
+
+    The points returned by :py:func:`singlediode` are calculated once for
+    one set of module parameters at every grid node. Later queries are
+    answered by interpolating the table, which avoids solving the single
+    diode equation at every timestep. Queries outside the grid are
+    calculated with :py:func:`singlediode`.
+
+    Tables are kept in memory and reused when a table with the same model,
+    module parameters and grid is created again. At most
+    ``SINGLEDIODE_TABLE_CACHE_MAXSIZE`` tables are kept, evicting the least
+    recently used first, and they can be removed with
+    :py:func:`clear_singlediode_table_cache`. If ``cache_dir`` is given,
+    tables are also saved to and loaded from that directory.
+
+    Parameters
+    ----------
+    model : str
+        Single diode model used to calculate the module parameters at each
+        grid node. One of ``'desoto'``, ``'cec'`` or ``'pvsyst'``.
+    module_parameters : dict or Series
+        Module parameters for ``model``, as used by
+        :py:meth:`PVSystem.calcparams_desoto`,
+        :py:meth:`PVSystem.calcparams_cec` or
+        :py:meth:`PVSystem.calcparams_pvsyst`.
+    effective_irradiance : array-like, optional
+        Increasing effective irradiance grid. Default is 0 to 1500 in steps
+        of 50, with additional values below 50. [W/m2]
+    temp_cell : array-like, optional
+        Increasing cell temperature grid. Default is -40 to 90 in steps of
+        5. [C]
+    method : str, default 'linear'
+        Interpolation method, ``'linear'`` (bilinear) or ``'cubic'``.
+    atol : float, optional
+        Maximum allowed absolute error in ``p_mp``. [W] If given, the grid
+        spacing is halved until the error estimated at the midpoints between
+        grid nodes is below ``atol``, up to ``max_refine`` times. Only the
+        axes with midpoint errors above ``atol`` are refined.
+    max_refine : int, default 4
+        Maximum number of grid refinements used to meet ``atol``.
+    cache_dir : path-like, optional
+        Directory where the table is saved, and from which it is loaded if
+        a matching table was saved before.
+
+    Attributes
+    ----------
+    effective_irradiance : numpy.ndarray
+        Effective irradiance grid. [W/m2]
+    temp_cell : numpy.ndarray
+        Cell temperature grid. [C]
+    points : dict of numpy.ndarray
+        IV curve points (see :py:func:`singlediode`) at the grid nodes, with
+        shape ``(len(effective_irradiance), len(temp_cell))``.
+    max_error : dict of float
+        Estimated maximum absolute interpolation error of each IV curve
+        point, from the midpoints between grid nodes.
+
+    Warns
+    -----
+    UserWarning
+        If ``atol`` is not met after ``max_refine`` refinements.
+
+    See also
+    --------
+    singlediode
+    max_power_point
+
+    Notes
+    -----
+    Points at zero irradiance that :py:func:`singlediode` returns as NaN
+    are stored as 0, as in :py:class:`pvlib.modelchain.ModelChain`. Because
+    ``v_oc`` and ``v_mp`` rise steeply from 0 at very low irradiance, their
+    interpolation error between the first two irradiance values can be
+    large even when ``p_mp`` meets ``atol``.
+
+    Examples
+    --------
+    >>> params = {'alpha_sc': 0.004539, 'a_ref': 2.6373, 'I_L_ref': 5.114,
+    ...           'I_o_ref': 8.196e-10, 'R_s': 1.065, 'R_sh_ref': 381.68}
+    >>> table = SingleDiodeTable('desoto', params, atol=0.01)
+    >>> mpp = table.max_power_point([200., 800.], [20., 45.])
+    """
+
+    def __init__(self, model, module_parameters, effective_irradiance=None,
+                 temp_cell=None, method='linear', atol=None, max_refine=4,
+                 cache_dir=None):
+        model = model.lower()
+        if model not in _CALCPARAMS_KWARGS:
+            raise ValueError(f"model must be one of "
+                             f"{list(_CALCPARAMS_KWARGS)}, got '{model}'")
+        if method not in ('linear', 'cubic'):
+            raise ValueError(f"method must be 'linear' or 'cubic', got "
+                             f"'{method}'")
+        if effective_irradiance is None:
+            # closer spacing at low irradiance, where the IV curve changes
+            # most quickly
+            effective_irradiance = np.concatenate(
+                [[0., 2., 5., 10., 20., 35.], np.arange(50., 1501., 50.)])
+        if temp_cell is None:
+            temp_cell = np.arange(-40., 91., 5.)
+        effective_irradiance = np.asarray(effective_irradiance, dtype=float)
+        temp_cell = np.asarray(temp_cell, dtype=float)
+        min_nodes = 2 if method == 'linear' else 4
+        for name, grid in (('effective_irradiance', effective_irradiance),
+                           ('temp_cell', temp_cell)):
+            if grid.ndim != 1 or grid.size < min_nodes or \
+                    np.any(np.diff(grid) <= 0):
+                raise ValueError(f'{name} must be increasing with at least '
+                                 f'{min_nodes} values for method={method}')
+
+        self.model = model
+        self.module_parameters = _build_kwargs(_CALCPARAMS_KWARGS[model],
+                                               module_parameters)
+        self.method = method
+        self.key = self._table_key(effective_irradiance, temp_cell, atol,
+                                   max_refine)
+
+        path = None
+        if cache_dir is not None:
+            path = Path(cache_dir) / f'singlediode_table_{self.key}.npz'
+        with _singlediode_tables_lock:
+            cached = _singlediode_tables.get(self.key)
+            if cached is not None:
+                _singlediode_tables.move_to_end(self.key)
+        if cached is None and path is not None and path.exists():
+            cached = self._read(path)
+        if cached is None:
+            cached = self._build(effective_irradiance, temp_cell, atol,
+                                 max_refine)
+        if path is not None and not path.exists():
+            self._write(path, cached)
+        with _singlediode_tables_lock:
+            _singlediode_tables[self.key] = cached
+            while len(_singlediode_tables) > SINGLEDIODE_TABLE_CACHE_MAXSIZE:
+                _singlediode_tables.popitem(last=False)
+        self.effective_irradiance, self.temp_cell, self.points, \
+            self.max_error = cached
+        self._splines = self._fit(self.effective_irradiance,
+                                  self.temp_cell, self.points)
+
+    def _table_key(self, effective_irradiance, temp_cell, atol, max_refine):
+        h = hashlib.blake2b(digest_size=16)
+        h.update(repr((self.model, sorted(
+            (k, float(v)) for k, v in self.module_parameters.items()),
+            self.method, atol, max_refine)).encode())
+        h.update(effective_irradiance.tobytes())
+        h.update(temp_cell.tobytes())
+        return h.hexdigest()
+
+    def _calcparams(self, effective_irradiance, temp_cell):
+        calcparams = {'desoto': calcparams_desoto, 'cec': calcparams_cec,
+                      'pvsyst': calcparams_pvsyst}[self.model]
+        return calcparams(effective_irradiance, temp_cell,
+                          **self.module_parameters)
+
+    def _evaluate(self, effective_irradiance, temp_cell):
+        # IV curve points from the single diode equation, as 2D arrays
+        e, t = np.meshgrid(effective_irradiance, temp_cell, indexing='ij')
+        with np.errstate(divide='ignore', invalid='ignore'):
+            out = singlediode(*self._calcparams(e.ravel(), t.ravel()))
+        return {c: np.nan_to_num(out[c].to_numpy().reshape(e.shape))
+                for c in _SINGLEDIODE_COLUMNS}
+
+    def _fit(self, effective_irradiance, temp_cell, points):
+        k = 1 if self.method == 'linear' else 3
+        return {
+            c: interpolate.RectBivariateSpline(
+                effective_irradiance, temp_cell, points[c], kx=k, ky=k, s=0)
+            for c in _SINGLEDIODE_COLUMNS
+        }
+
+    def _build(self, effective_irradiance, temp_cell, atol, max_refine):
+        points = self._evaluate(effective_irradiance, temp_cell)
+        for refine in range(max_refine + 1):
+            splines = self._fit(effective_irradiance, temp_cell, points)
+            # evaluate at the grid nodes and the midpoints between them,
+            # which make up the next refined grid
+            fine_e = np.empty(2 * effective_irradiance.size - 1)
+            fine_e[::2] = effective_irradiance
+            fine_e[1::2] = 0.5 * (effective_irradiance[1:] +
+                                  effective_irradiance[:-1])
+            fine_t = np.empty(2 * temp_cell.size - 1)
+            fine_t[::2] = temp_cell
+            fine_t[1::2] = 0.5 * (temp_cell[1:] + temp_cell[:-1])
+            fine = self._evaluate(fine_e, fine_t)
+            error = {c: np.abs(splines[c](fine_e, fine_t) - fine[c])
+                     for c in _SINGLEDIODE_COLUMNS}
+            max_error = {c: float(np.max(error[c]))
+                         for c in _SINGLEDIODE_COLUMNS}
+            if atol is None or max_error['p_mp'] <= atol:
+                break
+            if refine < max_refine:
+                # refine only the axes with midpoints that exceed atol
+                rows = slice(None) if np.max(error['p_mp'][1::2, :]) > atol \
+                    else slice(None, None, 2)
+                cols = slice(None) if np.max(error['p_mp'][:, 1::2]) > atol \
+                    else slice(None, None, 2)
+                effective_irradiance = fine_e[rows]
+                temp_cell = fine_t[cols]
+                points = {c: fine[c][rows, cols] for c in _SINGLEDIODE_COLUMNS}
+        else:
+            warnings.warn(
+                f"SingleDiodeTable p_mp error {max_error['p_mp']:.3g} W "
+                f"exceeds atol={atol} after {max_refine} refinements")
+        return effective_irradiance, temp_cell, points, max_error
+
+    @staticmethod
+    def _write(path, table):
+        effective_irradiance, temp_cell, points, max_error = table
+        path.parent.mkdir(parents=True, exist_ok=True)
+        np.savez(path, effective_irradiance=effective_irradiance,
+                 temp_cell=temp_cell,
+                 max_error=[max_error[c] for c in _SINGLEDIODE_COLUMNS],
+                 **points)
+
+    @staticmethod
+    def _read(path):
+        with np.load(path) as data:
+            points = {c: data[c] for c in _SINGLEDIODE_COLUMNS}
+            max_error = dict(zip(_SINGLEDIODE_COLUMNS,
+                                 data['max_error'].tolist()))
+            return (data['effective_irradiance'], data['temp_cell'],
+                    points, max_error)
+
+    def _interp(self, effective_irradiance, temp_cell, columns):
+        index = tools.get_pandas_index(effective_irradiance, temp_cell)
+        e, t = np.broadcast_arrays(np.asarray(effective_irradiance, float),
+                                   np.asarray(temp_cell, float))
+        shape = e.shape
+        e, t = e.ravel(), t.ravel()
+        out = {c: self._splines[c](e, t, grid=False) for c in columns}
+        # points outside the table are calculated directly
+        outside = ~((e >= self.effective_irradiance[0]) &
+                    (e <= self.effective_irradiance[-1]) &
+                    (t >= self.temp_cell[0]) & (t <= self.temp_cell[-1]))
+        if np.any(outside):
+            exact = singlediode(*self._calcparams(e[outside], t[outside]))
+            for c in columns:
+                out[c][outside] = exact[c]
+        if len(shape) == 0:
+            return {c: out[c].item() for c in columns}, None
+        return {c: out[c].reshape(shape) for c in columns}, index
+
+    def singlediode(self, effective_irradiance, temp_cell):
+        """
+        Interpolate IV curve points from the table.
+
+        Parameters
+        ----------
+        effective_irradiance : numeric
+            Effective irradiance. [W/m2]
+        temp_cell : numeric
+            Cell temperature. [C]
+
+        Returns
+        -------
+        dict or pandas.DataFrame
+            IV curve points as returned by :py:func:`singlediode`. A dict is
+            returned when the inputs are scalars.
+        """
+        out, index = self._interp(effective_irradiance, temp_cell,
+                                  _SINGLEDIODE_COLUMNS)
+        if np.isscalar(out['p_mp']):
+            return out
+        return pd.DataFrame(out, index=index)
+
+    def max_power_point(self, effective_irradiance, temp_cell):
+        """
+        Interpolate the maximum power point from the table.
+
+        Parameters
+        ----------
+        effective_irradiance : numeric
+            Effective irradiance. [W/m2]
+        temp_cell : numeric
+            Cell temperature. [C]
+
+        Returns
+        -------
+        OrderedDict or pandas.DataFrame
+            ``(i_mp, v_mp, p_mp)`` as returned by :py:func:`max_power_point`.
+        """
+        out, index = self._interp(effective_irradiance, temp_cell,
+                                  ('i_mp', 'v_mp', 'p_mp'))
+        if index is not None:
+            return pd.DataFrame(out, index=index)
+        return OrderedDict(out)
+
+    def save(self, path):
+        """
+        Save the table to a ``.npz`` file.
+
+        Parameters
+        ----------
+        path : path-like
+            File to write.
+        """
+        self._write(Path(path), (self.effective_irradiance, self.temp_cell,
+                                 self.points, self.max_error))
+
+
 def scale_voltage_current_power(data, voltage=1, current=1):
     """
     Scales the voltage, current, and power in data by the voltage
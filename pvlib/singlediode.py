@@ -1,13 +1,21 @@
 """
 Low-level functions for solving the single diode equation.
+
+If the environment variable ``PVLIB_USE_NUMBA`` is set to a value other than
+``'0'`` when this module is first imported and numba is installed, the
+Lambert W solution is compiled with numba. The variable is only read at
+import, unlike ``how='numba'`` in :py:func:`pvlib.solarposition.spa_python`.
+The bishop88 functions are never compiled.
 """
 
 import numpy as np
-from pvlib.tools import _golden_sect_DataFrame
+from pvlib import _numba
+from pvlib.tools import _golden_sect_DataFrame, _chandrupatla, _masked_newton
 
 from scipy.optimize import brentq, newton
 from scipy.special import lambertw
 
+
 # newton method default parameters for this module
 NEWTON_DEFAULT_PARAMS = {
     'tol': 1e-6,
@@ -254,7 +262,13 @@ def bishop88_i_from_v(voltage, photocurrent, saturation_current,
         :py:func:`scipy:scipy.optimize.brentq` and
         :py:func:`scipy:scipy.optimize.newton` parameters.
         ``'full_output': True`` is allowed, and ``optimizer_output`` would be
-        returned. See examples section.
+        returned. See examples section. With ``method='brentq'``, array
+        inputs are solved together by a vectorized bracketing method that
+        accepts the same keyword arguments as brentq. With
+        ``method='newton'``, ``'x0'`` may be given to warm start from
+        initial diode voltages, e.g. the roots from a previous solution;
+        elements that do not converge are solved again from the default
+        initial guess.
 
     Returns
     -------
@@ -314,25 +328,13 @@ def bishop88_i_from_v(voltage, photocurrent, saturation_current,
         # avoid the asymptote at NsVbi
         xp = np.where(voc_est < NsVbi, voc_est, 0.9999*NsVbi)
 
-        # brentq only works with scalar inputs, so we need a set up function
-        # and np.vectorize to repeatedly call the optimizer with the right
-        # arguments for possible array input
-        def vd_from_brent(voc, v, iph, isat, rs, rsh, gamma, d2mutau, NsVbi,
-                          breakdown_factor, breakdown_voltage, breakdown_exp):
-            return brentq(fv, 0.0, voc,
-                          args=(v, iph, isat, rs, rsh, gamma, d2mutau, NsVbi,
-                                breakdown_factor, breakdown_voltage,
-                                breakdown_exp),
-                          **method_kwargs)
-
-        vd_from_brent_vectorized = np.vectorize(vd_from_brent)
-        vd = vd_from_brent_vectorized(xp, voltage, *args)
+        vd = _brentq(fv, 0.0, xp, (voltage, *args), method_kwargs)
     elif method == 'newton':
         x0, (voltage, *args), method_kwargs = \
             _prepare_newton_inputs(voltage, (voltage, *args), method_kwargs)
-        vd = newton(func=lambda x, *a: fv(x, voltage, *a), x0=x0,
-                    fprime=lambda x, *a: bishop88(x, *a, gradients=True)[4],
-                    args=args, **method_kwargs)
+        vd = _newton(
+            fv, lambda x, v, *a: bishop88(x, *a, gradients=True)[4],
+            x0, (voltage, *args), method_kwargs)
     else:
         raise NotImplementedError("Method '%s' isn't implemented" % method)
 
@@ -395,7 +397,13 @@ def bishop88_v_from_i(current, photocurrent, saturation_current,
         :py:func:`scipy:scipy.optimize.brentq` and
         :py:func:`scipy:scipy.optimize.newton` parameters.
         ``'full_output': True`` is allowed, and ``optimizer_output`` would be
-        returned. See examples section.
+        returned. See examples section. With ``method='brentq'``, array
+        inputs are solved together by a vectorized bracketing method that
+        accepts the same keyword arguments as brentq. With
+        ``method='newton'``, ``'x0'`` may be given to warm start from
+        initial diode voltages, e.g. the roots from a previous solution;
+        elements that do not converge are solved again from the default
+        initial guess.
 
     Returns
     -------
@@ -455,25 +463,13 @@ def bishop88_v_from_i(current, photocurrent, saturation_current,
         return bishop88(x, *a)[0] - i
 
     if method == 'brentq':
-        # brentq only works with scalar inputs, so we need a set up function
-        # and np.vectorize to repeatedly call the optimizer with the right
-        # arguments for possible array input
-        def vd_from_brent(voc, i, iph, isat, rs, rsh, gamma, d2mutau, NsVbi,
-                          breakdown_factor, breakdown_voltage, breakdown_exp):
-            return brentq(fi, 0.0, voc,
-                          args=(i, iph, isat, rs, rsh, gamma, d2mutau, NsVbi,
-                                breakdown_factor, breakdown_voltage,
-                                breakdown_exp),
-                          **method_kwargs)
-
-        vd_from_brent_vectorized = np.vectorize(vd_from_brent)
-        vd = vd_from_brent_vectorized(xp, current, *args)
+        vd = _brentq(fi, 0.0, xp, (current, *args), method_kwargs)
     elif method == 'newton':
         x0, (current, *args), method_kwargs = \
             _prepare_newton_inputs(xp, (current, *args), method_kwargs)
-        vd = newton(func=lambda x, *a: fi(x, current, *a), x0=x0,
-                    fprime=lambda x, *a: bishop88(x, *a, gradients=True)[3],
-                    args=args, **method_kwargs)
+        vd = _newton(
+            fi, lambda x, i, *a: bishop88(x, *a, gradients=True)[3],
+            x0, (current, *args), method_kwargs)
     else:
         raise NotImplementedError("Method '%s' isn't implemented" % method)
 
@@ -533,7 +529,13 @@ def bishop88_mpp(photocurrent, saturation_current, resistance_series,
         :py:func:`scipy:scipy.optimize.brentq` and
         :py:func:`scipy:scipy.optimize.newton` parameters.
         ``'full_output': True`` is allowed, and ``optimizer_output`` would be
-        returned. See examples section.
+        returned. See examples section. With ``method='brentq'``, array
+        inputs are solved together by a vectorized bracketing method that
+        accepts the same keyword arguments as brentq. With
+        ``method='newton'``, ``'x0'`` may be given to warm start from
+        initial diode voltages, e.g. the roots from a previous solution;
+        elements that do not converge are solved again from the default
+        initial guess.
 
     Returns
     -------
@@ -593,24 +595,16 @@ def bishop88_mpp(photocurrent, saturation_current, resistance_series,
         return bishop88(x, *a, gradients=True)[6]
 
     if method == 'brentq':
-        # break out arguments for numpy.vectorize to handle broadcasting
-        vec_fun = np.vectorize(
-            lambda voc, iph, isat, rs, rsh, gamma, d2mutau, NsVbi, vbr_a, vbr,
-            vbr_exp: brentq(fmpp, 0.0, voc,
-                            args=(iph, isat, rs, rsh, gamma, d2mutau, NsVbi,
-                                  vbr_a, vbr, vbr_exp),
-                            **method_kwargs)
-        )
-        vd = vec_fun(xp, *args)
+        vd = _brentq(fmpp, 0.0, xp, args, method_kwargs)
     elif method == 'newton':
         # make sure all args are numpy arrays if max size > 1
         # if voc_est is an array, then make a copy to use for initial guess, v0
 
         x0, args, method_kwargs = \
             _prepare_newton_inputs(xp, args, method_kwargs)
-        vd = newton(func=fmpp, x0=x0,
-                    fprime=lambda x, *a: bishop88(x, *a, gradients=True)[7],
-                    args=args, **method_kwargs)
+        vd = _newton(
+            fmpp, lambda x, *a: bishop88(x, *a, gradients=True)[7],
+            x0, args, method_kwargs, upper=xp)
     else:
         raise NotImplementedError("Method '%s' isn't implemented" % method)
 
@@ -624,6 +618,72 @@ def bishop88_mpp(photocurrent, saturation_current, resistance_series,
         return bishop88(vd, *args)
 
 
+def _brentq(func, a, b, args, method_kwargs):
+    """
+    Find a bracketed root of ``func`` for scalar or array inputs.
+
+    Scalar inputs are solved with :py:func:`scipy:scipy.optimize.brentq`.
+    Array inputs are solved for all elements at once with a vectorized
+    bracketing method, which accepts the same ``method_kwargs``. With
+    ``'full_output': True`` the optimizer output for array inputs is a tuple
+    of the roots, a boolean array of converged elements, and the number of
+    iterations.
+    """
+    if all(np.ndim(x) == 0 for x in (a, b, *args)):
+        return brentq(func, a, b, args=args, **method_kwargs)
+    return _chandrupatla(func, a, b, args=args, **method_kwargs)
+
+
+def _newton(func, fprime, x0, args, method_kwargs, upper=None):
+    """
+    Solve with :py:func:`scipy:scipy.optimize.newton` from ``x0``, or, if
+    ``method_kwargs`` contains ``'x0'``, warm start from those values.
+
+    A warm start iterates each element only until it converges, so it is
+    fast when the initial values are close to the roots, e.g. diode
+    voltages from a previous solution with similar parameters. Elements that
+    do not converge, or whose root falls outside ``[0, upper]``, are solved
+    again with scipy's newton from the cold start ``x0``. With
+    ``'full_output': True`` the optimizer output of a warm start is a tuple
+    of the roots and boolean arrays of converged elements and elements with
+    zero derivative.
+    """
+    if 'x0' not in method_kwargs:
+        return newton(func=func, x0=x0, fprime=fprime, args=args,
+                      **method_kwargs)
+
+    kwargs = dict(method_kwargs)
+    x_warm = kwargs.pop('x0')
+    full_output = kwargs.pop('full_output', False)
+    # options that only apply to scipy's newton, used for the fallback
+    masked_kwargs = {k: v for k, v in kwargs.items()
+                     if k not in ('disp', 'fprime2', 'x1')}
+    vd, converged, zero_der = _masked_newton(
+        func, fprime, x_warm, args, upper=np.inf if upper is None else upper,
+        **masked_kwargs)
+    failed = ~converged
+    if upper is not None:
+        failed |= ~((vd >= 0) & (vd <= upper))
+    if np.any(failed):
+        shape = vd.shape
+        sub_args = tuple(a if np.ndim(a) == 0 else
+                         np.broadcast_to(a, shape)[failed] for a in args)
+        x_cold = np.broadcast_to(x0, shape)[failed]
+        cold = newton(func=func, x0=x_cold, fprime=fprime, args=sub_args,
+                      full_output=True, **kwargs)
+        if x_cold.size > 1:
+            vd[failed], converged[failed], zero_der[failed] = cold
+        else:
+            # scipy's newton returns a RootResults object for one element
+            vd[failed] = cold[0]
+            converged[failed] = cold[1].converged
+    if vd.ndim == 0:
+        vd = vd.item()
+    if full_output:
+        return vd, converged, zero_der
+    return vd
+
+
 def _shape_of_max_size(*args):
     return max(((np.size(a), np.shape(a)) for a in args),
                key=lambda t: t[0])[1]
@@ -664,6 +724,11 @@ def _prepare_newton_inputs(x0, args, method_kwargs):
 
 def _lambertw_v_from_i(current, photocurrent, saturation_current,
                        resistance_series, resistance_shunt, nNsVth):
+    if _numba.USE_NUMBA:
+        return _lambertw_compiled(_v_from_i_loop, current, photocurrent,
+                                  saturation_current, resistance_series,
+                                  resistance_shunt, nNsVth)
+
     # Record if inputs were all scalar
     output_is_scalar = all(map(np.isscalar,
                                (current, photocurrent, saturation_current,
@@ -741,6 +806,11 @@ def _lambertw_v_from_i(current, photocurrent, saturation_current,
 
 def _lambertw_i_from_v(voltage, photocurrent, saturation_current,
                        resistance_series, resistance_shunt, nNsVth):
+    if _numba.USE_NUMBA:
+        return _lambertw_compiled(_i_from_v_loop, voltage, photocurrent,
+                                  saturation_current, resistance_series,
+                                  resistance_shunt, nNsVth)
+
     # Record if inputs were all scalar
     output_is_scalar = all(map(np.isscalar,
                                (voltage, photocurrent, saturation_current,
@@ -805,32 +875,47 @@ def _lambertw(photocurrent, saturation_current, resistance_series,
               'resistance_series': resistance_series,
               'resistance_shunt': resistance_shunt, 'nNsVth': nNsVth}
 
-    # Compute short circuit current
-    i_sc = _lambertw_i_from_v(0., **params)
+    if _numba.USE_NUMBA:
+        # all points are solved per IV curve in a single compiled loop, with
+        # the maximum power point found by Newton's method on dP/dV
+        shape, args = _compiled_inputs(photocurrent, saturation_current,
+                                       resistance_series,
+                                       1. / resistance_shunt, nNsVth)
+        points = np.empty((7, args[0].size))
+        _singlediode_loop(*args, points)
+        if all(map(np.isscalar, params.values())):
+            out = tuple(p.item() for p in points)
+        else:
+            out = tuple(p.reshape(shape) for p in points)
+        v_oc = out[1]
+    else:
+        # Compute short circuit current
+        i_sc = _lambertw_i_from_v(0., **params)
 
-    # Compute open circuit voltage
-    v_oc = _lambertw_v_from_i(0., **params)
+        # Compute open circuit voltage
+        v_oc = _lambertw_v_from_i(0., **params)
 
-    # Set small elements <0 in v_oc to 0
-    if isinstance(v_oc, np.ndarray):
-        v_oc[(v_oc < 0) & (v_oc > -1e-12)] = 0.
-    elif isinstance(v_oc, (float, int)):
-        if v_oc < 0 and v_oc > -1e-12:
-            v_oc = 0.
+        # Set small elements <0 in v_oc to 0
+        if isinstance(v_oc, np.ndarray):
+            v_oc[(v_oc < 0) & (v_oc > -1e-12)] = 0.
+        elif isinstance(v_oc, (float, int)):
+            if v_oc < 0 and v_oc > -1e-12:
+                v_oc = 0.
 
-    # Find the voltage, v_mp, where the power is maximized.
-    # Start the golden section search at v_oc * 1.14
-    p_mp, v_mp = _golden_sect_DataFrame(params, 0., v_oc * 1.14, _pwr_optfcn)
+        # Find the voltage, v_mp, where the power is maximized.
+        # Start the golden section search at v_oc * 1.14
+        p_mp, v_mp = _golden_sect_DataFrame(params, 0., v_oc * 1.14,
+                                            _pwr_optfcn)
 
-    # Find Imp using Lambert W
-    i_mp = _lambertw_i_from_v(v_mp, **params)
+        # Find Imp using Lambert W
+        i_mp = _lambertw_i_from_v(v_mp, **params)
 
-    # Find Ix and Ixx using Lambert W
-    i_x = _lambertw_i_from_v(0.5 * v_oc, **params)
+        # Find Ix and Ixx using Lambert W
+        i_x = _lambertw_i_from_v(0.5 * v_oc, **params)
 
-    i_xx = _lambertw_i_from_v(0.5 * (v_oc + v_mp), **params)
+        i_xx = _lambertw_i_from_v(0.5 * (v_oc + v_mp), **params)
 
-    out = (i_sc, v_oc, i_mp, v_mp, p_mp, i_x, i_xx)
+        out = (i_sc, v_oc, i_mp, v_mp, p_mp, i_x, i_xx)
 
     # create ivcurve
     if ivcurve_pnts:
@@ -855,3 +940,175 @@ def _pwr_optfcn(df, loc):
                                  df['resistance_shunt'], df['nNsVth'])
 
     return current * df[loc]
+
+
+# The functions below solve the single diode equation with the Lambert W
+# function one element at a time. They are only used when PVLIB_USE_NUMBA is
+# set, in which case they are compiled and the loops run in parallel.
+@_numba.jcompile('float64(float64)', nopython=True, error_model='numpy')
+def _lambertw_log(logx):
+    """
+    Principal branch of the Lambert W function of a real ``x >= 0`` given
+    ``log(x)``, so that arguments which would overflow ``exp`` are handled.
+    """
+    if np.isnan(logx):
+        return np.nan
+    if logx == np.inf:
+        return np.inf
+    if logx > 1.:
+        # Newton's method for w + log(w) = log(x), which converges quickly
+        # from the asymptotic initial guess
+        w = logx - np.log(logx)
+        for _ in range(20):
+            dw = w * (logx - w - np.log(w)) / (1. + w)
+            w += dw
+            if abs(dw) <= 4e-16 * w:
+                break
+        return w
+    # Halley's method for w * exp(w) = x
+    x = np.exp(logx)
+    w = np.log1p(x)
+    for _ in range(20):
+        ew = np.exp(w)
+        f = w * ew - x
+        dw = f / (ew * (w + 1.) - (w + 2.) * f / (2. * w + 2.))
+        w -= dw
+        if abs(dw) <= 4e-16 * abs(w):
+            break
+    return w
+
+
+@_numba.jcompile('UniTuple(float64, 3)(float64, float64, float64, float64,'
+                 ' float64, float64)', nopython=True, error_model='numpy')
+def _i_from_v_element(V, IL, I0, Rs, Gsh, a):
+    """
+    Current and its first and second derivatives with respect to voltage.
+    """
+    if Rs == 0.:
+        # explicit solution
+        ex = np.exp(V / a)
+        i = IL - I0 * np.expm1(V / a) - Gsh * V
+        return i, -I0 * ex / a - Gsh, -I0 * ex / a**2
+    if not Rs > 0.:
+        return np.nan, np.nan, np.nan
+    # Eqn. 2 in Jain and Kapoor, 2004, with the LambertW argument in log form
+    s = Rs * Gsh + 1.
+    logargW = np.log(Rs * I0 / (a * s)) + (Rs * (IL + I0) + V) / (a * s)
+    w = _lambertw_log(logargW)
+    i = (IL + I0 - V * Gsh) / s - (a / Rs) * w
+    di = -Gsh / s - w / (Rs * s * (1. + w))
+    d2i = -w / (a * (Rs * s**2) * (1. + w)**3)
+    return i, di, d2i
+
+
+@_numba.jcompile('float64(float64, float64, float64, float64, float64,'
+                 ' float64)', nopython=True, error_model='numpy')
+def _v_from_i_element(I, IL, I0, Rs, Gsh, a):                 # noqa: E741
+    if Gsh == 0.:
+        # explicit solution
+        return a * np.log1p((IL - I) / I0) - I * Rs
+    if not Gsh > 0.:
+        return np.nan
+    # Eqn. 3 in Jain and Kapoor, 2004, with the LambertW argument in log form
+    logargW = (np.log(I0) - np.log(Gsh) - np.log(a) +
+               (-I + IL + I0) / (Gsh * a))
+    w = _lambertw_log(logargW)
+    return (IL + I0 - I) / Gsh - I * Rs - a * w
+
+
+@_numba.jcompile('float64(float64, float64, float64, float64, float64,'
+                 ' float64)', nopython=True, error_model='numpy')
+def _v_mp_element(v_oc, IL, I0, Rs, Gsh, a):
+    """
+    Voltage where dP/dV = 0 between 0 and v_oc by Newton's method
+    safeguarded with bisection.
+    """
+    if np.isnan(v_oc):
+        return np.nan
+    if v_oc <= 0.:
+        return 0.
+    lower = 0.
+    upper = v_oc
+    # P(V) is concave, so iterates from v_oc approach v_mp from above
+    v = v_oc
+    for _ in range(100):
+        i, di, d2i = _i_from_v_element(v, IL, I0, Rs, Gsh, a)
+        f = i + v * di
+        if f > 0.:
+            lower = v
+        else:
+            upper = v
+        v_new = v - f / (2. * di + v * d2i)
+        if not lower <= v_new <= upper:
+            v_new = 0.5 * (lower + upper)
+        if abs(v_new - v) <= 4e-16 * v_oc:
+            return v_new
+        v = v_new
+    return v
+
+
+@_numba.jcompile('void(float64[:], float64[:], float64[:], float64[:],'
+                 ' float64[:], float64[:], float64[:])', nopython=True,
+                 parallel=True, error_model='numpy')
+def _i_from_v_loop(V, IL, I0, Rs, Gsh, a, out):
+    for n in _numba.prange(out.shape[0]):
+        out[n] = _i_from_v_element(V[n], IL[n], I0[n], Rs[n], Gsh[n],
+                                   a[n])[0]
+
+
+@_numba.jcompile('void(float64[:], float64[:], float64[:], float64[:],'
+                 ' float64[:], float64[:], float64[:])', nopython=True,
+                 parallel=True, error_model='numpy')
+def _v_from_i_loop(I, IL, I0, Rs, Gsh, a, out):               # noqa: E741
+    for n in _numba.prange(out.shape[0]):
+        out[n] = _v_from_i_element(I[n], IL[n], I0[n], Rs[n], Gsh[n], a[n])
+
+
+@_numba.jcompile('void(float64[:], float64[:], float64[:], float64[:],'
+                 ' float64[:], float64[:, :])', nopython=True, parallel=True,
+                 error_model='numpy')
+def _singlediode_loop(IL, I0, Rs, Gsh, a, out):
+    for n in _numba.prange(out.shape[1]):
+        i_sc = _i_from_v_element(0., IL[n], I0[n], Rs[n], Gsh[n], a[n])[0]
+        v_oc = _v_from_i_element(0., IL[n], I0[n], Rs[n], Gsh[n], a[n])
+        # Set small elements <0 in v_oc to 0
+        if -1e-12 < v_oc < 0.:
+            v_oc = 0.
+        v_mp = _v_mp_element(v_oc, IL[n], I0[n], Rs[n], Gsh[n], a[n])
+        i_mp = _i_from_v_element(v_mp, IL[n], I0[n], Rs[n], Gsh[n], a[n])[0]
+        i_x = _i_from_v_element(0.5 * v_oc, IL[n], I0[n], Rs[n], Gsh[n],
+                                a[n])[0]
+        i_xx = _i_from_v_element(0.5 * (v_oc + v_mp), IL[n], I0[n], Rs[n],
+                                 Gsh[n], a[n])[0]
+        out[0, n] = i_sc
+        out[1, n] = v_oc
+        out[2, n] = i_mp
+        out[3, n] = v_mp
+        out[4, n] = v_mp * i_mp
+        out[5, n] = i_x
+        out[6, n] = i_xx
+
+
+def _compiled_inputs(*args):
+    # broadcast inputs and make contiguous, writable float64 copies that
+    # match the signatures of the compiled loops
+    arrays = np.broadcast_arrays(*args)
+    shape = arrays[0].shape
+    arrays = [np.array(x, dtype=np.float64).ravel() for x in arrays]
+    return shape, arrays
+
+
+def _lambertw_compiled(loop, x, photocurrent, saturation_current,
+                       resistance_series, resistance_shunt, nNsVth):
+    # Record if inputs were all scalar
+    output_is_scalar = all(map(np.isscalar,
+                               (x, photocurrent, saturation_current,
+                                resistance_series, resistance_shunt, nNsVth)))
+    shape, args = _compiled_inputs(x, photocurrent, saturation_current,
+                                   resistance_series, 1. / resistance_shunt,
+                                   nNsVth)
+    out = np.empty(args[0].size)
+    loop(*args, out)
+    if output_is_scalar:
+        return out.item()
+    return out.reshape(shape)
@@ -10,6 +10,9 @@ Calculate the solar position using a variety of methods/packages.
 
 import os
 import datetime as dt
+import hashlib
+import threading
+from collections import OrderedDict
 try:
     from importlib import reload
 except ImportError:
@@ -20,7 +23,6 @@ except ImportError:
 
 import numpy as np
 import pandas as pd
-import scipy.optimize as so
 import warnings
 
 from pvlib import atmosphere, tools
@@ -63,6 +65,10 @@ def get_solarposition(time, latitude, longitude,
         described in [1], but also compiles the code first:
         :py:func:`spa_python`
 
+        'nrel_interp' interpolates the NREL SPA algorithm evaluated on a
+        coarse time grid, which is faster for high resolution time series:
+        :py:func:`spa_python_interp`
+
         'pyephem' uses the PyEphem package: :py:func:`pyephem`
 
         'ephemeris' uses the pvlib ephemeris code: :py:func:`ephemeris`
@@ -111,6 +117,9 @@ def get_solarposition(time, latitude, longitude,
         ephem_df = spa_python(time, latitude, longitude, altitude,
                               pressure, temperature,
                               how='numpy', **kwargs)
+    elif method == 'nrel_interp':
+        ephem_df = spa_python_interp(time, latitude, longitude, altitude,
+                                     pressure, temperature, **kwargs)
     elif method == 'pyephem':
         ephem_df = pyephem(time, latitude, longitude,
                            altitude=altitude,
@@ -278,9 +287,68 @@ def _datetime_to_unixtime(dtindex):
     return np.array((dtindex - epoch) / pd.Timedelta("1s"))
 
 
+# upper bound in bytes on the memory held by the cache of time-only SPA terms
+SPA_CACHE_MAXSIZE = 256 * 2**20
+
+_spa_cache = OrderedDict()
+_spa_cache_lock = threading.Lock()
+
+
+def clear_spa_cache():
+    """
+    Remove all entries from the cache of time-only SPA terms used by
+    :py:func:`spa_python` and :py:func:`spa_python_sites` when
+    ``cache=True``.
+    """
+    with _spa_cache_lock:
+        _spa_cache.clear()
+
+
+def _spa_cache_key(unixtime, delta_t):
+    key = hashlib.blake2b(digest_size=16)
+    for arr in (unixtime, delta_t):
+        arr = np.ascontiguousarray(arr, dtype=np.float64)
+        key.update(str(arr.shape).encode())
+        key.update(arr.data)
+    return key.digest()
+
+
+def _spa_geocentric_terms(spa, unixtime, delta_t, cache):
+    """
+    Get the time-only SPA terms, using the LRU cache if ``cache`` is True.
+    The cache holds at most ``SPA_CACHE_MAXSIZE`` bytes, evicting the least
+    recently used entries first.
+    """
+    if not cache:
+        return spa.geocentric_solar_position(unixtime, delta_t)
+
+    key = _spa_cache_key(unixtime, delta_t)
+    with _spa_cache_lock:
+        terms = _spa_cache.get(key)
+        if terms is not None:
+            _spa_cache.move_to_end(key)
+            return terms
+
+    terms = tuple(np.broadcast_to(term, unixtime.shape).copy()
+                  for term in spa.geocentric_solar_position(unixtime, delta_t))
+    for term in terms:
+        term.flags.writeable = False
+    nbytes = sum(term.nbytes for term in terms)
+
+    with _spa_cache_lock:
+        if nbytes <= SPA_CACHE_MAXSIZE:
+            _spa_cache[key] = terms
+            total = sum(sum(t.nbytes for t in value)
+                        for value in _spa_cache.values())
+            while total > SPA_CACHE_MAXSIZE:
+                _, evicted = _spa_cache.popitem(last=False)
+                total -= sum(t.nbytes for t in evicted)
+    return terms
+
+
 def spa_python(time, latitude, longitude,
                altitude=0., pressure=101325., temperature=12., delta_t=67.0,
-               atmos_refract=None, how='numpy', numthreads=4):
+               atmos_refract=None, how='numpy', numthreads=4, cache=False):
     """
     Calculate the solar position using a python implementation of the
     NREL SPA algorithm.
@@ -296,17 +364,18 @@ def spa_python(time, latitude, longitude,
     ----------
     time : pandas.DatetimeIndex
         Must be localized or UTC will be assumed.
-    latitude : float
+    latitude : float or array-like
         Latitude in decimal degrees. Positive north of equator, negative
-        to south.
-    longitude : float
+        to south. An array must have the same length as ``time``.
+    longitude : float or array-like
         Longitude in decimal degrees. Positive east of prime meridian,
-        negative to west.
-    altitude : float, default 0.0
-        Distance above sea level.
-    pressure : int or float, optional, default 101325.0
+        negative to west. An array must have the same length as ``time``.
+    altitude : float or array-like, default 0.0
+        Distance above sea level. An array must have the same length as
+        ``time``.
+    pressure : int, float or array-like, optional, default 101325.0
         avg. yearly air pressure in Pascals.
-    temperature : int or float, optional, default 12.0
+    temperature : int, float or array-like, optional, default 12.0
         avg. yearly air temperature in degrees C.
     delta_t : float or array, optional, default 67.0
         Difference between terrestrial time and UT1.
@@ -320,9 +389,16 @@ def spa_python(time, latitude, longitude,
     how : str, optional, default 'numpy'
         Options are 'numpy' or 'numba'. If numba >= 0.17.0
         is installed, how='numba' will compile the spa functions
-        to machine code and run them multithreaded.
+        to machine code and run them in parallel.
     numthreads : int, optional, default 4
         Number of threads to use if how == 'numba'.
+    cache : bool, default False
+        If True, keep the terms of the algorithm that depend only on
+        ``time`` and ``delta_t`` in an in-memory least recently used cache,
+        so that later calls with the same times, e.g. for other locations,
+        skip most of the calculation. The cache size is limited to
+        ``pvlib.solarposition.SPA_CACHE_MAXSIZE`` bytes and can be emptied
+        with :py:func:`clear_spa_cache`. Requires ``how='numpy'``.
 
     Returns
     -------
@@ -355,10 +431,11 @@ def spa_python(time, latitude, longitude,
 
     # Added by Tony Lorenzo (@alorenzo175), University of Arizona, 2015
 
-    lat = latitude
-    lon = longitude
-    elev = altitude
-    pressure = pressure / 100  # pressure must be in millibars for calculation
+    lat = np.asarray(latitude)
+    lon = np.asarray(longitude)
+    elev = np.asarray(altitude)
+    pressure = np.asarray(pressure) / 100  # pressure must be in millibars
+    temperature = np.asarray(temperature)
 
     atmos_refract = atmos_refract or 0.5667
 
@@ -368,6 +445,9 @@ def spa_python(time, latitude, longitude,
         except (TypeError, ValueError):
             time = pd.DatetimeIndex([time, ])
 
+    if cache and how != 'numpy':
+        raise ValueError("cache=True requires how='numpy'")
+
     unixtime = _datetime_to_unixtime(time)
 
     spa = _spa_python_import(how)
@@ -376,9 +456,17 @@ def spa_python(time, latitude, longitude,
         time_utc = tools._pandas_to_utc(time)
         delta_t = spa.calculate_deltat(time_utc.year, time_utc.month)
 
-    app_zenith, zenith, app_elevation, elevation, azimuth, eot = \
-        spa.solar_position(unixtime, lat, lon, elev, pressure, temperature,
-                           delta_t, atmos_refract, numthreads)
+    if cache:
+        geocentric = _spa_geocentric_terms(spa, unixtime, delta_t, cache)
+        app_zenith, zenith, app_elevation, elevation, azimuth, eot = \
+            spa.topocentric_solar_position(*geocentric, lat, lon, elev,
+                                           pressure, temperature,
+                                           atmos_refract)
+    else:
+        app_zenith, zenith, app_elevation, elevation, azimuth, eot = \
+            spa.solar_position(unixtime, lat, lon, elev, pressure,
+                               temperature, delta_t, atmos_refract,
+                               numthreads)
 
     result = pd.DataFrame({'apparent_zenith': app_zenith, 'zenith': zenith,
                            'apparent_elevation': app_elevation,
@@ -389,6 +477,253 @@ def spa_python(time, latitude, longitude,
     return result
 
 
+def spa_python_sites(time, latitude, longitude, altitude=0.,
+                     pressure=101325., temperature=12., delta_t=67.0,
+                     atmos_refract=None, cache=False):
+    """
+    Calculate the solar position at many sites for a common set of times
+    using a python implementation of the NREL SPA algorithm.
+
+    The terms of the NREL SPA algorithm [1]_ that depend only on time
+    (Julian day, heliocentric position, nutation, obliquity, sidereal time
+    and geocentric sun position) are calculated once per timestamp and the
+    observer dependent parallax, refraction and topocentric terms are
+    broadcast across the sites. The result is the same as calling
+    :py:func:`spa_python` with ``how='numpy'`` for each site.
+
+    Parameters
+    ----------
+    time : pandas.DatetimeIndex
+        Must be localized or UTC will be assumed.
+    latitude : array-like
+        Latitude of each site in decimal degrees. Positive north of equator,
+        negative to south. If a pandas.Series, its index is used to label
+        the sites.
+    longitude : float or array-like
+        Longitude of each site in decimal degrees. Positive east of prime
+        meridian, negative to west.
+    altitude : float or array-like, default 0.0
+        Distance above sea level of each site.
+    pressure : float or array-like, default 101325.0
+        avg. yearly air pressure at each site in Pascals.
+    temperature : float or array-like, default 12.0
+        avg. yearly air temperature at each site in degrees C.
+    delta_t : float or array, optional, default 67.0
+        Difference between terrestrial time and UT1.
+        If delta_t is None, uses spa.calculate_deltat
+        using time.year and time.month from pandas.DatetimeIndex.
+        For most simulations the default delta_t is sufficient.
+    atmos_refract : float, optional
+        The approximate atmospheric refraction (in degrees)
+        at sunrise and sunset.
+    cache : bool, default False
+        If True, cache the time-only terms between calls.
+        See :py:func:`spa_python`.
+
+    Returns
+    -------
+    DataFrame
+        Indexed by ``time``, with two column levels. The first level has
+        the same quantities as :py:func:`spa_python`: apparent_zenith,
+        zenith, apparent_elevation, elevation, azimuth and equation_of_time.
+        The second level, named ``site``, labels the sites, so that e.g.
+        ``result['zenith']`` is a DataFrame with one column per site.
+
+    References
+    ----------
+    .. [1] I. Reda and A. Andreas, Solar position algorithm for solar
+       radiation applications. Solar Energy, vol. 76, no. 5, pp. 577-589, 2004.
+
+    See also
+    --------
+    spa_python
+    """
+    if isinstance(latitude, pd.Series):
+        sites = latitude.index
+    else:
+        sites = pd.RangeIndex(np.size(latitude))
+    sites = sites.rename('site')
+    nsites = len(sites)
+
+    # one row per site so that the site parameters broadcast along time
+    lat, lon, elev, pressure, temperature = (
+        np.broadcast_to(np.asarray(arg, dtype=float).ravel(),
+                        (nsites,))[:, np.newaxis]
+        for arg in (latitude, longitude, altitude, pressure, temperature))
+    pressure = pressure / 100  # pressure must be in millibars for calculation
+
+    atmos_refract = atmos_refract or 0.5667
+
+    if not isinstance(time, pd.DatetimeIndex):
+        try:
+            time = pd.DatetimeIndex(time)
+        except (TypeError, ValueError):
+            time = pd.DatetimeIndex([time, ])
+
+    unixtime = _datetime_to_unixtime(time)
+
+    spa = _spa_python_import('numpy')
+
+    if delta_t is None:
+        time_utc = tools._pandas_to_utc(time)
+        delta_t = spa.calculate_deltat(time_utc.year, time_utc.month)
+
+    geocentric = _spa_geocentric_terms(spa, unixtime, delta_t, cache)
+    result = spa.topocentric_solar_position(*geocentric, lat, lon, elev,
+                                            pressure, temperature,
+                                            atmos_refract)
+    app_zenith, zenith, app_elevation, elevation, azimuth, eot = result
+
+    names = ['apparent_zenith', 'zenith', 'apparent_elevation', 'elevation',
+             'azimuth', 'equation_of_time']
+    shape = (nsites, len(time))
+    values = np.concatenate([
+        np.broadcast_to(arr, shape) for arr in
+        (app_zenith, zenith, app_elevation, elevation, azimuth, eot)
+    ]).T
+    columns = pd.MultiIndex.from_product([names, sites])
+    return pd.DataFrame(values, index=time, columns=columns)
+
+
+def spa_python_interp(time, latitude, longitude, altitude=0.,
+                      pressure=101325., temperature=12., delta_t=67.0,
+                      atmos_refract=None, how='numpy', numthreads=4,
+                      step='10min'):
+    """
+    Calculate the solar position by interpolating the NREL SPA algorithm
+    evaluated on a coarse time grid.
+
+    :py:func:`spa_python` is evaluated at multiples of ``step`` spanning
+    ``time``. The sun's geometric (no atmosphere) direction, as a unit
+    vector, and the equation of time are interpolated to ``time`` with
+    cubic splines. Interpolating the direction vector instead of the
+    angles avoids the azimuth wrap-around at north and the loss of
+    accuracy near zenith. Atmospheric refraction is then calculated at
+    each of ``time`` from the interpolated elevation, so that the apparent
+    position around sunrise and sunset is the same as with
+    :py:func:`spa_python`.
+
+    For series with a resolution finer than ``step`` this is much faster
+    than :py:func:`spa_python`. If ``time`` has fewer values than the
+    coarse grid, :py:func:`spa_python` is used directly.
+
+    Parameters
+    ----------
+    time : pandas.DatetimeIndex
+        Must be localized or UTC will be assumed.
+    latitude : float
+        Latitude in decimal degrees. Positive north of equator, negative
+        to south.
+    longitude : float
+        Longitude in decimal degrees. Positive east of prime meridian,
+        negative to west.
+    altitude : float, default 0.0
+        Distance above sea level.
+    pressure : int, float or array-like, optional, default 101325.0
+        avg. yearly air pressure in Pascals.
+    temperature : int, float or array-like, optional, default 12.0
+        avg. yearly air temperature in degrees C.
+    delta_t : float or array, optional, default 67.0
+        Difference between terrestrial time and UT1.
+        If delta_t is None, uses spa.calculate_deltat
+        using the year and month of the coarse time grid.
+    atmos_refract : float, optional
+        The approximate atmospheric refraction (in degrees)
+        at sunrise and sunset.
+    how : str, optional, default 'numpy'
+        Passed to :py:func:`spa_python` for the coarse grid.
+    numthreads : int, optional, default 4
+        Passed to :py:func:`spa_python` for the coarse grid.
+    step : str or pandas.Timedelta, default '10min'
+        Spacing of the coarse time grid.
+
+    Returns
+    -------
+    DataFrame
+        The DataFrame will have the following columns:
+        apparent_zenith (degrees),
+        zenith (degrees),
+        apparent_elevation (degrees),
+        elevation (degrees),
+        azimuth (degrees),
+        equation_of_time (minutes).
+
+    Notes
+    -----
+    With ``step`` of 15 minutes or less, zenith, elevation and their
+    apparent counterparts differ from :py:func:`spa_python` by less than
+    1e-5 degrees and the equation of time by less than 1e-6 minutes. The
+    azimuth error is less than 1e-5 degrees divided by the sine of the
+    zenith angle, so it can be larger when the sun is within a fraction of
+    a degree of zenith, where azimuth is poorly defined. The error grows
+    with the fourth power of ``step``.
+
+    See also
+    --------
+    spa_python, get_solarposition
+    """
+    if not isinstance(time, pd.DatetimeIndex):
+        try:
+            time = pd.DatetimeIndex(time)
+        except (TypeError, ValueError):
+            time = pd.DatetimeIndex([time, ])
+
+    unixtime = _datetime_to_unixtime(time)
+    step = pd.Timedelta(step).total_seconds()
+
+    if len(unixtime):
+        # one extra grid point on each side keeps the splines away from
+        # their less accurate end intervals
+        start = np.floor(np.min(unixtime) / step) * step - step
+        end = np.ceil(np.max(unixtime) / step) * step + step
+        grid = np.arange(start, end + step / 2, step)
+    if not len(unixtime) or len(grid) >= len(unixtime):
+        return spa_python(time, latitude, longitude, altitude, pressure,
+                          temperature, delta_t, atmos_refract, how=how,
+                          numthreads=numthreads)
+
+    if np.ndim(delta_t) > 0:
+        order = np.argsort(unixtime)
+        delta_t = np.interp(grid, unixtime[order],
+                            np.asarray(delta_t, dtype=float)[order])
+
+    grid_time = pd.to_datetime(grid, unit='s', utc=True)
+    coarse = spa_python(grid_time, latitude, longitude, altitude,
+                        delta_t=delta_t, atmos_refract=atmos_refract,
+                        how=how, numthreads=numthreads)
+
+    zenith = np.radians(coarse['zenith'].values)
+    azimuth = np.radians(coarse['azimuth'].values)
+    components = np.stack([np.sin(zenith) * np.sin(azimuth),
+                           np.sin(zenith) * np.cos(azimuth),
+                           np.cos(zenith),
+                           coarse['equation_of_time'].values], axis=1)
+    from scipy.interpolate import CubicSpline
+    spline = CubicSpline(grid - start, components, axis=0)
+    east, north, up, eot = spline(unixtime - start).T
+
+    elevation = np.degrees(np.arctan2(up, np.hypot(east, north)))
+    azimuth = np.degrees(np.arctan2(east, north)) % 360
+
+    from pvlib import spa
+    # use the numpy version of the refraction correction, even if the spa
+    # module was compiled with numba for the coarse grid
+    refraction = getattr(spa.atmospheric_refraction_correction, 'py_func',
+                         spa.atmospheric_refraction_correction)
+    app_elevation = elevation + refraction(
+        np.asarray(pressure) / 100, np.asarray(temperature), elevation,
+        atmos_refract or 0.5667)
+
+    result = pd.DataFrame({'apparent_zenith': 90 - app_elevation,
+                           'zenith': 90 - elevation,
+                           'apparent_elevation': app_elevation,
+                           'elevation': elevation, 'azimuth': azimuth,
+                           'equation_of_time': eot},
+                          index=time)
+
+    return result
+
+
 def sun_rise_set_transit_spa(times, latitude, longitude, how='numpy',
                              delta_t=67.0, numthreads=4):
     """
@@ -590,6 +925,179 @@ def sun_rise_set_transit_ephem(times, latitude, longitude,
                                            'transit': trans})
 
 
+def _spa_hour_angle_declination(spa, unixtime, latitude, longitude, altitude,
+                                delta_t):
+    # topocentric local hour angle and sun declination from the SPA
+    R, v, alpha, delta, _ = spa.geocentric_solar_position(unixtime, delta_t)
+    H = spa.local_hour_angle(v, longitude, alpha)
+    xi = spa.equatorial_horizontal_parallax(R)
+    u = spa.uterm(latitude)
+    x = spa.xterm(u, latitude, altitude)
+    y = spa.yterm(u, latitude, altitude)
+    delta_alpha = spa.parallax_sun_right_ascension(x, xi, H, delta)
+    delta_prime = spa.topocentric_sun_declination(delta, x, y, xi,
+                                                  delta_alpha, H)
+    H_prime = spa.topocentric_local_hour_angle(H, delta_alpha)
+    return H_prime, delta_prime
+
+
+def _spa_solve_hour_angle(spa, unixtime, latitude, longitude, altitude,
+                          delta_t, event, elevation=None, xtol=0.1,
+                          maxiter=10):
+    # Refine estimates of the time of solar transit (event=0), sunrise
+    # (event=-1) or sunset (event=1). At rise and set the sun's topocentric
+    # hour angle is -/+ H0, where cos(H0) is found from the topocentric
+    # declination and the target geometric elevation. The hour angle
+    # advances 360 degrees per day, which gives the Newton step.
+    sin_lat = np.sin(np.radians(latitude))
+    cos_lat = np.cos(np.radians(latitude))
+    for _ in range(maxiter):
+        H, delta = _spa_hour_angle_declination(spa, unixtime, latitude,
+                                               longitude, altitude, delta_t)
+        if event == 0:
+            target = 0.
+        else:
+            cos_arg = ((np.sin(np.radians(elevation))
+                        - sin_lat * np.sin(np.radians(delta)))
+                       / (cos_lat * np.cos(np.radians(delta))))
+            # no rise or set during polar day or night
+            cos_arg = np.where(np.abs(cos_arg) > 1, np.nan, cos_arg)
+            target = event * np.degrees(np.arccos(cos_arg))
+        step = ((H - target + 180) % 360 - 180) / 360 * 86400
+        unixtime = unixtime - step
+        if not np.nanmax(np.abs(step), initial=0) > xtol:
+            break
+    return unixtime
+
+
+def sun_rise_set_transit_iterative(times, latitude, longitude,
+                                   next_or_previous='next', altitude=0.,
+                                   horizon=0., atmos_refract=0.5667,
+                                   delta_t=67.0):
+    """
+    Calculate the next or previous sunrise, sunset and transit times using
+    the NREL SPA algorithm.
+
+    Sun positions are calculated for all ``times`` at once with the numpy
+    implementation of the NREL SPA algorithm [1]_ and the event times
+    are refined with a few vectorized Newton iterations on the sun's
+    topocentric hour angle. This gives the same columns and the same
+    ``next_or_previous`` behavior as :py:func:`sun_rise_set_transit_ephem`
+    without looping over ``times`` in python.
+
+    Sunrise and sunset are defined as the times when the upper limb of the
+    sun, assumed to be 0.26667 degrees from its center, has an apparent
+    elevation equal to ``horizon``, with ``atmos_refract`` degrees of
+    atmospheric refraction. With the defaults the center of the sun is
+    at a geometric elevation of -0.8333 degrees, as in
+    :py:func:`sun_rise_set_transit_spa`. Event times are converged to a
+    small fraction of a second and agree with the USNO and PyEphem to
+    within a minute.
+
+    Parameters
+    ----------
+    times : pandas.DatetimeIndex
+        Must be localized
+    latitude : float
+        Latitude in degrees, positive north of equator, negative to south
+    longitude : float
+        Longitude in degrees, positive east of prime meridian, negative to west
+    next_or_previous : str, default 'next'
+        'next' or 'previous' sunrise, sunset and transit relative to time
+    altitude : float, default 0.0
+        distance above sea level in meters.
+    horizon : float, default 0.0
+        Elevation of the horizon in degrees. [°]
+    atmos_refract : float, default 0.5667
+        The approximate atmospheric refraction (in degrees)
+        at sunrise and sunset.
+    delta_t : float or array, optional, default 67.0
+        Difference between terrestrial time and UT1.
+        If delta_t is None, uses spa.calculate_deltat
+        using times.year and times.month from pandas.DatetimeIndex.
+
+    Returns
+    -------
+    pandas.DataFrame
+        index is the same as input `times` argument
+        columns are 'sunrise', 'sunset', and 'transit'. Sunrise and sunset
+        are NaT where the sun does not rise or set within a day of the
+        transit, i.e. during polar day or night.
+
+    References
+    ----------
+    .. [1] I. Reda and A. Andreas, Solar position algorithm for solar
+       radiation applications. Solar Energy, vol. 76, no. 5, pp. 577-589, 2004.
+
+    See also
+    --------
+    sun_rise_set_transit_ephem, sun_rise_set_transit_spa
+    """
+    # times must be localized
+    if times.tz:
+        tzinfo = times.tz
+    else:
+        raise ValueError('times must be localized')
+
+    next_or_previous = next_or_previous.lower()
+    if next_or_previous not in ('next', 'previous'):
+        raise ValueError("next_or_previous must be either 'next' or" +
+                         " 'previous'")
+
+    spa = _spa_python_import('numpy')
+
+    times_utc = times.tz_convert('UTC')
+    if delta_t is None:
+        delta_t = spa.calculate_deltat(times_utc.year, times_utc.month)
+    delta_t = np.broadcast_to(np.asarray(delta_t, dtype=float),
+                              (len(times),))
+
+    unixtime = _datetime_to_unixtime(times_utc)
+    # geometric elevation of the sun's center at sunrise and sunset
+    elevation = horizon - 0.26667 - atmos_refract
+    args = (latitude, longitude, altitude)
+
+    def solve(estimate, event, mask=slice(None)):
+        return _spa_solve_hour_angle(spa, estimate, *args, delta_t[mask],
+                                     event, elevation)
+
+    # transits immediately before and after each time
+    H, _ = _spa_hour_angle_declination(spa, unixtime, *args, delta_t)
+    transit_before = solve(unixtime - H % 360 / 360 * 86400, 0)
+    transit_after = solve(transit_before + 86400, 0)
+
+    # sunrise precedes its transit and sunset follows it. Pick the
+    # closest event on the requested side of each time, falling back to
+    # the event of the adjacent day.
+    if next_or_previous == 'next':
+        transit = transit_after
+        sunrise = solve(transit_after - 21600, -1)
+        sunset = solve(transit_before + 21600, 1)
+        late_rise = ~(sunrise > unixtime)
+        sunrise[late_rise] = solve(transit_after[late_rise] + 64800, -1,
+                                   late_rise)
+        late_set = ~(sunset > unixtime)
+        sunset[late_set] = solve(transit_after[late_set] + 21600, 1,
+                                 late_set)
+    else:
+        transit = transit_before
+        sunrise = solve(transit_after - 21600, -1)
+        sunset = solve(transit_before + 21600, 1)
+        early_rise = ~(sunrise <= unixtime)
+        sunrise[early_rise] = solve(transit_before[early_rise] - 21600, -1,
+                                    early_rise)
+        early_set = ~(sunset <= unixtime)
+        sunset[early_set] = solve(transit_before[early_set] - 64800, 1,
+                                  early_set)
+
+    data = {}
+    for name, event in [('sunrise', sunrise), ('sunset', sunset),
+                        ('transit', transit)]:
+        data[name] = pd.to_datetime(event * 1e9, unit='ns', utc=True
+                                    ).tz_convert(tzinfo)
+    return pd.DataFrame(index=times, data=data)
+
+
 def pyephem(time, latitude, longitude, altitude=0., pressure=101325.,
             temperature=12., horizon='+0:00'):
     """
@@ -918,6 +1426,7 @@ def calc_time(lower_bound, upper_bound, latitude, longitude, attribute, value,
     lb = datetime_to_djd(lower_bound)
     ub = datetime_to_djd(upper_bound)
 
+    import scipy.optimize as so
     djd_root = so.brentq(compute_attr, lb, ub,
                          (value, attribute), xtol=xtol)
 
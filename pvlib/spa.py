@@ -6,8 +6,8 @@ numpy arrays or compiling the code to machine language with numba.
 # Contributors:
 # Created by Tony Lorenzo (@alorenzo175), Univ. of Arizona, 2015
 
+import contextlib
 import os
-import threading
 import warnings
 
 import numpy as np
@@ -21,17 +21,19 @@ def nocompile(*args, **kwargs):
 
 if os.getenv('PVLIB_USE_NUMBA', '0') != '0':
     try:
-        from numba import jit
+        from numba import jit, prange
     except ImportError:
         warnings.warn('Could not import numba, falling back to numpy ' +
                       'calculation')
         jcompile = nocompile
+        prange = range
         USE_NUMBA = False
     else:
         jcompile = jit
         USE_NUMBA = True
 else:
     jcompile = nocompile
+    prange = range
     USE_NUMBA = False
 
 
@@ -837,20 +839,29 @@ def equation_of_time(sun_mean_longitude, geocentric_sun_right_ascension,
     return E
 
 
-@jcompile('void(float64[:], float64[:], float64[:], float64[:,:])',
-          nopython=True, nogil=True)
-def solar_position_loop(unixtime, delta_t, loc_args, out):
-    """Loop through the time array and calculate the solar position"""
-    lat = loc_args[0]
-    lon = loc_args[1]
-    elev = loc_args[2]
-    pressure = loc_args[3]
-    temp = loc_args[4]
-    atmos_refract = loc_args[5]
-    sst = loc_args[6]
-    esd = loc_args[7]
-
-    for i in range(unixtime.shape[0]):
+@jcompile('void(float64[:], float64[:], float64[:, :], float64[:], '
+          'float64[:, :])', nopython=True, parallel=True)
+def solar_position_loop(unixtime, delta_t, loc_args, opt_args, out):
+    """Loop through the time array and calculate the solar position.
+
+    ``loc_args`` has rows latitude, longitude, elevation, pressure and
+    temperature, and either one column shared by every timestamp or one
+    column per timestamp. ``opt_args`` holds atmos_refract, sst and esd.
+    The loop is distributed across threads with ``numba.prange``.
+    """
+    atmos_refract = opt_args[0]
+    sst = opt_args[1]
+    esd = opt_args[2]
+    loc_step = 1 if loc_args.shape[1] > 1 else 0
+
+    for i in prange(unixtime.shape[0]):
+        # prange indices may be unsigned, keep the column index signed
+        j = np.int64(i) * loc_step
+        lat = loc_args[0, j]
+        lon = loc_args[1, j]
+        elev = loc_args[2, j]
+        pressure = loc_args[3, j]
+        temp = loc_args[4, j]
         utime = unixtime[i]
         dT = delta_t[i]
         jd = julian_day(utime)
@@ -916,20 +927,50 @@ def solar_position_loop(unixtime, delta_t, loc_args, out):
         out[5, i] = eot
 
 
+@contextlib.contextmanager
+def _numba_threads(numthreads):
+    """Temporarily set the number of threads used by numba parallel loops"""
+    if not USE_NUMBA:
+        yield
+        return
+    import numba
+    previous = numba.get_num_threads()
+    numba.set_num_threads(
+        max(1, min(int(numthreads), numba.config.NUMBA_NUM_THREADS)))
+    try:
+        yield
+    finally:
+        numba.set_num_threads(previous)
+
+
 def solar_position_numba(unixtime, lat, lon, elev, pressure, temp, delta_t,
                          atmos_refract, numthreads, sst=False, esd=False):
     """Calculate the solar position using the numba compiled functions
-    and multiple threads. Very slow if functions are not numba compiled.
+    in parallel across ``numthreads`` threads. Very slow if functions are
+    not numba compiled.
+
+    ``lat``, ``lon``, ``elev``, ``pressure`` and ``temp`` may each be
+    scalars or arrays with the same length as ``unixtime``.
     """
-    # these args are the same for each thread
-    loc_args = np.array([lat, lon, elev, pressure, temp,
-                         atmos_refract, sst, esd], dtype=np.float64)
+    unixtime = np.asarray(unixtime, dtype=np.float64)
+    ulength = unixtime.shape[0]
+
+    # location parameters are either shared by all timestamps
+    # (one column) or given for each timestamp (ulength columns)
+    loc = [np.asarray(arg, dtype=np.float64)
+           for arg in (lat, lon, elev, pressure, temp)]
+    if all(arg.size == 1 for arg in loc):
+        loc_args = np.array([arg.item() for arg in loc]).reshape(5, 1)
+    else:
+        loc_args = np.empty((5, ulength), dtype=np.float64)
+        for row, arg in zip(loc_args, loc):
+            row[:] = np.broadcast_to(arg.ravel(), (ulength,))
+    opt_args = np.array([atmos_refract, sst, esd], dtype=np.float64)
 
     # turn delta_t into an array if it isn't already
     delta_t = np.full_like(unixtime, delta_t, dtype=np.float64)
 
     # construct dims x ulength array to put the results in
-    ulength = unixtime.shape[0]
     if sst:
         dims = 3
     elif esd:
@@ -938,31 +979,8 @@ def solar_position_numba(unixtime, lat, lon, elev, pressure, temp, delta_t,
         dims = 6
     result = np.empty((dims, ulength), dtype=np.float64)
 
-    if unixtime.dtype != np.float64:
-        unixtime = unixtime.astype(np.float64)
-
-    if ulength < numthreads:
-        numthreads = ulength
-
-    if numthreads <= 1:
-        solar_position_loop(unixtime, delta_t, loc_args, result)
-        return result
-
-    # split the input and output arrays into numthreads chunks
-    split0 = np.array_split(unixtime, numthreads)
-    split1 = np.array_split(delta_t, numthreads)
-    split2 = np.array_split(result, numthreads, axis=1)
-    chunks = [
-        [a0, a1, loc_args, a2]
-        for a0, a1, a2 in zip(split0, split1, split2)
-    ]
-    # Spawn one thread per chunk
-    threads = [threading.Thread(target=solar_position_loop, args=chunk)
-               for chunk in chunks]
-    for thread in threads:
-        thread.start()
-    for thread in threads:
-        thread.join()
+    with _numba_threads(numthreads):
+        solar_position_loop(unixtime, delta_t, loc_args, opt_args, result)
     return result
 
 
@@ -972,15 +990,45 @@ def solar_position_numpy(unixtime, lat, lon, elev, pressure, temp, delta_t,
     this function will not work if the solar position functions were
     compiled with numba.
     """
+    if esd:
+        jd = julian_day(unixtime)
+        jde = julian_ephemeris_day(jd, delta_t)
+        jce = julian_ephemeris_century(jde)
+        jme = julian_ephemeris_millennium(jce)
+        return (heliocentric_radius_vector(jme), )
+    R, v, alpha, delta, eot = geocentric_solar_position(unixtime, delta_t)
+    if sst:
+        return v, alpha, delta
+    return topocentric_solar_position(R, v, alpha, delta, eot, lat, lon,
+                                      elev, pressure, temp, atmos_refract)
 
+
+def geocentric_solar_position(unixtime, delta_t):
+    """Calculate the parts of the solar position that only depend on time.
+
+    These are the terms of the SPA algorithm that do not depend on the
+    observer location. Note this function will not work if the solar
+    position functions were compiled with numba.
+
+    Parameters
+    ----------
+    unixtime : numpy array
+        Array of unix/epoch timestamps.
+    delta_t : float or array
+        Difference between terrestrial time and UT1.
+
+    Returns
+    -------
+    tuple : (earth_radius_vector, apparent_sidereal_time,
+        geocentric_sun_right_ascension, geocentric_sun_declination,
+        equation_of_time)
+    """
     jd = julian_day(unixtime)
     jde = julian_ephemeris_day(jd, delta_t)
     jc = julian_century(jd)
     jce = julian_ephemeris_century(jde)
     jme = julian_ephemeris_millennium(jce)
     R = heliocentric_radius_vector(jme)
-    if esd:
-        return (R, )
     L = heliocentric_longitude(jme)
     B = heliocentric_latitude(jme)
     Theta = geocentric_longitude(L)
@@ -1002,10 +1050,32 @@ def solar_position_numpy(unixtime, lat, lon, elev, pressure, temp, delta_t,
     v = apparent_sidereal_time(v0, delta_psi, epsilon)
     alpha = geocentric_sun_right_ascension(lamd, epsilon, beta)
     delta = geocentric_sun_declination(lamd, epsilon, beta)
-    if sst:
-        return v, alpha, delta
     m = sun_mean_longitude(jme)
     eot = equation_of_time(m, alpha, delta_psi, epsilon)
+    return R, v, alpha, delta, eot
+
+
+def topocentric_solar_position(earth_radius_vector, apparent_sidereal_time,
+                               geocentric_sun_right_ascension,
+                               geocentric_sun_declination, equation_of_time,
+                               lat, lon, elev, pressure, temp, atmos_refract):
+    """Calculate the observer dependent part of the solar position.
+
+    Takes the output of :py:func:`geocentric_solar_position` and follows
+    normal numpy broadcasting rules, so location arrays of shape
+    ``(nsites, 1)`` give results of shape ``(nsites, ntimes)``. Note this
+    function will not work if the solar position functions were compiled
+    with numba.
+
+    Returns
+    -------
+    tuple : (apparent zenith, zenith, apparent_elevation, elevation,
+        azimuth, equation_of_time)
+    """
+    R = earth_radius_vector
+    v = apparent_sidereal_time
+    alpha = geocentric_sun_right_ascension
+    delta = geocentric_sun_declination
     H = local_hour_angle(v, lon, alpha)
     xi = equatorial_horizontal_parallax(R)
     u = uterm(lat)
@@ -1023,6 +1093,7 @@ def solar_position_numpy(unixtime, lat, lon, elev, pressure, temp, delta_t,
     theta0 = topocentric_zenith_angle(e0)
     gamma = topocentric_astronomers_azimuth(H_prime, delta_prime, lat)
     phi = topocentric_azimuth_angle(gamma)
+    eot = np.broadcast_to(equation_of_time, np.shape(theta))
     return theta, theta0, e, e0, phi, eot
 
 
@@ -1043,16 +1114,19 @@ def solar_position(unixtime, lat, lon, elev, pressure, temp, delta_t,
         Array of unix/epoch timestamps to calculate solar position for.
         Unixtime is the number of seconds since Jan. 1, 1970 00:00:00 UTC.
         A pandas.DatetimeIndex is easily converted using .view(np.int64)/10**9
-    lat : float
-        Latitude to calculate solar position for
-    lon : float
-        Longitude to calculate solar position for
-    elev : float
-        Elevation of location in meters
-    pressure : int or float
+    lat : float or array
+        Latitude to calculate solar position for. An array must have
+        the same length as ``unixtime``.
+    lon : float or array
+        Longitude to calculate solar position for. An array must have
+        the same length as ``unixtime``.
+    elev : float or array
+        Elevation of location in meters. An array must have
+        the same length as ``unixtime``.
+    pressure : int, float or array
         avg. yearly pressure at location in millibars;
         used for atmospheric correction
-    temp : int or float
+    temp : int, float or array
         avg. yearly temperature at location in
         degrees C; used for atmospheric correction
     delta_t : float or array
@@ -1061,8 +1135,8 @@ def solar_position(unixtime, lat, lon, elev, pressure, temp, delta_t,
         The approximate atmospheric refraction (in degrees)
         at sunrise and sunset.
     numthreads: int, optional, default 8
-        Number of threads to use for computation if numba>=0.17
-        is installed.
+        Number of threads used by the numba parallel loop if numba>=0.17
+        is installed. Limited to ``numba.config.NUMBA_NUM_THREADS``.
     sst : bool, default False
         If True, return only data needed for sunrise, sunset, and transit
         calculations.
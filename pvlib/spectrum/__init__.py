@@ -1,19 +1,40 @@
+import importlib
+
+# spectrl2 is imported eagerly because the function and its submodule share
+# a name, and importing the submodule later would replace the function
 from pvlib.spectrum.spectrl2 import spectrl2  # noqa: F401
-from pvlib.spectrum.mismatch import (  # noqa: F401
-    calc_spectral_mismatch_field,
-    spectral_factor_caballero,
-    spectral_factor_firstsolar,
-    spectral_factor_sapm,
-    spectral_factor_pvspec,
-    spectral_factor_jrc,
-)
-from pvlib.spectrum.irradiance import (  # noqa: F401
-    get_am15g,
-    get_reference_spectra,
-    average_photon_energy,
-)
-from pvlib.spectrum.response import (  # noqa: F401
-    get_example_spectral_response,
-    sr_to_qe,
-    qe_to_sr,
-)
+
+# maps the other public functions to the submodules that define them. They
+# are imported when first accessed (PEP 562)
+_functions = {
+    'calc_spectral_mismatch_field': 'mismatch',
+    'spectral_factor_caballero': 'mismatch',
+    'spectral_factor_firstsolar': 'mismatch',
+    'spectral_factor_sapm': 'mismatch',
+    'spectral_factor_pvspec': 'mismatch',
+    'spectral_factor_jrc': 'mismatch',
+    'get_am15g': 'irradiance',
+    'get_reference_spectra': 'irradiance',
+    'average_photon_energy': 'irradiance',
+    'get_example_spectral_response': 'response',
+    'sr_to_qe': 'response',
+    'qe_to_sr': 'response',
+}
+
+_submodules = ['irradiance', 'mismatch', 'response']
+
+__all__ = ['spectrl2'] + list(_functions)
+
+
+def __getattr__(name):
+    if name in _functions:
+        module = importlib.import_module(f'{__name__}.{_functions[name]}')
+        globals()[name] = getattr(module, name)
+        return globals()[name]
+    if name in _submodules:
+        return importlib.import_module(f'{__name__}.{name}')
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__) | set(_submodules))
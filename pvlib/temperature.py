@@ -3,8 +3,11 @@ The ``temperature`` module contains functions for modeling temperature of
 PV modules and cells.
 """
 
+import math
+
 import numpy as np
 import pandas as pd
+from pvlib import _numba
 from pvlib.tools import sind
 from pvlib._deprecation import warn_deprecated
 from pvlib.tools import _get_sample_intervals
@@ -695,7 +698,8 @@ def _hydraulic_diameter(width, height):
 
 def fuentes(poa_global, temp_air, wind_speed, noct_installed, module_height=5,
             wind_height=9.144, emissivity=0.84, absorption=0.83,
-            surface_tilt=30, module_width=0.31579, module_length=1.2):
+            surface_tilt=30, module_width=0.31579, module_length=1.2,
+            tol=1e-6):
     """
     Calculate cell or module temperature using the Fuentes model.
 
@@ -704,54 +708,63 @@ def fuentes(poa_global, temp_air, wind_speed, noct_installed, module_height=5,
 
     Parameters
     ----------
-    poa_global : pandas Series
-        Total incident irradiance [W/m^2]
+    poa_global : pandas Series or DataFrame
+        Total incident irradiance. A DataFrame models one independent
+        array or site per column. [W/m^2]
 
-    temp_air : pandas Series
-        Ambient dry bulb temperature [C]
+    temp_air : pandas Series or DataFrame
+        Ambient dry bulb temperature. A Series is applied to every column
+        of ``poa_global``. [C]
 
-    wind_speed : pandas Series
-        Wind speed [m/s]
+    wind_speed : pandas Series or DataFrame
+        Wind speed. A Series is applied to every column of ``poa_global``.
+        [m/s]
 
-    noct_installed : float
+    noct_installed : float or array-like
         The "installed" nominal operating cell temperature as defined in [1]_.
         PVWatts assumes this value to be 45 C for rack-mounted arrays and
         49 C for roof mount systems with restricted air flow around the
         module.  [C]
 
-    module_height : float, default 5.0
+    module_height : float or array-like, default 5.0
         The height above ground of the center of the module. The PVWatts
         default is 5.0 [m]
 
-    wind_height : float, default 9.144
+    wind_height : float or array-like, default 9.144
         The height above ground at which ``wind_speed`` is measured. The
         PVWatts default is 9.144 [m]
 
-    emissivity : float, default 0.84
+    emissivity : float or array-like, default 0.84
         The effectiveness of the module at radiating thermal energy. [unitless]
 
-    absorption : float, default 0.83
+    absorption : float or array-like, default 0.83
         The fraction of incident irradiance that is converted to thermal
         energy in the module. [unitless]
 
-    surface_tilt : float, default 30
+    surface_tilt : float or array-like, default 30
         Module tilt from horizontal. If not provided, the default value
         of 30 degrees from [1]_ and [2]_ is used. [degrees]
 
-    module_width : float, default 0.31579
+    module_width : float or array-like, default 0.31579
         Module width. The default value of 0.31579 meters in combination with
         the default `module_length` gives a hydraulic diameter of 0.5 as
         assumed in [1]_ and [2]_. [m]
 
-    module_length : float, default 1.2
+    module_length : float or array-like, default 1.2
         Module length. The default value of 1.2 meters in combination with
         the default `module_width` gives a hydraulic diameter of 0.5 as
         assumed in [1]_ and [2]_. [m]
 
+    tol : float, default 1e-6
+        The heat balance is iterated for each timestep until the module
+        temperature changes by no more than ``tol``, or at most 10 times as
+        in [1]_. Use 0 to always iterate 10 times. [C]
+
     Returns
     -------
-    temperature_cell : pandas Series
-        The modeled cell temperature [C]
+    temperature_cell : pandas Series or DataFrame
+        The modeled cell temperature, a DataFrame if ``poa_global`` is a
+        DataFrame. [C]
 
     Notes
     -----
@@ -760,6 +773,13 @@ def fuentes(poa_global, temp_air, wind_speed, noct_installed, module_height=5,
     temperature equals ambient temperature when irradiance is zero so it can
     skip the heat balance calculation at night.
 
+    The parameters other than the weather inputs may be array-like with one
+    value per column of ``poa_global``. The heat balance is sequential in
+    time but independent between columns, so when the environment variable
+    ``PVLIB_USE_NUMBA`` is set to a value other than ``'0'`` when
+    :py:mod:`pvlib.temperature` is first imported and numba is installed,
+    it is compiled and the columns are calculated in parallel.
+
     References
     ----------
     .. [1] Fuentes, M. K., 1987, "A Simplifed Thermal Model for Flat-Plate
@@ -774,13 +794,14 @@ def fuentes(poa_global, temp_air, wind_speed, noct_installed, module_height=5,
     # nearly all variable names are kept the same for ease of comparison.
 
     boltz = 5.669e-8
-    emiss = emissivity
-    absorp = absorption
-    xlen = _hydraulic_diameter(module_width, module_length)
+    emiss = np.asarray(emissivity, dtype=float)
+    absorp = np.asarray(absorption, dtype=float)
+    xlen = _hydraulic_diameter(np.asarray(module_width, dtype=float),
+                               np.asarray(module_length, dtype=float))
     # cap0 has units of [J / (m^2 K)], equal to mass per unit area times
     # specific heat of the module.
     cap0 = 11000
-    tinoct = noct_installed + 273.15
+    tinoct = np.asarray(noct_installed, dtype=float) + 273.15
 
     # convective coefficient of top surface of module at NOCT
     windmod = 1.0
@@ -807,12 +828,8 @@ def fuentes(poa_global, temp_air, wind_speed, noct_installed, module_height=5,
     # It is a function of INOCT because high INOCT implies thermal coupling
     # with the racking (e.g. roofmount), so the thermal mass is increased.
     # `cap` has units J/(m^2 C) -- see Table 3, Equations 26 & 27
-    cap = cap0
-    if tinoct > 321.15:
-        cap = cap * (1 + (tinoct - 321.15) / 12)
-
-    # iterate through timeseries inputs
-    sun0 = 0
+    cap = np.where(tinoct > 321.15, cap0 * (1 + (tinoct - 321.15) / 12),
+                   cap0)
 
     # n.b. the way Fuentes calculates the first timedelta makes it seem like
     # the value doesn't matter -- rather than recreate it here, just assume
@@ -821,8 +838,15 @@ def fuentes(poa_global, temp_air, wind_speed, noct_installed, module_height=5,
     timedelta_hours = timedelta_seconds / 3600
     timedelta_hours.iloc[0] = timedelta_hours.iloc[1]
 
-    tamb_array = temp_air + 273.15
-    sun_array = poa_global * absorp
+    # weather inputs are arranged as (time, column) arrays, with a Series
+    # applied to every column
+    def as_columns(x):
+        x = np.asarray(x, dtype=float)
+        return x[:, np.newaxis] if x.ndim == 1 else x
+
+    shape = as_columns(poa_global).shape
+    tamb_array = as_columns(temp_air) + 273.15
+    sun_array = as_columns(poa_global) * absorp
 
     # Two of the calculations are easily vectorized, so precalculate them:
     # sky temperature -- Equation 24
@@ -830,52 +854,110 @@ def fuentes(poa_global, temp_air, wind_speed, noct_installed, module_height=5,
     # wind speed at module height -- Equation 22
     # not sure why the 1e-4 factor is included -- maybe the equations don't
     # behave well if wind == 0?
-    windmod_array = wind_speed * (module_height/wind_height)**0.2 + 1e-4
-
-    tmod0 = 293.15
-    tmod_array = np.zeros_like(poa_global)
-
-    iterator = zip(tamb_array, sun_array, windmod_array, tsky_array,
-                   timedelta_hours)
-    for i, (tamb, sun, windmod, tsky, dtime) in enumerate(iterator):
-        # solve the heat transfer equation, iterating because the heat loss
-        # terms depend on tmod. NB Fuentes doesn't show that 10 iterations is
-        # sufficient for convergence.
-        tmod = tmod0
-        for j in range(10):
-            # overall convective coefficient
-            tave = (tmod + tamb) / 2
-            hconv = convrat * _fuentes_hconv(tave, windmod, tinoct,
-                                             abs(tmod-tamb), xlen,
-                                             surface_tilt, True)
-            # sky radiation coefficient (Equation 3)
-            hsky = emiss * boltz * (tmod**2 + tsky**2) * (tmod + tsky)
-            # ground radiation coeffieicient (Equation 4)
-            tground = tamb + tgrat * (tmod - tamb)
-            hground = emiss * boltz * (tmod**2 + tground**2) * (tmod + tground)
-            # thermal lag -- Equation 8
-            eigen = - (hconv + hsky + hground) / cap * dtime * 3600
-            # not sure why this check is done, maybe as a speed optimization?
-            if eigen > -10:
-                ex = np.exp(eigen)
-            else:
-                ex = 0
-            # Equation 7 -- note that `sun` and `sun0` already account for
-            # absorption (alpha)
-            tmod = tmod0 * ex + (
-                (1 - ex) * (
-                    hconv * tamb
-                    + hsky * tsky
-                    + hground * tground
-                    + sun0
-                    + (sun - sun0) / eigen
-                ) + sun - sun0
-            ) / (hconv + hsky + hground)
-        tmod_array[i] = tmod
-        tmod0 = tmod
-        sun0 = sun
-
-    return pd.Series(tmod_array - 273.15, index=poa_global.index, name='tmod')
+    windmod_array = (as_columns(wind_speed)
+                     * (np.asarray(module_height, dtype=float)
+                        / wind_height)**0.2 + 1e-4)
+
+    # each column is one contiguous block of memory for the time loop
+    weather = [np.array(np.broadcast_to(x, shape), order='F')
+               for x in (tamb_array, sun_array, windmod_array, tsky_array)]
+    sites = [np.array(np.broadcast_to(x, shape[1]), dtype=float)
+             for x in (convrat, tgrat, cap, xlen, sind(surface_tilt), emiss)]
+    tmod_array = np.empty(shape, order='F')
+    _fuentes_loop(*weather, timedelta_hours.to_numpy(dtype=float), *sites,
+                  float(tol), tmod_array)
+
+    if isinstance(poa_global, pd.DataFrame):
+        return pd.DataFrame(tmod_array - 273.15, index=poa_global.index,
+                            columns=poa_global.columns)
+    # the Kelvin temperatures take the dtype of a poa_global Series, as they
+    # always have
+    tmod_array = tmod_array[:, 0].astype(poa_global.dtype, copy=False)
+    return pd.Series(tmod_array - 273.15, index=poa_global.index,
+                     name='tmod')
+
+
+# The functions below solve the Fuentes heat balance one timestep at a time.
+# They are compiled when PVLIB_USE_NUMBA is set, in which case the columns
+# are calculated in parallel.
+@_numba.jcompile('float64(float64, float64, float64, float64, float64)',
+                 nopython=True, error_model='numpy')
+def _fuentes_hconv_element(tave, windmod, temp_delta, xlen, sin_tilt):
+    # scalar version of _fuentes_hconv with check_reynold=True
+    densair = 0.003484 * 101325.0 / tave  # density
+    visair = 0.24237e-6 * tave**0.76 / densair  # kinematic viscosity
+    condair = 2.1695e-4 * tave**0.84  # thermal conductivity
+    reynold = windmod * xlen / visair
+    if reynold > 1.2e5:
+        # turbulent convection
+        hforce = 0.0282 / reynold**0.2 * densair * windmod * 1007 / 0.71**0.4
+    else:
+        # laminar convection
+        hforce = 0.8600 / reynold**0.5 * densair * windmod * 1007 / 0.71**0.67
+    grashof = 9.8 / tave * temp_delta * xlen**3 / visair**2 * sin_tilt
+    hfree = 0.21 * (grashof * 0.71)**0.32 * condair / xlen
+    return (hfree**3 + hforce**3)**(1/3)
+
+
+@_numba.jcompile('void(float64[:, :], float64[:, :], float64[:, :],'
+                 ' float64[:, :], float64[:], float64[:], float64[:],'
+                 ' float64[:], float64[:], float64[:], float64[:], float64,'
+                 ' float64[:, :])', nopython=True, parallel=True,
+                 error_model='numpy')
+def _fuentes_loop(tamb_array, sun_array, windmod_array, tsky_array,
+                  timedelta_hours, convrat, tgrat, cap, xlen, sin_tilt,
+                  emiss, tol, tmod_array):
+    boltz = 5.669e-8
+    for k in _numba.prange(tmod_array.shape[1]):
+        tmod0 = 293.15
+        sun0 = 0.
+        for i in range(tmod_array.shape[0]):
+            tamb = tamb_array[i, k]
+            sun = sun_array[i, k]
+            windmod = windmod_array[i, k]
+            tsky = tsky_array[i, k]
+            dtime = timedelta_hours[i]
+            # solve the heat transfer equation, iterating because the heat
+            # loss terms depend on tmod. NB Fuentes doesn't show that 10
+            # iterations is sufficient for convergence.
+            tmod = tmod0
+            for j in range(10):
+                # overall convective coefficient
+                tave = (tmod + tamb) / 2
+                hconv = convrat[k] * _fuentes_hconv_element(
+                    tave, windmod, abs(tmod - tamb), xlen[k], sin_tilt[k])
+                # sky radiation coefficient (Equation 3)
+                hsky = emiss[k] * boltz * (tmod**2 + tsky**2) * (tmod + tsky)
+                # ground radiation coeffieicient (Equation 4)
+                tground = tamb + tgrat[k] * (tmod - tamb)
+                hground = (emiss[k] * boltz * (tmod**2 + tground**2)
+                           * (tmod + tground))
+                # thermal lag -- Equation 8
+                eigen = - (hconv + hsky + hground) / cap[k] * dtime * 3600
+                # not sure why this check is done, maybe as a speed
+                # optimization?
+                if eigen > -10:
+                    ex = math.exp(eigen)
+                else:
+                    ex = 0.
+                # Equation 7 -- note that `sun` and `sun0` already account
+                # for absorption (alpha)
+                tmod_new = tmod0 * ex + (
+                    (1 - ex) * (
+                        hconv * tamb
+                        + hsky * tsky
+                        + hground * tground
+                        + sun0
+                        + (sun - sun0) / eigen
+                    ) + sun - sun0
+                ) / (hconv + hsky + hground)
+                converged = abs(tmod_new - tmod) <= tol
+                tmod = tmod_new
+                if converged:
+                    break
+            tmod_array[i, k] = tmod
+            tmod0 = tmod
+            sun0 = sun
 
 
 def _adj_for_mounting_standoff(x):
@@ -1,3 +1,4 @@
+import pandas as pd
 import pytest
 
 from pvlib.iotools import epw
@@ -21,3 +22,16 @@ def test_read_epw_coerce_year():
     coerce_year = 1987
     data, _ = epw.read_epw(epw_testfile, coerce_year=coerce_year)
     assert (data.index.year == 1987).all()
+
+
+@pytest.mark.parametrize('coerce_year', [None, 1987])
+def test_read_epw_chunks(coerce_year):
+    expected, expected_meta = epw.read_epw(epw_testfile,
+                                           coerce_year=coerce_year)
+    chunks = list(epw.read_epw_chunks(epw_testfile, 1000,
+                                      coerce_year=coerce_year))
+    assert [len(data) for data, _ in chunks] == [1000] * 8 + [760]
+    for _, meta in chunks:
+        assert meta == expected_meta
+    data = pd.concat([data for data, _ in chunks])
+    pd.testing.assert_frame_equal(data, expected)
@@ -180,6 +180,20 @@ def test_read_psm3_map_variables():
     assert_index_equal(data.columns, pd.Index(columns_mapped))
 
 
+@pytest.mark.parametrize('map_variables', [True, False])
+def test_read_psm3_chunks(map_variables):
+    """test read_psm3_chunks"""
+    expected, expected_metadata = psm3.read_psm3(
+        MANUAL_TEST_DATA, map_variables=map_variables)
+    chunks = list(psm3.read_psm3_chunks(MANUAL_TEST_DATA, 5000,
+                                        map_variables=map_variables))
+    assert [len(data) for data, _ in chunks] == [5000, 5000, 5000, 2520]
+    for _, metadata in chunks:
+        assert metadata == expected_metadata
+    data = pd.concat([data for data, _ in chunks])
+    pd.testing.assert_frame_equal(data, expected)
+
+
 @pytest.mark.remote_data
 @pytest.mark.flaky(reruns=RERUNS, reruns_delay=RERUNS_DELAY)
 def test_get_psm3_attribute_mapping(nrel_api_key):
@@ -131,3 +131,17 @@ def test_solaranywhere_tmy3(solaranywhere_index):
     assert meta['latitude'] == 44.465
     assert meta['longitude'] == -73.205
     assert meta['altitude'] == 41.0
+
+
+@pytest.mark.parametrize('coerce_year', [None, 1990])
+@pytest.mark.parametrize('filename', [TMY3_TESTFILE, TMY3_FEB_LEAPYEAR])
+def test_read_tmy3_chunks(filename, coerce_year):
+    expected, expected_meta = tmy.read_tmy3(
+        filename, coerce_year=coerce_year, map_variables=True)
+    chunks = list(tmy.read_tmy3_chunks(filename, 1000,
+                                       coerce_year=coerce_year))
+    assert [len(data) for data, _ in chunks] == [1000] * 8 + [760]
+    for _, meta in chunks:
+        assert meta == expected_meta
+    data = pd.concat([data for data, _ in chunks])
+    pd.testing.assert_frame_equal(data, expected)
@@ -0,0 +1,52 @@
+"""
+Test the _numba module.
+"""
+
+import importlib.util
+import os
+from importlib import reload
+
+import pytest
+
+from pvlib import _numba
+from .conftest import requires_numba
+
+
+@pytest.fixture
+def use_numba(monkeypatch):
+    """Reload pvlib._numba with PVLIB_USE_NUMBA set."""
+    monkeypatch.setenv('PVLIB_USE_NUMBA', '1')
+    try:
+        yield
+    finally:
+        monkeypatch.delenv('PVLIB_USE_NUMBA')
+        reload(_numba)
+
+
+def test_nocompile():
+    assert os.getenv('PVLIB_USE_NUMBA', '0') == '0'
+    assert not _numba.USE_NUMBA
+
+    def func():
+        pass
+    assert _numba.jcompile('void()', nopython=True)(func) is func
+    assert _numba.prange is range
+    with pytest.raises(AttributeError, match='no attribute'):
+        _numba.jit
+
+
+@requires_numba
+def test_compile(use_numba):
+    import numba
+    reload(_numba)
+    assert _numba.USE_NUMBA
+    assert _numba.prange is numba.prange
+    assert _numba.jcompile(nopython=True)(lambda x: 2 * x)(2.) == 4.
+
+
+def test_numba_missing(use_numba, mocker):
+    mocker.patch.object(importlib.util, 'find_spec', return_value=None)
+    with pytest.warns(UserWarning, match='Could not import numba'):
+        reload(_numba)
+    assert not _numba.USE_NUMBA
+    assert _numba.prange is range
@@ -258,6 +258,100 @@ def test_lookup_linke_turbidity_nointerp_months():
     assert_series_equal(expected, out)
 
 
+@pytest.fixture(scope='module')
+def linke_turbidity_files(tmp_path_factory):
+    """Synthetic grids with the layout of LinkeTurbidities.h5, stored
+    contiguously and compressed."""
+    h5py = pytest.importorskip('h5py')
+    path = tmp_path_factory.mktemp('linke_turbidity')
+    contiguous, compressed = path / 'contiguous.h5', path / 'compressed.h5'
+    with h5py.File(contiguous, 'w') as f:
+        dataset = f.create_dataset('LinkeTurbidity', shape=(2160, 4320, 12),
+                                   dtype='u1')
+        j = np.arange(4320)[:, np.newaxis]
+        m = np.arange(12)
+        for i0 in range(0, 2160, 240):
+            i = np.arange(i0, i0 + 240)[:, np.newaxis, np.newaxis]
+            dataset[i0:i0 + 240] = (i + 2 * j + 5 * m) % 200 + 20
+    with h5py.File(compressed, 'w') as f:
+        dataset = f.create_dataset('LinkeTurbidity', shape=(2160, 4320, 12),
+                                   dtype='u1', chunks=(60, 60, 12),
+                                   compression='gzip', fillvalue=60)
+        dataset[690:700, 825:835] = 40
+    yield str(contiguous), str(compressed)
+    clearsky.clear_linke_turbidity_cache()
+
+
+@pytest.mark.parametrize('interp_turbidity', [True, False])
+@pytest.mark.parametrize('cache', [True, False])
+def test_lookup_linke_turbidity_sites(linke_turbidity_files,
+                                      interp_turbidity, cache):
+    filepath = linke_turbidity_files[0]
+    times = pd.date_range('2016-01-01', '2017-01-01', freq='5D', tz='UTC')
+    latitude = np.array([[32.125, -10.3, 89.99], [-90., 45., 0.]])
+    longitude = np.array([-110.875, 179.99, -180.])
+    out = clearsky.lookup_linke_turbidity(
+        times, latitude, longitude, filepath=filepath,
+        interp_turbidity=interp_turbidity, cache=cache)
+    assert out.shape == (2, 3, len(times))
+    for i in range(2):
+        for j in range(3):
+            expected = clearsky.lookup_linke_turbidity(
+                times, latitude[i, j], longitude[j], filepath=filepath,
+                interp_turbidity=interp_turbidity)
+            assert_allclose(out[i, j], expected, rtol=1e-14)
+    # scalar sites keep returning a Series
+    out = clearsky.lookup_linke_turbidity(times, 32.125, -110.875,
+                                          filepath=filepath, cache=cache)
+    assert isinstance(out, pd.Series)
+    assert out.index.equals(times)
+
+
+def test_lookup_linke_turbidity_cache(linke_turbidity_files):
+    contiguous, compressed = linke_turbidity_files
+    times = pd.date_range('2016-01-01', '2016-12-31', freq='MS', tz='UTC')
+    clearsky.clear_linke_turbidity_cache()
+    grid = clearsky._linke_turbidity_grid(contiguous)
+    assert isinstance(grid, np.memmap)
+    assert not grid.flags.writeable
+    assert clearsky._linke_turbidity_grid(contiguous) is grid
+    grid = clearsky._linke_turbidity_grid(compressed)
+    assert not isinstance(grid, np.memmap)
+    assert grid.shape == (2160, 4320, 12)
+    out = clearsky.lookup_linke_turbidity(
+        times, [32.125, 0.], [-110.875, 0.], filepath=compressed,
+        interp_turbidity=False, cache=True)
+    assert_allclose(out, [[2.] * 12, [3.] * 12])
+    clearsky.clear_linke_turbidity_cache()
+    assert clearsky._linke_turbidity_cache == {}
+
+
+def test_lookup_linke_turbidity_interp_spatial(linke_turbidity_files):
+    filepath = linke_turbidity_files[0]
+    times = pd.date_range('2016-01-01', '2016-12-31', freq='MS', tz='UTC')
+
+    def monthly(latitude, longitude, **kwargs):
+        return clearsky.lookup_linke_turbidity(
+            times, latitude, longitude, filepath=filepath,
+            interp_turbidity=False, **kwargs)
+
+    # at cell centers, the values of the cells
+    centers = (32.125, -110.875)
+    assert_allclose(monthly(*centers, interp_spatial=True),
+                    monthly(*centers), rtol=1e-12)
+    # between cell centers, the mean of the cells
+    assert_allclose(
+        monthly(centers[0], [centers[1] + 1 / 24], interp_spatial=True)[0],
+        (monthly(*centers) + monthly(centers[0], centers[1] + 1 / 12)) / 2,
+        rtol=1e-12)
+    # across the antimeridian, and beyond the outermost latitudes
+    assert_allclose(
+        monthly([90.], [180.], interp_spatial=True)[0],
+        (monthly(89.99, -179.99) + monthly(89.99, 179.99)) / 2, rtol=1e-12)
+    with pytest.raises(IndexError):
+        monthly(91., 0., interp_spatial=True)
+
+
 def test_haurwitz():
     apparent_solar_elevation = np.array([-20, -0.05, -0.001, 5, 10, 30, 50, 90])
     apparent_solar_zenith = 90 - apparent_solar_elevation
@@ -695,41 +789,81 @@ def test_detect_clearsky_optimizer_not_failed(
     assert isinstance(clear_samples, pd.Series)
 
 
+@pytest.mark.parametrize('chunksize', [1, 4, 10, 100])
+def test_ClearskyDetector(detect_clearsky_data, chunksize):
+    expected, cs = detect_clearsky_data
+    measured = expected['GHI']
+    alpha = 0.9633903181941296
+    batch = clearsky.detect_clearsky(measured, alpha * cs['ghi'],
+                                     window_length=10, max_iterations=1)
+    detector = clearsky.ClearskyDetector(1, window_length=10, alpha=alpha)
+    assert detector.samples_per_window == 10
+    out = []
+    for start in range(0, len(measured), chunksize):
+        stop = start + chunksize
+        flags = detector.append(measured[start:stop], cs['ghi'][start:stop])
+        # samples are final once the windows that contain them are complete
+        assert len(flags) == max(min(stop, len(measured)) - 9, 0) - sum(
+            len(f) for f in out)
+        out.append(flags)
+    out.append(detector.flush())
+    assert_series_equal(pd.concat(out), batch)
+    assert_series_equal(pd.concat(out), expected['Clear or not'],
+                        check_dtype=False, check_names=False)
+
+
+def test_ClearskyDetector_arrays(detect_clearsky_threshold_data):
+    expected, cs = detect_clearsky_threshold_data
+    with pytest.warns(RuntimeWarning, match='rescaling failed'):
+        batch = clearsky.detect_clearsky(expected['GHI'], cs['ghi'],
+                                         infer_limits=True, max_iterations=1)
+    detector = clearsky.ClearskyDetector(1, infer_limits=True)
+    assert detector.samples_per_window == 50
+    out = [detector.append(m, c) for m, c in zip(expected['GHI'].values,
+                                                 cs['ghi'].values)]
+    assert all(isinstance(flags, np.ndarray) for flags in out)
+    assert sum(len(flags) for flags in out) == len(expected) - 49
+    out.append(detector.flush())
+    assert_allclose(np.concatenate(out), batch.values)
+    assert np.concatenate(out).any()
+
+
+def test_ClearskyDetector_window_too_short():
+    with pytest.raises(ValueError, match='Samples per window of 2'):
+        clearsky.ClearskyDetector(5, window_length=10)
+
+
 @pytest.fixture
 def detect_clearsky_helper_data():
     samples_per_window = 3
     sample_interval = 1
     x = pd.Series(np.arange(0, 7)**2.)
-    # line length between adjacent points
-    sqt = pd.Series(np.sqrt(np.array([np.nan, 2., 10., 26., 50., 82, 122.])))
-    H = hankel(np.arange(samples_per_window),
-               np.arange(samples_per_window-1, len(sqt)))
-    return x, samples_per_window, sample_interval, H
+    return x, samples_per_window, sample_interval
 
 
 def test__line_length_windowed(detect_clearsky_helper_data):
-    x, samples_per_window, sample_interval, H = detect_clearsky_helper_data
+    x, samples_per_window, sample_interval = detect_clearsky_helper_data
     # sqt is hand-calculated assuming window=3
     # line length between adjacent points
     sqt = pd.Series(np.sqrt(np.array([np.nan, 2., 10., 26., 50., 82, 122.])))
     expected = {}
     expected['line_length'] = sqt + sqt.shift(-1)
     result = clearsky._line_length_windowed(
-        x, H, samples_per_window, sample_interval)
+        x, samples_per_window, sample_interval)
     assert_series_equal(result, expected['line_length'])
 
 
 def test__max_diff_windowed(detect_clearsky_helper_data):
-    x, samples_per_window, sample_interval, H = detect_clearsky_helper_data
+    x, samples_per_window, sample_interval = detect_clearsky_helper_data
     expected = {}
     expected['max_diff'] = pd.Series(
         data=[np.nan, 3., 5., 7., 9., 11., np.nan], index=x.index)
-    result = clearsky._max_diff_windowed(x, H, samples_per_window)
+    result = clearsky._max_diff_windowed(x, samples_per_window)
     assert_series_equal(result, expected['max_diff'])
 
 
 def test__calc_stats(detect_clearsky_helper_data):
-    x, samples_per_window, sample_interval, H = detect_clearsky_helper_data
+    x, samples_per_window, sample_interval = detect_clearsky_helper_data
     # stats are hand-computed assuming window = 3, sample_interval = 1,
     # and right-aligned labels
     mean_x = pd.Series(np.array([np.nan, np.nan, 5, 14, 29, 50, 77]) / 3.)
@@ -745,7 +879,7 @@ def test__calc_stats(detect_clearsky_helper_data):
     expected['slope'] = slope
     expected['slope_nstd'] = slope_nstd.shift(-1)
     result = clearsky._calc_stats(
-        x, samples_per_window, sample_interval, H)
+        x, samples_per_window, sample_interval)
     res_mean, res_max, res_slope_nstd, res_slope = result
     assert_series_equal(res_mean, expected['mean'])
     assert_series_equal(res_max, expected['max'])
@@ -753,6 +887,28 @@ def test__calc_stats(detect_clearsky_helper_data):
     assert_series_equal(res_slope, expected['slope'])
 
 
+@pytest.mark.parametrize('samples_per_window', [3, 10, 50])
+def test__windowed_stats_match_hankel(samples_per_window):
+    # windowed statistics must be identical to reducing the windows
+    # indexed by a Hankel matrix
+    values = np.random.default_rng(0).uniform(0, 1000, 500)
+    values[[20, 21, 300]] = np.nan
+    H = hankel(np.arange(samples_per_window),
+               np.arange(samples_per_window - 1, len(values)))
+    for ufunc in (np.add, np.maximum):
+        assert_allclose(
+            clearsky._windowed_reduce(ufunc, values, samples_per_window),
+            ufunc.reduce(values[H], axis=0), rtol=0, atol=0)
+    assert_allclose(clearsky._windowed_mean(values, samples_per_window),
+                    values[H].mean(axis=0), rtol=0, atol=0)
+    assert_allclose(clearsky._windowed_std(values, samples_per_window, 1),
+                    values[H].std(axis=0, ddof=1), rtol=0, atol=0)
+    windows = values[:1 - samples_per_window] > 900
+    assert_allclose(
+        np.flatnonzero(clearsky._windowed_spread(windows, samples_per_window)),
+        np.unique(H[:, windows]), rtol=0, atol=0)
+
+
 def test_bird():
     """Test Bird/Hulstrom Clearsky Model"""
     times = pd.date_range(start='1/1/2015 0:00', end='12/31/2015 23:00',
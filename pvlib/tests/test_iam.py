@@ -289,6 +289,62 @@ def test_marion_diffuse_invalid():
         _iam.marion_diffuse('not_a_model', 20)
 
 
+def test_marion_diffuse_tilt_step(mocker):
+    _iam.clear_marion_cache()
+    tilt = np.array([5., 20.5, 33.3, 60., 90., 120.7, 175.])
+    expected = _iam.marion_diffuse('physical', tilt)
+    spy = mocker.spy(_iam, 'physical')
+    actual = _iam.marion_diffuse('physical', tilt, tilt_step=1)
+    assert spy.call_count > 0
+    for k, v in expected.items():
+        assert_allclose(actual[k], v, atol=1e-3)
+    # tilts on the grid match direct integration
+    actual = _iam.marion_diffuse('physical', [20., 60.], tilt_step=1)
+    for k in expected:
+        assert_allclose(actual[k],
+                        _iam.marion_diffuse('physical', [20., 60.])[k])
+    # cached table is reused and only interpolated
+    spy.reset_mock()
+    tilt = pd.Series([10.25, np.nan], pd.date_range('2019-01-01', periods=2))
+    actual = _iam.marion_diffuse('physical', tilt, tilt_step=1)
+    assert spy.call_count == 0
+    assert isinstance(actual['sky'], pd.Series)
+    assert np.isnan(actual['sky'].iloc[1])
+    actual = _iam.marion_diffuse('physical', 20.5, tilt_step=1)
+    assert spy.call_count == 0
+    assert isinstance(actual['sky'], float)
+    # different parameters or steps are integrated again
+    _iam.marion_diffuse('physical', 20.5, tilt_step=10)
+    assert spy.call_count > 0
+    spy.reset_mock()
+    _iam.marion_diffuse('physical', 20.5, tilt_step=10, n=1.3)
+    assert spy.call_count > 0
+    spy.reset_mock()
+    _iam.clear_marion_cache()
+    _iam.marion_diffuse('physical', 20.5, tilt_step=10)
+    assert spy.call_count > 0
+
+
+def test_marion_diffuse_tilt_step_invalid():
+    with pytest.raises(ValueError, match='tilt_step must be positive'):
+        _iam.marion_diffuse('physical', 20, tilt_step=0)
+
+
+def test_marion_diffuse_interp():
+    # an interp IAM through the ashrae model values equals ashrae
+    theta_ref = np.linspace(0, 90, 181)
+    iam_ref = _iam.ashrae(theta_ref)
+    expected = _iam.marion_diffuse('ashrae', [20, 50])
+    actual = _iam.marion_diffuse('interp', [20, 50], theta_ref=theta_ref,
+                                 iam_ref=iam_ref)
+    for k, v in expected.items():
+        assert_allclose(actual[k], v, rtol=1e-4)
+    actual = _iam.marion_diffuse('interp', [20, 50], tilt_step=1,
+                                 theta_ref=theta_ref, iam_ref=iam_ref)
+    for k, v in expected.items():
+        assert_allclose(actual[k], v, rtol=1e-4)
+
+
 @pytest.mark.parametrize('region,N,expected', [
     ('sky', 180, 0.9596085829811408),
     ('horizon', 1800, 0.8329070417832541),
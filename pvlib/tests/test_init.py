@@ -0,0 +1,31 @@
+import subprocess
+import sys
+
+import pytest
+
+import pvlib
+
+
+def test_submodules_lazy():
+    # run in a new process, since other tests have imported the submodules
+    code = ("import sys, pvlib; "
+            "print(sorted(m for m in sys.modules if m.startswith('pvlib.')))")
+    out = subprocess.run([sys.executable, '-c', code], check=True,
+                         capture_output=True, text=True).stdout
+    assert out.strip() == '[]'
+
+
+@pytest.mark.parametrize('package', [
+    pvlib, pvlib.iotools, pvlib.spectrum, pvlib.bifacial, pvlib.ivtools])
+def test_lazy_attributes(package):
+    for name in package.__all__:
+        assert getattr(package, name) is not None
+    assert set(package.__all__) <= set(dir(package))
+    assert '__file__' in dir(package)
+    with pytest.raises(AttributeError, match='no attribute'):
+        package.not_an_attribute
+
+
+def test_version():
+    assert pvlib.version.__version__ == pvlib.__version__
+    assert 'version' in dir(pvlib)
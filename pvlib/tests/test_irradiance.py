@@ -1,5 +1,7 @@
 import datetime
 from collections import OrderedDict
+from importlib import reload
+import os
 import warnings
 
 import numpy as np
@@ -9,7 +11,7 @@ import pandas as pd
 import pytest
 from numpy.testing import (assert_almost_equal,
                            assert_allclose)
-from pvlib import irradiance, albedo
+from pvlib import _numba, irradiance, albedo
 
 from .conftest import (
     assert_frame_equal,
@@ -434,6 +436,69 @@ def test_perez_scalar():
     assert_allclose(out, 109.084332)
 
 
+def test_perez_out(irrad_data, ephem_data, dni_et, relative_airmass):
+    args = (40, 180, irrad_data['dhi'], irrad_data['dni'], dni_et,
+            ephem_data['apparent_zenith'], ephem_data['azimuth'],
+            relative_airmass)
+    expected = irradiance.perez(*args)
+    out = np.empty(len(expected))
+    result = irradiance.perez(*args, out=out)
+    assert_series_equal(result, expected)
+    assert np.shares_memory(result.values, out)
+    result = irradiance.perez(*[np.asarray(a) for a in args], out=out)
+    assert result is out
+    assert_allclose(out, expected)
+    with pytest.raises(ValueError, match='out must be'):
+        irradiance.perez(*args, out=np.empty(3))
+
+
+def test_perez_broadcast(irrad_data, ephem_data, dni_et, relative_airmass):
+    tilt = np.array([[0], [20], [40]])
+    args = (irrad_data['dhi'].values, irrad_data['dni'].values, dni_et,
+            ephem_data['apparent_zenith'].values, ephem_data['azimuth'].values,
+            relative_airmass.values)
+    out = irradiance.perez(tilt, 180, *args, return_components=True)
+    for i, t in enumerate(tilt[:, 0]):
+        expected = irradiance.perez(t, 180, *args, return_components=True)
+        for key in expected:
+            assert out[key].shape == (3, 4)
+            assert_allclose(out[key][i], expected[key])
+
+
+def test__get_perez_coefficients_cached():
+    F1c, F2c = irradiance._get_perez_coefficients('albany1988')
+    assert irradiance._get_perez_coefficients('albany1988')[0] is F1c
+    assert F1c.shape == (8, 3)
+    assert F2c.shape == (8, 3)
+    assert not F1c.flags.writeable
+    with pytest.raises(KeyError):
+        irradiance._get_perez_coefficients('not_a_model')
+
+
+@requires_numba
+def test_perez_numba(irrad_data, ephem_data, dni_et, relative_airmass):
+    dni = irrad_data['dni'].copy()
+    dni.iloc[2] = np.nan
+    args = (40, 180, irrad_data['dhi'], dni, dni_et,
+            ephem_data['apparent_zenith'], ephem_data['azimuth'],
+            relative_airmass)
+    expected = irradiance.perez(*args, return_components=True)
+    os.environ['PVLIB_USE_NUMBA'] = '1'
+    try:
+        reload(_numba)
+        assert _numba.USE_NUMBA
+        irradiance_numba = reload(irradiance)
+        # the loop is compiled on first use
+        assert irradiance_numba._perez_kernel is None
+        out = irradiance_numba.perez(*args, return_components=True)
+        assert irradiance_numba._perez_kernel is not None
+    finally:
+        del os.environ['PVLIB_USE_NUMBA']
+        reload(_numba)
+        reload(irradiance)
+    assert_allclose(out, expected, rtol=0, atol=1e-10)
+
+
 def test_perez_driesse_scalar():
     # copied values from fixtures
     out = irradiance.perez_driesse(40, 180, 118.458, 939.954,
@@ -513,6 +578,42 @@ def test_get_total_irradiance(irrad_data, ephem_data, dni_et,
                                           'poa_ground_diffuse']
 
 
+@pytest.mark.parametrize('model', ['isotropic', 'haydavies', 'perez',
+                                   'perez-driesse'])
+def test_get_total_irradiance_components(irrad_data, ephem_data, dni_et,
+                                         relative_airmass, model):
+    kwargs = dict(dni=irrad_data['dni'], ghi=irrad_data['ghi'],
+                  dhi=irrad_data['dhi'], dni_extra=dni_et,
+                  airmass=relative_airmass, model=model)
+    expected = irradiance.get_total_irradiance(
+        32, 180, ephem_data['apparent_zenith'], ephem_data['azimuth'],
+        **kwargs)
+    total = irradiance.get_total_irradiance(
+        32, 180, ephem_data['apparent_zenith'], ephem_data['azimuth'],
+        return_components=True, **kwargs)
+    assert total.columns.tolist() == expected.columns.tolist() + [
+        'poa_isotropic', 'poa_circumsolar', 'poa_horizon']
+    assert_frame_equal(total[expected.columns], expected)
+    sky = irradiance.get_sky_diffuse(
+        32, 180, ephem_data['apparent_zenith'], ephem_data['azimuth'],
+        return_components=True, **kwargs)
+    for key in ['isotropic', 'circumsolar', 'horizon']:
+        assert_series_equal(total['poa_' + key], sky[key],
+                            check_names=False)
+    if model == 'isotropic':
+        assert_series_equal(total['poa_isotropic'], total['poa_sky_diffuse'],
+                            check_names=False)
+        assert (total['poa_circumsolar'].dropna() == 0).all()
+
+
+@pytest.mark.parametrize('model', ['klucher', 'reindl', 'king'])
+def test_get_sky_diffuse_components_invalid(model):
+    with pytest.raises(ValueError, match='return_components is not'):
+        irradiance.get_sky_diffuse(
+            30, 180, 0, 180, 1000, 1100, 100, dni_extra=1360, airmass=1,
+            model=model, return_components=True)
+
+
 @pytest.mark.parametrize('model', ['isotropic', 'klucher',
                                    'haydavies', 'reindl', 'king',
                                    'perez', 'perez-driesse'])
@@ -837,7 +938,7 @@ def test_ghi_from_poa_driesse(mocker):
             poa_global, dni_extra=1366.1, xtol=xtol)
     # test propagation
     xtol = 3.141592
-    bisect_spy = mocker.spy(irradiance, "bisect")
+    bisect_spy = mocker.spy(irradiance.tools, "_bisect")
     output = irradiance.ghi_from_poa_driesse_2023(
         surface_tilt, surface_azimuth, zenith, azimuth,
         poa_global, dni_extra=1366.1, xtol=xtol)
@@ -900,7 +1001,7 @@ def test_gti_dirint():
     expected = pd.DataFrame(array(
         [[21.3592591,    0.,   21.3592591],
          [294.4985420,   66.25848451,  247.64671830],
-         [941.7943404,  727.50552952,  258.16276278]]),
+         [941.4018974,  726.37599416,  258.83173579]]),
         columns=expected_col_order, index=times)
 
     assert_frame_equal(output, expected)
@@ -922,12 +1023,50 @@ def test_gti_dirint():
     expected = pd.DataFrame(array(
         [[21.05796198,    0.,           21.05796198],
          [295.06070190,   38.20346345,  268.0467738],
-         [931.79627208,  689.81549269,  283.5817439]]),
+         [931.34858160,  688.49773784,  284.37233792]]),
         columns=expected_col_order, index=times)
 
     assert_frame_equal(output, expected)
 
 
+def test_gti_dirint_independent_points():
+    # without delta_kt_prime, each point is iterated until it converges,
+    # independently of the other points
+    times = pd.DatetimeIndex(
+        ['2014-06-24T06-0700', '2014-06-24T09-0700', '2014-06-24T12-0700',
+         '2014-06-24T15-0700'])
+    poa_global = np.array([20, 300, 1000, 400])
+    aoi = np.array([100, 70, 10, 60])
+    zenith = np.array([80, 45, 20, 50])
+    azimuth = np.array([90, 135, 180, 250])
+    output = irradiance.gti_dirint(
+        poa_global, aoi, zenith, azimuth, times, 30, 180,
+        use_delta_kt_prime=False, calculate_gt_90=False)
+    for i in range(1, 4):
+        single = irradiance.gti_dirint(
+            poa_global[[i]], aoi[[i]], zenith[[i]], azimuth[[i]],
+            times[[i]], 30, 180, use_delta_kt_prime=False)
+        assert_frame_equal(single, output.iloc[[i]])
+
+
+def test__gti_dirint_gte_90_kt_prime():
+    times = pd.DatetimeIndex(
+        ['2014-06-24T06-0700', '2014-06-24T09-0700', '2014-06-24T10-0700',
+         '2014-06-24T15-0700', '2014-06-24T19-0700', '2014-06-25T06-0700',
+         '2014-06-25T09-0700', '2014-06-25T19-0700', '2014-06-25T23-0700'])
+    aoi = np.array([100, 70, 75, 70, 95, 100, 70, 95, 120])
+    zenith = np.array([80, 45, 40, 45, 85, 80, 45, 85, 110])
+    azimuth = np.array([80, 100, 110, 250, 290, 80, 100, 290, 340])
+    kt_prime = pd.Series([.1, .4, .6, .7, .2, .3, .8, .5, 0.], index=times)
+    out = irradiance._gti_dirint_gte_90_kt_prime(aoi, zenith, azimuth, times,
+                                                 kt_prime)
+    # morning and afternoon averages of 65 < aoi < 80 for each day, for
+    # times with aoi >= 90 and the sun above the horizon
+    expected = pd.Series([.5, nan, nan, nan, .7, .8, nan, nan, nan],
+                         index=times)
+    assert_series_equal(out, expected)
+
+
 def test_gti_dirint_data_error():
     times = pd.DatetimeIndex(
         ['2014-06-24T06-0700', '2014-06-24T09-0700', '2014-06-24T12-0700'])
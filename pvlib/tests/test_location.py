@@ -3,6 +3,7 @@ from unittest.mock import ANY
 
 import numpy as np
 from numpy import nan
+from numpy.testing import assert_allclose
 import pandas as pd
 from .conftest import assert_frame_equal, assert_index_equal
 
@@ -308,6 +309,9 @@ def test_get_sun_rise_set_transit(golden):
     result = golden.get_sun_rise_set_transit(times, method='spa')
     assert all(result.columns == ['sunrise', 'sunset', 'transit'])
 
+    result = golden.get_sun_rise_set_transit(times, method='iterative')
+    assert all(result.columns == ['sunrise', 'sunset', 'transit'])
+
     dayofyear = 1
     declination = declination_spencer71(dayofyear)
     eot = equation_of_time_spencer71(dayofyear)
@@ -354,3 +358,30 @@ def test_location_lookup_altitude(mocker):
     tus = Location(32.2, -111, 'US/Arizona')
     location.lookup_altitude.assert_called_once_with(32.2, -111)
     assert tus.altitude == location.lookup_altitude(32.2, -111)
+
+
+def test_lookup_altitude_array():
+    latitude = np.array([32.2540, -15.3875, 35.6762, 0])
+    longitude = np.array([-110.9742, 28.3228, 139.6503, 0])
+    alt_found = lookup_altitude(latitude, longitude)
+    assert alt_found.shape == (4,)
+    expected = [lookup_altitude(lat, lon)
+                for lat, lon in zip(latitude, longitude)]
+    assert_allclose(alt_found, expected)
+    # broadcast to a grid of sites
+    alt_found = lookup_altitude(latitude[:, np.newaxis], longitude)
+    assert alt_found.shape == (4, 4)
+    assert_allclose(np.diag(alt_found), expected)
+
+
+def test_lookup_altitude_cache(mocker):
+    location.clear_altitude_cache()
+    m = mocker.spy(location, '_read_h5_grid')
+    alt = lookup_altitude(32.2540, -110.9742)
+    assert isinstance(alt, float)
+    Location(32.2, -111)
+    lookup_altitude([0, 10], [0, 10])
+    assert m.call_count == 1
+    location.clear_altitude_cache()
+    assert lookup_altitude(32.2540, -110.9742) == alt
+    assert m.call_count == 2
@@ -1,4 +1,6 @@
+import multiprocessing
 import sys
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 
 import numpy as np
 import pandas as pd
@@ -10,6 +12,7 @@ from pvlib.location import Location
 from pvlib._deprecation import pvlibDeprecationWarning
 
 from .conftest import assert_series_equal, assert_frame_equal
+from numpy.testing import assert_allclose
 import pytest
 
 from .conftest import fail_on_pvlib_version
@@ -732,6 +735,294 @@ def test_run_model_with_weather_fuentes_temp(sapm_dc_snl_ac_system, location,
     assert not mc.results.ac.empty
 
 
+@pytest.fixture
+def weather_chunks(location):
+    times = pd.date_range('20160101 0000-0700', periods=3 * 96, freq='15min')
+    weather = location.get_clearsky(times, model='simplified_solis')
+    weather['temp_air'] = 10 + 10 * np.sin(np.arange(len(times)) / 30)
+    weather['wind_speed'] = 2.
+    return weather
+
+
+def _assert_results_equal(results, expected):
+    for name in ('times', 'weather', 'solar_position', 'total_irrad', 'aoi',
+                 'aoi_modifier', 'effective_irradiance', 'cell_temperature',
+                 'dc', 'ac', 'losses'):
+        actual, desired = getattr(results, name), getattr(expected, name)
+        assert type(actual) is type(desired)
+        if isinstance(desired, tuple):
+            for a, d in zip(actual, desired):
+                assert_allclose(a, d, rtol=1e-12)
+                assert a.index.equals(d.index)
+        elif isinstance(desired, pd.Index):
+            assert actual.equals(desired)
+        elif isinstance(desired, (pd.Series, pd.DataFrame)):
+            assert_allclose(actual, desired, rtol=1e-12)
+            assert actual.index.equals(desired.index)
+        else:
+            assert actual == desired
+
+
+def _spawn_process_pool(max_workers):
+    # fork is not safe in the multithreaded test process
+    return ProcessPoolExecutor(max_workers,
+                               mp_context=multiprocessing.get_context('spawn'))
+
+
+@pytest.mark.parametrize('executor', [None, ThreadPoolExecutor,
+                                      _spawn_process_pool])
+def test_run_model_chunked(pvwatts_dc_pvwatts_ac_fuentes_temp_system,
+                           location, weather_chunks, executor):
+    mc = ModelChain(pvwatts_dc_pvwatts_ac_fuentes_temp_system, location,
+                    aoi_model='physical', spectral_model='no_loss',
+                    temperature_model='fuentes', losses_model='pvwatts')
+    expected = mc.run_model(weather_chunks).results
+    mc = ModelChain(pvwatts_dc_pvwatts_ac_fuentes_temp_system, location,
+                    aoi_model='physical', spectral_model='no_loss',
+                    temperature_model='fuentes', losses_model='pvwatts')
+    if executor is None:
+        mc.run_model(weather_chunks, chunksize=50)
+    else:
+        with executor(max_workers=2) as ex:
+            mc.run_model(weather_chunks, chunksize=50, executor=ex)
+    assert mc.results is not expected
+    _assert_results_equal(mc.results, expected)
+
+
+class _CountingExecutor:
+    """Runs each task when submitted, and records the largest number of
+    tasks submitted and not yet returned."""
+
+    def __init__(self):
+        self.pending = 0
+        self.max_pending = 0
+
+    def submit(self, func, *args):
+        self.pending += 1
+        self.max_pending = max(self.max_pending, self.pending)
+        result = func(*args)
+        executor = self
+
+        class Future:
+            def result(self):
+                executor.pending -= 1
+                return result
+
+            def cancel(self):
+                executor.pending -= 1
+        return Future()
+
+
+def test_run_model_chunked_bounded(sapm_dc_snl_ac_system, location,
+                                   weather_chunks, mocker):
+    mocker.patch('os.cpu_count', return_value=1)
+    mc = ModelChain(sapm_dc_snl_ac_system, location,
+                    outputs=['ac', 'cell_temperature'])
+    expected = mc.run_model(weather_chunks).results
+    executor = _CountingExecutor()
+    mc.run_model(weather_chunks, chunksize=10, executor=executor)
+    assert executor.max_pending == 2
+    assert executor.pending == 0
+    assert_allclose(mc.results.ac, expected.ac, rtol=1e-12)
+    assert_allclose(mc.results.cell_temperature, expected.cell_temperature,
+                    rtol=1e-12)
+    assert mc.results.dc is None
+    assert mc.results.total_irrad is None
+
+
+def test_run_model_chunked_warmup(pvwatts_dc_pvwatts_ac_fuentes_temp_system,
+                                  location, weather_chunks):
+    mc = ModelChain(pvwatts_dc_pvwatts_ac_fuentes_temp_system, location,
+                    aoi_model='physical', spectral_model='no_loss',
+                    temperature_model='fuentes')
+    expected = mc.run_model(weather_chunks).results.cell_temperature
+    # without warmup, the fuentes model restarts from ambient temperature
+    # at the start of each chunk
+    actual = mc.run_model(weather_chunks, chunksize=100,
+                          warmup=0).results.cell_temperature
+    assert_allclose(actual.iloc[:100], expected.iloc[:100], rtol=1e-12)
+    assert not np.isclose(actual.iloc[200], expected.iloc[200])
+    actual = mc.run_model(weather_chunks, chunksize=100,
+                          warmup='6h').results.cell_temperature
+    assert_allclose(actual, expected, rtol=1e-12)
+
+
+@pytest.mark.parametrize('method', ['run_model_from_poa',
+                                    'run_model_from_effective_irradiance'])
+def test_run_model_chunked_arrays(sapm_dc_snl_ac_system_Array, location,
+                                  weather_chunks, method):
+    data = weather_chunks.copy()
+    data['poa_global'] = data['ghi']
+    data['poa_direct'] = data['dni'] * 0.8
+    data['poa_diffuse'] = data['dhi']
+    data['effective_irradiance'] = data['poa_global']
+    mc = ModelChain(sapm_dc_snl_ac_system_Array, location,
+                    aoi_model='no_loss', spectral_model='no_loss')
+    expected = getattr(mc, method)((data, data * 0.5)).results
+    mc = ModelChain(sapm_dc_snl_ac_system_Array, location,
+                    aoi_model='no_loss', spectral_model='no_loss')
+    getattr(mc, method)([data, data * 0.5], chunksize=40)
+    assert isinstance(mc.results.dc, tuple)
+    assert len(mc.results.dc) == 2
+    assert_allclose(mc.results.dc[1], expected.dc[1], rtol=1e-12)
+    assert_allclose(mc.results.ac, expected.ac, rtol=1e-12)
+    assert mc.results.times.equals(expected.times)
+
+
+@pytest.mark.parametrize('chunksize', [0, -5, 2.5])
+def test_run_model_chunked_invalid(sapm_dc_snl_ac_system, location, weather,
+                                   chunksize):
+    mc = ModelChain(sapm_dc_snl_ac_system, location)
+    with pytest.raises(ValueError, match='chunksize must be a positive'):
+        mc.run_model(weather, chunksize=chunksize)
+
+
+@pytest.mark.parametrize('method', ['run_model', 'run_model_from_poa'])
+def test_outputs(sapm_dc_snl_ac_system, location, weather, total_irrad,
+                 method):
+    data = pd.concat([weather, total_irrad], axis=1)
+    data['temp_air'] = 25.
+    expected = getattr(ModelChain(sapm_dc_snl_ac_system, location),
+                       method)(data).results
+    mc = ModelChain(sapm_dc_snl_ac_system, location,
+                    outputs=['ac', 'cell_temperature', 'weather'])
+    getattr(mc, method)(data)
+    assert_series_equal(mc.results.ac, expected.ac)
+    assert_series_equal(mc.results.cell_temperature,
+                        expected.cell_temperature)
+    assert_frame_equal(mc.results.weather, expected.weather)
+    assert mc.results.times.equals(expected.times)
+    for name in ['solar_position', 'airmass', 'total_irrad', 'aoi',
+                 'aoi_modifier', 'spectral_modifier', 'effective_irradiance',
+                 'dc', 'diode_params', 'losses']:
+        assert getattr(mc.results, name) is None
+    # the weather input is referenced, not copied
+    assert np.shares_memory(mc.results.weather['temp_air'].values,
+                            data['temp_air'].values)
+
+
+def test_outputs_invalid(sapm_dc_snl_ac_system, location):
+    with pytest.raises(ValueError, match="invalid outputs: \\['times'\\]"):
+        ModelChain(sapm_dc_snl_ac_system, location, outputs=['ac', 'times'])
+    mc = ModelChain(sapm_dc_snl_ac_system, location)
+    assert mc.outputs is None
+    with pytest.raises(ValueError, match='invalid outputs'):
+        mc.outputs = ['power']
+
+
+@pytest.fixture
+def fleet(pvwatts_dc_pvwatts_ac_system, location):
+    other = Location(location.latitude + 1, location.longitude,
+                     altitude=location.altitude)
+    systems = [pvwatts_dc_pvwatts_ac_system,
+               PVSystem(surface_tilt=10, surface_azimuth=160,
+                        module_parameters={'pdc0': 200, 'gamma_pdc': -0.004},
+                        temperature_model_parameters=(
+                            pvwatts_dc_pvwatts_ac_system.arrays[0]
+                            .temperature_model_parameters),
+                        inverter_parameters={'pdc0': 220,
+                                             'eta_inv_nom': 0.95})]
+    return pd.DataFrame({
+        'system': systems * 3,
+        'location': [location, location, location, other, other, location],
+        'weather': ['a', 'a', 'b', 'a', None, None],
+    }, index=['p0', 'p1', 'p2', 'p3', 'p4', 'p5'])
+
+
+@pytest.mark.parametrize('executor', [None, ThreadPoolExecutor])
+def test_run_fleet(fleet, weather_chunks, mocker, executor):
+    weather = {'a': weather_chunks, 'b': weather_chunks * 0.8}
+    fleet = fleet.iloc[:4]
+    m = mocker.spy(Location, 'get_solarposition')
+    kwargs = {'aoi_model': 'physical', 'spectral_model': 'no_loss'}
+    if executor is None:
+        results = modelchain.run_fleet(fleet, weather,
+                                       outputs=['ac', 'aoi'], **kwargs)
+    else:
+        with executor(max_workers=2) as ex:
+            results = modelchain.run_fleet(fleet, weather,
+                                           outputs=['ac', 'aoi'],
+                                           executor=ex, batchsize=1,
+                                           **kwargs)
+    # one solar position for each location and weather
+    assert m.call_count == 3
+    assert list(results) == ['ac', 'aoi']
+    for name, plant in fleet.iterrows():
+        mc = ModelChain(plant['system'], plant['location'], **kwargs)
+        mc.run_model(weather[plant['weather']])
+        assert_series_equal(results['ac'][name], mc.results.ac,
+                            check_names=False)
+        assert_series_equal(results['aoi'][name], mc.results.aoi,
+                            check_names=False)
+    assert list(results['ac'].columns) == list(fleet.index)
+
+
+def test_run_fleet_clearsky(fleet, weather_chunks, mocker):
+    times = weather_chunks.index
+    m = mocker.patch('pvlib.clearsky.lookup_linke_turbidity',
+                     return_value=np.full((2, len(times)), 3.))
+    results = modelchain.run_fleet(fleet, {'a': weather_chunks,
+                                           'b': weather_chunks},
+                                   times=times, aoi_model='no_loss',
+                                   spectral_model='no_loss',
+                                   outputs=['ac', 'weather',
+                                            'aoi_modifier'])
+    # one lookup for the two locations
+    assert m.call_count == 1
+    assert_allclose(m.call_args[0][1], [33.2, 32.2])
+    for name in ['p4', 'p5']:
+        plant = fleet.loc[name]
+        weather = plant['location'].get_clearsky(times, linke_turbidity=3.)
+        mc = ModelChain(plant['system'], plant['location'],
+                        aoi_model='no_loss', spectral_model='no_loss')
+        mc.run_model(weather)
+        assert_series_equal(results['ac'][name], mc.results.ac,
+                            check_names=False)
+        assert_frame_equal(results['weather'][name], mc.results.weather)
+    assert_frame_equal(results['aoi_modifier'],
+                       pd.DataFrame(1., index=times, columns=fleet.index))
+
+
+def test_run_fleet_arrays(sapm_dc_snl_ac_system_Array, location,
+                          weather_chunks):
+    fleet = pd.DataFrame({'system': [sapm_dc_snl_ac_system_Array],
+                          'location': [location], 'weather': ['a']},
+                         index=['p0'])
+    results = modelchain.run_fleet(
+        fleet, {'a': weather_chunks}, outputs=['dc'], aoi_model='no_loss',
+        spectral_model='no_loss')
+    mc = ModelChain(sapm_dc_snl_ac_system_Array, location,
+                    aoi_model='no_loss', spectral_model='no_loss')
+    mc.run_model(weather_chunks)
+    assert results['dc'].columns.nlevels == 3
+    for i in range(2):
+        assert_frame_equal(results['dc']['p0'][i], mc.results.dc[i])
+
+
+@pytest.mark.parametrize('output', ['tracking', 'diode_params'])
+def test_run_fleet_not_produced(fleet, weather_chunks, output):
+    # fixed systems with the pvwatts DC model have no tracking or single
+    # diode parameters
+    results = modelchain.run_fleet(fleet.iloc[:2], {'a': weather_chunks},
+                                   outputs=['ac', output],
+                                   aoi_model='no_loss',
+                                   spectral_model='no_loss')
+    assert_frame_equal(results[output],
+                       pd.DataFrame(np.nan, index=weather_chunks.index,
+                                    columns=fleet.index[:2]))
+    assert results['ac'].notna().any().all()
+
+
+def test_run_fleet_errors(fleet, weather_chunks):
+    weather = {'a': weather_chunks, 'b': weather_chunks}
+    with pytest.raises(ValueError, match='fleet index must be unique'):
+        modelchain.run_fleet(fleet.iloc[[0, 0]], weather)
+    with pytest.raises(ValueError, match='invalid outputs'):
+        modelchain.run_fleet(fleet.iloc[:2], weather, outputs=['times'])
+    with pytest.raises(ValueError, match='times must be given'):
+        modelchain.run_fleet(fleet, weather)
+
+
 def test_run_model_with_weather_noct_sam_temp(sapm_dc_snl_ac_system, location,
                                               weather, mocker):
     weather['wind_speed'] = 5
@@ -1469,6 +1760,88 @@ def test_aoi_model_no_loss(sapm_dc_snl_ac_system, location, weather):
     assert mc.results.ac.iloc[1] < 1
 
 
+@pytest.mark.parametrize('transposition_model',
+                         ['haydavies', 'perez', 'klucher'])
+def test_diffuse_aoi_model(sapm_dc_snl_ac_system, location, weather,
+                           transposition_model):
+    mc_no_loss = ModelChain(sapm_dc_snl_ac_system, location, dc_model='sapm',
+                            aoi_model='physical', spectral_model='no_loss',
+                            transposition_model=transposition_model)
+    mc_no_loss.run_model(weather)
+    assert mc_no_loss.results.diffuse_aoi_modifier == 1.0
+    assert 'poa_circumsolar' not in mc_no_loss.results.total_irrad
+    mc = ModelChain(sapm_dc_snl_ac_system, location, dc_model='sapm',
+                    aoi_model='physical', spectral_model='no_loss',
+                    transposition_model=transposition_model,
+                    diffuse_aoi_model='physical')
+    mc.run_model(weather)
+    modifier = mc.results.diffuse_aoi_modifier
+    assert isinstance(modifier, pd.DataFrame)
+    assert list(modifier.columns) == ['sky', 'horizon', 'ground']
+    total_irrad = mc.results.total_irrad
+    fd = sapm_dc_snl_ac_system.arrays[0].module_parameters['FD']
+    if transposition_model == 'klucher':
+        # klucher has no components, so the sky modifier is used for all
+        # sky diffuse
+        assert 'poa_circumsolar' not in total_irrad
+        poa_sky_diffuse = total_irrad['poa_sky_diffuse'] * modifier['sky']
+    else:
+        assert_series_equal(total_irrad['poa_isotropic']
+                            + total_irrad['poa_circumsolar']
+                            + total_irrad['poa_horizon'],
+                            total_irrad['poa_sky_diffuse'], check_names=False)
+        # circumsolar diffuse takes the beam modifier
+        poa_sky_diffuse = (
+            total_irrad['poa_isotropic'] * modifier['sky']
+            + total_irrad['poa_circumsolar'] * mc.results.aoi_modifier
+            + total_irrad['poa_horizon'] * modifier['horizon'])
+    expected = (total_irrad['poa_direct'] * mc.results.aoi_modifier
+                + fd * (poa_sky_diffuse + total_irrad['poa_ground_diffuse']
+                        * modifier['ground']))
+    assert_series_equal(mc.results.effective_irradiance, expected,
+                        check_names=False)
+    # diffuse IAM reduces effective irradiance
+    assert (mc.results.effective_irradiance
+            <= mc_no_loss.results.effective_irradiance).all()
+
+
+def test_diffuse_aoi_model_from_poa(sapm_dc_snl_ac_system, location,
+                                    total_irrad):
+    mc = ModelChain(sapm_dc_snl_ac_system, location, dc_model='sapm',
+                    aoi_model='physical', spectral_model='no_loss',
+                    diffuse_aoi_model='physical')
+    mc.run_model_from_poa(total_irrad)
+    modifier = mc.results.diffuse_aoi_modifier
+    # sky and ground diffuse are not given, so the sky modifier is used
+    expected = (total_irrad['poa_direct'] * mc.results.aoi_modifier
+                + total_irrad['poa_diffuse'] * modifier['sky'])
+    assert_series_equal(mc.results.effective_irradiance, expected,
+                        check_names=False)
+
+
+def test_diffuse_aoi_model_tracker_arrays(location, weather):
+    module_parameters = {'pdc0': 1, 'gamma_pdc': -0.004, 'b': 0.05}
+    temp_params = {'a': -3.47, 'b': -0.0594, 'deltaT': 3}
+    arrays = [pvsystem.Array(pvsystem.SingleAxisTrackerMount(),
+                             module_parameters=module_parameters,
+                             temperature_model_parameters=temp_params),
+              pvsystem.Array(pvsystem.FixedMount(30, 180),
+                             module_parameters=module_parameters,
+                             temperature_model_parameters=temp_params)]
+    system = PVSystem(arrays=arrays, inverter_parameters={'pdc0': 2})
+    mc = ModelChain(system, location, aoi_model='ashrae',
+                    spectral_model='no_loss', diffuse_aoi_model='ashrae')
+    mc.run_model(weather)
+    tracked, fixed = mc.results.diffuse_aoi_modifier
+    assert (fixed['sky'] == fixed['sky'].iloc[0]).all()
+    expected = iam.marion_diffuse(
+        'ashrae', system.arrays[0].mount.get_orientation(
+            mc.results.solar_position['apparent_zenith'],
+            mc.results.solar_position['azimuth'])['surface_tilt'],
+        tilt_step=1, b=0.05)
+    assert_series_equal(tracked['sky'], expected['sky'], check_names=False)
+
+
 def test_aoi_model_interp(sapm_dc_snl_ac_system, location, weather, mocker):
     # similar to test_aoi_models but requires arguments to work, so we
     # add 'interp' aoi losses model arguments to module
@@ -1755,7 +2128,7 @@ def test_invalid_dc_model_params(sapm_dc_snl_ac_system, cec_dc_snl_ac_system,
 
 @pytest.mark.parametrize('model', [
     'dc_model', 'ac_model', 'aoi_model', 'spectral_model',
-    'temperature_model', 'losses_model'
+    'temperature_model', 'losses_model', 'diffuse_aoi_model'
 ])
 def test_invalid_models(model, sapm_dc_snl_ac_system, location):
     kwargs = {'dc_model': 'pvwatts', 'ac_model': 'pvwatts',
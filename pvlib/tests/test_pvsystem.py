@@ -6,7 +6,8 @@ from numpy import nan, array
 import pandas as pd
 
 import pytest
-from .conftest import assert_series_equal, assert_frame_equal
+from .conftest import (assert_series_equal, assert_frame_equal,
+                       assert_index_equal)
 from numpy.testing import assert_allclose
 import unittest.mock as mock
 
@@ -73,6 +74,50 @@ def test_PVSystem_get_iam_interp(mocker):
     spy.assert_called_once_with(aoi[0], **interp_module_params)
 
 
+def test_PVSystem_get_iam_diffuse(mocker):
+    system = pvsystem.PVSystem(
+        arrays=[pvsystem.Array(mount=pvsystem.FixedMount(20, 180),
+                               module_parameters={'b': 0.04}),
+                pvsystem.Array(mount=pvsystem.SingleAxisTrackerMount(),
+                               module_parameters={'b': 0.04})])
+    spy = mocker.spy(_iam, 'marion_diffuse')
+    solar_zenith = pd.Series([30., 60., 120.])
+    solar_azimuth = pd.Series([150., 240., 0.])
+    fixed, tracked = system.get_iam_diffuse(solar_zenith, solar_azimuth,
+                                            iam_model='ashrae')
+    # fixed tilt is integrated directly, tracker tilts from the table
+    assert spy.call_args_list[0][1] == {'tilt_step': None, 'b': 0.04}
+    assert spy.call_args_list[1][1] == {'tilt_step': 1., 'b': 0.04}
+    expected = _iam.marion_diffuse('ashrae', 20, b=0.04)
+    for k, v in expected.items():
+        assert_allclose(fixed[k], v)
+    assert isinstance(tracked['sky'], pd.Series)
+    assert tracked['sky'].iloc[:2].notna().all()
+    assert np.isnan(tracked['sky'].iloc[2])
+
+
+@pytest.mark.parametrize('iam_model,model_params', [
+    ('sapm', None),
+    ('interp', {'iam_ref': (1., 0.8), 'theta_ref': (0., 80.)}),
+    ('schlick', {}),
+])
+def test_Array_get_iam_diffuse_models(iam_model, model_params,
+                                      sapm_module_params):
+    if model_params is None:
+        model_params = sapm_module_params
+    array = pvsystem.Array(mount=pvsystem.FixedMount(20, 180),
+                           module_parameters=model_params)
+    out = array.get_iam_diffuse(30., 180., iam_model=iam_model)
+    assert set(out) == {'sky', 'horizon', 'ground'}
+    assert 0.5 < out['sky'] < 1.
+
+
+def test_PVSystem_get_iam_diffuse_invalid():
+    system = pvsystem.PVSystem(module_parameters={'b': 0.04})
+    with pytest.raises(ValueError, match='not a valid IAM model'):
+        system.get_iam_diffuse(30., 180., iam_model='not_a_model')
+
+
 def test__normalize_sam_product_names():
 
     BAD_NAMES  = [' -.()[]:+/",', 'Module[1]']
@@ -155,6 +200,65 @@ def test_retrieve_sam_databases():
         assert item_per_database[database] in data.columns
 
 
+def test_retrieve_sam_cache(mocker):
+    pvsystem.clear_sam_cache()
+    spy = mocker.spy(pvsystem, '_parse_raw_sam_df')
+    first = pvsystem.retrieve_sam('sandiamod')
+    first.iloc[0, 0] = 'modified'
+    second = pvsystem.retrieve_sam('SandiaMod')
+    assert spy.call_count == 1
+    assert second.iloc[0, 0] != 'modified'
+    pvsystem.clear_sam_cache()
+    third = pvsystem.retrieve_sam('sandiamod')
+    assert spy.call_count == 2
+    assert_frame_equal(second, third)
+
+
+def test_retrieve_sam_product():
+    module = 'Canadian_Solar_CS6X_300M__2013_'
+    expected = pvsystem.retrieve_sam('sandiamod')[module]
+    out = pvsystem.retrieve_sam('sandiamod', product=module)
+    assert_series_equal(out, expected)
+    with pytest.raises(KeyError, match='not_a_module not found'):
+        pvsystem.retrieve_sam('sandiamod', product='not_a_module')
+
+
+def test_retrieve_sam_cache_dir(mocker, tmp_path):
+    pvsystem.clear_sam_cache()
+    spy = mocker.spy(pvsystem, '_parse_raw_sam_df')
+    expected = pvsystem.retrieve_sam('cecinverter', cache_dir=tmp_path)
+    assert len(list(tmp_path.glob('sam_database_*.pkl'))) == 1
+    pvsystem.clear_sam_cache()
+    out = pvsystem.retrieve_sam('cecinverter', cache_dir=tmp_path)
+    assert spy.call_count == 1
+    assert_frame_equal(out, expected)
+
+
+def test_retrieve_sam_cache_maxsize(mocker):
+    mocker.patch.object(pvsystem, 'SAM_CACHE_MAXSIZE', 2)
+    pvsystem.clear_sam_cache()
+    spy = mocker.spy(pvsystem, '_parse_raw_sam_df')
+    for name in ('sandiamod', 'cecinverter', 'adrinverter'):
+        pvsystem.retrieve_sam(name)
+    assert len(pvsystem._sam_databases) == 2
+    # reusing a database makes it the most recently used
+    pvsystem.retrieve_sam('cecinverter')
+    pvsystem.retrieve_sam('sandiamod')
+    assert spy.call_count == 4
+    pvsystem.retrieve_sam('cecinverter')
+    assert spy.call_count == 4
+    pvsystem.clear_sam_cache()
+
+
+def test_retrieve_sam_cache_dir_error(mocker, tmp_path):
+    pvsystem.clear_sam_cache()
+    mocker.patch('pickle.dump', side_effect=RuntimeError('disk full'))
+    with pytest.raises(RuntimeError, match='disk full'):
+        pvsystem.retrieve_sam('cecinverter', cache_dir=tmp_path)
+    # no partially written files are left behind
+    assert list(tmp_path.iterdir()) == []
+
+
 def test_sapm(sapm_module_params):
 
     times = pd.date_range(start='2015-01-01', periods=5, freq='12h')
@@ -1620,6 +1724,174 @@ def test_singlediode_series_expected(cec_module_params):
         assert_allclose(v, expected[k], atol=1e-6)
 
 
+@pytest.mark.parametrize('method', ['lambertw', 'brentq', 'newton'])
+def test_ivcurve(method):
+    IL = np.array([[7., 5., 0.], [6., 3., 1.]])
+    I0, Rs, Rsh, nNsVth = 6e-7, 0.1, np.array([20., 100., 1000.]), 0.5
+    current, voltage = pvsystem.ivcurve(IL, I0, Rs, Rsh, nNsVth, 11,
+                                        method=method, chunksize=4)
+    assert current.shape == voltage.shape == (2, 3, 11)
+    v_oc = pvsystem.v_from_i(0., IL, I0, Rs, Rsh, nNsVth)
+    expected_v = v_oc[..., np.newaxis] * np.linspace(0, 1, 11)
+    expected_i = pvsystem.i_from_v(expected_v, IL[..., np.newaxis], I0, Rs,
+                                   Rsh[:, np.newaxis], nNsVth)
+    assert_allclose(voltage, expected_v, atol=1e-10)
+    assert_allclose(current, expected_i, atol=1e-10)
+
+    # scalar inputs give a single curve
+    current, voltage = pvsystem.ivcurve(7., I0, Rs, 20., nNsVth, 11,
+                                        method=method)
+    assert_allclose(voltage, expected_v[0, 0], atol=1e-10)
+    assert_allclose(current, expected_i[0, 0], atol=1e-10)
+
+
+def test_ivcurve_out():
+    IL = pd.Series([7., 5., 0.5, np.nan, 3.])
+    args = (IL, 6e-7, 0.1, 20., 0.5, 6)
+    expected = pvsystem.ivcurve(*args)
+    out = (np.full((5, 6), -1.), np.full((5, 6), -1.))
+    result = pvsystem.ivcurve(*args, out=out, chunksize=2)
+    assert result[0] is out[0] and result[1] is out[1]
+    assert_allclose(out[0], expected[0])
+    assert_allclose(out[1], expected[1])
+    assert np.isnan(out[0][3]).all()
+    with pytest.raises(ValueError, match='out must be'):
+        pvsystem.ivcurve(*args, out=(np.empty((5, 5)), np.empty((5, 5))))
+    with pytest.raises(ValueError, match='out must be'):
+        pvsystem.ivcurve(*args, out=(np.empty((6, 5)).T, np.empty((5, 6))))
+
+
+def test_ivcurve_chunks():
+    IL = np.linspace(1., 8., 7)
+    args = (IL, 6e-7, 0.1, 20., 0.5, 5)
+    expected_i, expected_v = pvsystem.ivcurve(*args)
+    chunks = list(pvsystem.ivcurve_chunks(*args, chunksize=3))
+    assert [c[0] for c in chunks] == [slice(0, 3), slice(3, 6), slice(6, 7)]
+    for index, current, voltage in chunks:
+        assert_allclose(current, expected_i[index])
+        assert_allclose(voltage, expected_v[index])
+    with pytest.raises(ValueError, match='chunksize'):
+        next(pvsystem.ivcurve_chunks(*args, chunksize=0))
+
+
+@pytest.mark.parametrize('model, params', [
+    ('desoto', 'cec_module_params'),
+    ('cec', 'cec_module_params'),
+    ('pvsyst', 'pvsyst_module_params'),
+])
+@pytest.mark.parametrize('method', ['linear', 'cubic'])
+def test_SingleDiodeTable(model, params, method, request):
+    module_parameters = request.getfixturevalue(params)
+    table = pvsystem.SingleDiodeTable(model, module_parameters, method=method)
+    times = pd.date_range(start='2015-06-01', periods=4, freq='6h')
+    effective_irradiance = pd.Series([123., 456., 789., 1012.], index=times)
+    temp_cell = pd.Series([-5., 21., 33.3, 64.], index=times)
+    system = pvsystem.PVSystem(module_parameters=module_parameters)
+    expected = pvsystem.singlediode(*getattr(system, f'calcparams_{model}')(
+        effective_irradiance, temp_cell))
+
+    out = table.singlediode(effective_irradiance, temp_cell)
+    assert isinstance(out, pd.DataFrame)
+    assert_index_equal(out.index, expected.index)
+    for c in expected:
+        assert_allclose(out[c], expected[c], rtol=5e-3)
+    assert_allclose(out['p_mp'], expected['p_mp'],
+                    atol=table.max_error['p_mp'])
+    mpp = table.max_power_point(effective_irradiance, temp_cell)
+    assert_frame_equal(mpp, out[['i_mp', 'v_mp', 'p_mp']])
+
+    # scalars
+    out = table.singlediode(456., 21.)
+    assert isinstance(out, dict)
+    assert_allclose(out['p_mp'], expected['p_mp'].iloc[1],
+                    atol=table.max_error['p_mp'])
+    mpp = table.max_power_point(456., 21.)
+    assert isinstance(mpp, OrderedDict)
+    assert list(mpp) == ['i_mp', 'v_mp', 'p_mp']
+
+
+def test_SingleDiodeTable_outside_grid(cec_module_params):
+    table = pvsystem.SingleDiodeTable(
+        'desoto', cec_module_params, effective_irradiance=[0., 500., 1000.],
+        temp_cell=[0., 50.])
+    system = pvsystem.PVSystem(module_parameters=cec_module_params)
+    expected = pvsystem.singlediode(*system.calcparams_desoto(
+        np.array([1200., 800., np.nan]), np.array([25., 60., 25.])))
+    out = table.singlediode(np.array([1200., 800., np.nan]),
+                            np.array([25., 60., 25.]))
+    assert_frame_equal(out, expected)
+
+
+def test_SingleDiodeTable_atol(cec_module_params):
+    coarse = pvsystem.SingleDiodeTable('desoto', cec_module_params,
+                                       effective_irradiance=[0., 500., 1000.],
+                                       temp_cell=[0., 50.])
+    fine = pvsystem.SingleDiodeTable('desoto', cec_module_params,
+                                     effective_irradiance=[0., 500., 1000.],
+                                     temp_cell=[0., 50.], atol=0.05)
+    assert fine.max_error['p_mp'] <= 0.05 < coarse.max_error['p_mp']
+    assert fine.effective_irradiance.size > 3
+    with pytest.warns(UserWarning, match='exceeds atol'):
+        pvsystem.SingleDiodeTable('desoto', cec_module_params,
+                                  effective_irradiance=[0., 500., 1000.],
+                                  temp_cell=[0., 50.], atol=1e-6,
+                                  max_refine=1)
+
+
+def test_SingleDiodeTable_cache(cec_module_params, tmp_path, mocker):
+    table = pvsystem.SingleDiodeTable('desoto', cec_module_params,
+                                      cache_dir=tmp_path)
+    assert table.key in pvsystem._singlediode_tables
+    files = list(tmp_path.glob('*.npz'))
+    assert len(files) == 1
+    # reused from memory, then from disk, without recalculating
+    spy = mocker.spy(pvsystem.SingleDiodeTable, '_build')
+    again = pvsystem.SingleDiodeTable('desoto', cec_module_params)
+    pvsystem.clear_singlediode_table_cache()
+    loaded = pvsystem.SingleDiodeTable('desoto', cec_module_params,
+                                       cache_dir=tmp_path)
+    assert spy.call_count == 0
+    for other in (again, loaded):
+        assert_allclose(other.temp_cell, table.temp_cell)
+        for c, v in table.points.items():
+            assert_allclose(other.points[c], v)
+        assert other.max_error == table.max_error
+    # explicit save
+    table.save(tmp_path / 'table.npz')
+    assert (tmp_path / 'table.npz').exists()
+
+
+def test_SingleDiodeTable_cache_maxsize(cec_module_params, mocker):
+    mocker.patch.object(pvsystem, 'SINGLEDIODE_TABLE_CACHE_MAXSIZE', 2)
+    pvsystem.clear_singlediode_table_cache()
+    tables = [
+        pvsystem.SingleDiodeTable('desoto', cec_module_params,
+                                  temp_cell=[0., temp_max])
+        for temp_max in (40., 50., 60.)]
+    assert list(pvsystem._singlediode_tables) == [t.key for t in tables[1:]]
+    # reusing a table makes it the most recently used
+    pvsystem.SingleDiodeTable('desoto', cec_module_params,
+                              temp_cell=[0., 50.])
+    expected = [tables[2].key, tables[1].key]
+    assert list(pvsystem._singlediode_tables) == expected
+    pvsystem.clear_singlediode_table_cache()
+    assert len(pvsystem._singlediode_tables) == 0
+
+
+def test_SingleDiodeTable_errors(cec_module_params):
+    with pytest.raises(ValueError, match='model must be one of'):
+        pvsystem.SingleDiodeTable('sapm', cec_module_params)
+    with pytest.raises(ValueError, match="method must be"):
+        pvsystem.SingleDiodeTable('desoto', cec_module_params,
+                                  method='nearest')
+    with pytest.raises(ValueError, match='temp_cell must be increasing'):
+        pvsystem.SingleDiodeTable('desoto', cec_module_params,
+                                  temp_cell=[25., 0., 50.])
+    with pytest.raises(ValueError, match='at least 4 values'):
+        pvsystem.SingleDiodeTable('desoto', cec_module_params,
+                                  temp_cell=[0., 25., 50.], method='cubic')
+
+
 def test_scale_voltage_current_power():
     data = pd.DataFrame(
         np.array([[2, 1.5, 10, 8, 12, 0.5, 1.5]]),
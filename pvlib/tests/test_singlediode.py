@@ -2,15 +2,18 @@
 testing single-diode methods using JW Bishop 1988
 """
 
+import os
+from importlib import reload
+
 import numpy as np
 import pandas as pd
 import scipy
-from pvlib import pvsystem
+from pvlib import _numba, pvsystem, singlediode
 from pvlib.singlediode import (bishop88_mpp, estimate_voc, VOLTAGE_BUILTIN,
                                bishop88, bishop88_i_from_v, bishop88_v_from_i)
 import pytest
-from numpy.testing import assert_array_equal
-from .conftest import DATA_DIR
+from numpy.testing import assert_array_equal, assert_allclose
+from .conftest import DATA_DIR, requires_numba
 
 POA = 888
 TCELL = 55
@@ -202,6 +205,65 @@ def test_v_from_i_i_from_v_precision(method, precise_iv_curves):
         assert np.allclose(v, out_v, atol=1e-10, rtol=0)
 
 
+@pytest.fixture
+def singlediode_numba():
+    """Reload pvlib.singlediode with the compiled lambertw engine."""
+    os.environ['PVLIB_USE_NUMBA'] = '1'
+    try:
+        reload(_numba)
+        yield reload(singlediode)
+    finally:
+        del os.environ['PVLIB_USE_NUMBA']
+        reload(_numba)
+        reload(singlediode)
+
+
+@requires_numba
+def test_singlediode_numba_precision(singlediode_numba, precise_iv_curves):
+    assert _numba.USE_NUMBA
+    x, pc = precise_iv_curves
+    outs = pvsystem.singlediode(method='lambertw', **x)
+
+    assert np.allclose(pc['i_sc'], outs['i_sc'], atol=1e-10, rtol=0)
+    assert np.allclose(pc['v_oc'], outs['v_oc'], atol=1e-10, rtol=0)
+    assert np.allclose(pc['i_mp'], outs['i_mp'], atol=7e-8, rtol=0)
+    assert np.allclose(pc['v_mp'], outs['v_mp'], atol=1e-6, rtol=0)
+    assert np.allclose(pc['p_mp'], outs['p_mp'], atol=1e-10, rtol=0)
+    assert np.allclose(pc['i_x'], outs['i_x'], atol=1e-10, rtol=0)
+    assert np.allclose(pc['i_xx'], outs['i_xx'], atol=1e-6, rtol=0)
+
+    pc_i, pc_v = pc['Currents'], pc['Voltages']
+    for i, v, (_, x_one_curve) in zip(pc_i, pc_v, x.iterrows()):
+        out_i = pvsystem.i_from_v(voltage=v, method='lambertw', **x_one_curve)
+        out_v = pvsystem.v_from_i(current=i, method='lambertw', **x_one_curve)
+        assert np.allclose(i, out_i, atol=1e-10, rtol=0)
+        assert np.allclose(v, out_v, atol=1e-10, rtol=0)
+
+
+@requires_numba
+def test_singlediode_numba_explicit_and_nan(singlediode_numba):
+    il, io, a = 7., 6e-7, 0.5
+    v = np.array([0., 1., 5., np.nan])
+    # Rs = 0 has an explicit solution for current
+    i = pvsystem.i_from_v(v, il, io, 0., 20., a)
+    assert_allclose(i, il - io * np.expm1(v / a) - v / 20.)
+    # Rsh = inf has an explicit solution for voltage
+    i = np.array([0., 1., 5., np.nan])
+    v = pvsystem.v_from_i(i, il, io, 0.1, np.inf, a)
+    assert_allclose(v, a * np.log1p((il - i) / io) - 0.1 * i)
+    # scalar inputs return scalars
+    out = pvsystem.singlediode(il, io, 0.1, 20., a)
+    assert isinstance(out['p_mp'], float)
+    assert isinstance(pvsystem.i_from_v(1., il, io, 0.1, 20., a), float)
+    # a LambertW argument that overflows exp is handled in log space
+    v_oc = pvsystem.v_from_i(0., il, io, 0.1, 1e9, a)
+    assert_allclose(v_oc, a * np.log1p(il / io), rtol=1e-6)
+    # NaN parameters give NaN
+    out = pvsystem.singlediode(np.array([il, np.nan]), io, 0.1, 20., a)
+    assert out.iloc[1].isna().all()
+    assert out.iloc[0].notna().all()
+
+
 def get_pvsyst_fs_495():
     """
     PVsyst parameters for First Solar FS-495 module from PVSyst-6.7.2 database.
@@ -547,6 +609,60 @@ def test_bishop88_full_output_kwarg(method, bishop88_arguments):
     assert len(ret_val[1]) >= 2
 
 
+def test_bishop88_brentq_array(bishop88_arguments):
+    """test vectorized brentq on arrays matches brentq on scalars"""
+    scale = np.array([0.2, 0.5, 1.0, 1.3])
+    args = {**bishop88_arguments,
+            'photocurrent': bishop88_arguments['photocurrent'] * scale}
+    expected = [bishop88_mpp(**{**args, 'photocurrent': il},
+                             method='brentq')
+                for il in args['photocurrent']]
+    expected = np.array(expected).T
+    result = bishop88_mpp(**args, method='brentq')
+    assert_allclose(result, expected, rtol=1e-10)
+
+    i = bishop88_i_from_v(result[1], **args, method='brentq')
+    assert_allclose(i, result[0], rtol=1e-10)
+    v = bishop88_v_from_i(result[0], **args, method='brentq')
+    assert_allclose(v, result[1], rtol=1e-10)
+
+    (i, v, p), (vd, converged, iterations) = bishop88_mpp(
+        **args, method='brentq', method_kwargs={'full_output': True})
+    assert_allclose(p, result[2], rtol=1e-10)
+    assert converged.shape == scale.shape
+    assert converged.all()
+
+
+def test_bishop88_newton_warm_start(bishop88_arguments):
+    scale = np.array([0.2, 0.5, 1.0, 1.3])
+    args = {**bishop88_arguments,
+            'photocurrent': bishop88_arguments['photocurrent'] * scale}
+    (i, v, p), (vd, _, _) = bishop88_mpp(
+        **args, method='newton', method_kwargs={'full_output': True})
+    # warm start from a nearby solution, with one poor guess that falls
+    # back to the default initial guess
+    x0 = vd * 1.01
+    x0[0] = -5.
+    (i2, v2, p2), (vd2, converged, zero_der) = bishop88_mpp(
+        **args, method='newton',
+        method_kwargs={'x0': x0, 'full_output': True})
+    assert_allclose(p2, p, rtol=1e-12)
+    assert_allclose(vd2, vd, rtol=1e-8)
+    assert converged.all()
+
+    i3 = bishop88_i_from_v(v, **args, method='newton',
+                           method_kwargs={'x0': vd * 0.99})
+    assert_allclose(i3, i, rtol=1e-8)
+    v3 = bishop88_v_from_i(i, **args, method='newton',
+                           method_kwargs={'x0': vd * 0.99})
+    assert_allclose(v3, v, rtol=1e-8)
+    # scalar inputs
+    v4 = bishop88_v_from_i(i[2], **bishop88_arguments, method='newton',
+                           method_kwargs={'x0': vd[2] * 0.99})
+    assert isinstance(v4, float)
+    assert_allclose(v4, v[2], rtol=1e-8)
+
+
 @pytest.mark.parametrize('method', ['newton', 'brentq'])
 def test_bishop88_pdSeries_len_one(method, bishop88_arguments):
     for k, v in bishop88_arguments.items():
@@ -140,6 +140,82 @@ def test_spa_python_numpy_physical_dst(expected_solpos, golden):
     assert_frame_equal(expected_solpos, ephem_data[expected_solpos.columns])
 
 
+def test_spa_python_numpy_array_location(golden):
+    times = pd.date_range('2003-10-17 13:30:30', periods=3, freq='h',
+                          tz=golden.tz)
+    latitudes = pd.Series([golden.latitude, 0., -golden.latitude])
+    longitudes = np.array([golden.longitude, 10., golden.longitude])
+    ephem_data = solarposition.spa_python(times, latitudes, longitudes,
+                                          altitude=golden.altitude,
+                                          how='numpy')
+    for i, (lat, lon) in enumerate(zip(latitudes, longitudes)):
+        expected = solarposition.spa_python(times[i:i+1], lat, lon,
+                                            altitude=golden.altitude,
+                                            how='numpy')
+        assert_frame_equal(expected, ephem_data.iloc[i:i+1])
+
+
+@pytest.mark.parametrize('delta_t', [67.0, None])
+def test_spa_python_sites(golden, delta_t):
+    times = pd.date_range('2003-10-17', periods=48, freq='h', tz=golden.tz)
+    latitudes = pd.Series([golden.latitude, 0., -60.], index=['a', 'b', 'c'])
+    altitudes = [golden.altitude, 0., 1000.]
+    result = solarposition.spa_python_sites(times, latitudes,
+                                            golden.longitude,
+                                            altitude=altitudes,
+                                            delta_t=delta_t)
+    assert result.columns.names == [None, 'site']
+    for site, lat, alt in zip(latitudes.index, latitudes, altitudes):
+        expected = solarposition.spa_python(times, lat, golden.longitude,
+                                            altitude=alt, delta_t=delta_t,
+                                            how='numpy')
+        actual = result.xs(site, axis=1, level='site')[expected.columns]
+        assert_frame_equal(expected, actual, check_names=False)
+
+
+def test_spa_python_cache(golden):
+    solarposition.clear_spa_cache()
+    times = pd.date_range('2003-10-17', periods=24, freq='h', tz=golden.tz)
+    expected = solarposition.spa_python(times, golden.latitude,
+                                        golden.longitude, how='numpy')
+    for _ in range(2):
+        result = solarposition.spa_python(times, golden.latitude,
+                                          golden.longitude, cache=True)
+        assert_frame_equal(expected, result)
+    assert len(solarposition._spa_cache) == 1
+    # another location reuses the cached entry
+    solarposition.spa_python(times, 0., 0., cache=True)
+    assert len(solarposition._spa_cache) == 1
+    # different delta_t is a different entry
+    solarposition.spa_python(times, 0., 0., delta_t=None, cache=True)
+    assert len(solarposition._spa_cache) == 2
+    solarposition.clear_spa_cache()
+    assert len(solarposition._spa_cache) == 0
+
+
+def test_spa_python_cache_eviction(golden, monkeypatch):
+    solarposition.clear_spa_cache()
+    # room for the terms of two 24-element time indexes
+    monkeypatch.setattr(solarposition, 'SPA_CACHE_MAXSIZE', 2 * 5 * 24 * 8)
+    times = pd.date_range('2003-10-17', periods=24, freq='h', tz=golden.tz)
+    for day in range(3):
+        solarposition.spa_python(times + pd.Timedelta(days=day),
+                                 golden.latitude, golden.longitude,
+                                 cache=True)
+    assert len(solarposition._spa_cache) == 2
+    first = solarposition._spa_cache_key(
+        solarposition._datetime_to_unixtime(times), 67.0)
+    assert first not in solarposition._spa_cache
+    solarposition.clear_spa_cache()
+
+
+def test_spa_python_cache_numba_raises(golden):
+    times = pd.date_range('2003-10-17', periods=2, freq='h', tz=golden.tz)
+    with pytest.raises(ValueError, match="requires how='numpy'"):
+        solarposition.spa_python(times, golden.latitude, golden.longitude,
+                                 how='numba', cache=True)
+
+
 @pytest.mark.parametrize('delta_t', [65.0, None, np.array([65, 65])])
 def test_sun_rise_set_transit_spa(expected_rise_set_spa, golden, delta_t):
     # solution from NREL SAP web calculator
@@ -318,6 +394,68 @@ def test_sun_rise_set_transit_ephem_horizon(golden):
     assert_series_equal(expected, result_rounded)
 
 
+@pytest.mark.parametrize('next_or_previous', ['next', 'previous'])
+def test_sun_rise_set_transit_iterative(expected_rise_set_ephem, golden,
+                                        next_or_previous):
+    # same days as the USNO values in expected_rise_set_ephem
+    times = pd.DatetimeIndex([datetime.datetime(2015, 1, 1, 3, 0, 0),
+                              datetime.datetime(2015, 1, 2, 10, 15, 0),
+                              datetime.datetime(2015, 1, 2, 15, 3, 0),
+                              datetime.datetime(2015, 1, 3, 21, 6, 7)
+                              ]).tz_localize('MST')
+    if next_or_previous == 'next':
+        days = {'sunrise': ['2015-01-01', '2015-01-03', '2015-01-03',
+                            '2015-01-04'],
+                'sunset': ['2015-01-01', '2015-01-02', '2015-01-02',
+                           '2015-01-04'],
+                'transit': ['2015-01-01', '2015-01-02', '2015-01-03',
+                            '2015-01-04']}
+    else:
+        days = {'sunrise': ['2014-12-31', '2015-01-02', '2015-01-02',
+                            '2015-01-03'],
+                'sunset': ['2014-12-31', '2015-01-01', '2015-01-01',
+                           '2015-01-03'],
+                'transit': ['2014-12-31', '2015-01-01', '2015-01-02',
+                            '2015-01-03']}
+    result = solarposition.sun_rise_set_transit_iterative(
+        times, golden.latitude, golden.longitude,
+        next_or_previous=next_or_previous, altitude=golden.altitude)
+    assert list(result.columns) == ['sunrise', 'sunset', 'transit']
+    for col, data in result.items():
+        # events fall on the expected local days
+        assert_series_equal(
+            data.dt.tz_convert('MST').dt.normalize(),
+            pd.Series(pd.DatetimeIndex(days[col]).tz_localize('MST'),
+                      index=times, name=col))
+        assert (data > times).all() == (next_or_previous == 'next')
+    # compare to USNO, to the nearest minute
+    for col in ['sunrise', 'sunset', 'transit']:
+        event = result[col].dt.tz_convert('MST')
+        day = event.dt.normalize()
+        known = day.isin(expected_rise_set_ephem.index)
+        expected = expected_rise_set_ephem.loc[day[known], col]
+        assert known.sum() >= 2
+        assert (event[known].dt.round('min').values == expected.values).all()
+
+
+def test_sun_rise_set_transit_iterative_polar():
+    times = pd.date_range('2015-06-01', periods=4, freq='7h', tz='UTC')
+    result = solarposition.sun_rise_set_transit_iterative(times, 80., 0.)
+    assert result[['sunrise', 'sunset']].isna().all().all()
+    assert result['transit'].notna().all()
+
+
+def test_sun_rise_set_transit_iterative_error(golden):
+    times = pd.DatetimeIndex([datetime.datetime(2015, 1, 2, 3, 0, 0)])
+    with pytest.raises(ValueError, match='localized'):
+        solarposition.sun_rise_set_transit_iterative(
+            times, golden.latitude, golden.longitude)
+    with pytest.raises(ValueError, match='next_or_previous'):
+        solarposition.sun_rise_set_transit_iterative(
+            times.tz_localize('MST'), golden.latitude, golden.longitude,
+            next_or_previous='other')
+
+
 @requires_ephem
 def test_pyephem_physical(expected_solpos, golden_mst):
     times = pd.date_range(datetime.datetime(2003, 10, 17, 12, 30, 30),
@@ -546,6 +684,61 @@ def test_get_solarposition_method_pyephem(expected_solpos, golden):
     assert_frame_equal(expected_solpos, ephem_data[expected_solpos.columns])
 
 
+@pytest.mark.parametrize('latitude, longitude, start', [
+    (39.742476, -105.1786, '2003-10-17'),
+    # sun stays up and azimuth wraps through north
+    (70., 20., '2020-06-21'),
+    # sun passes close to zenith
+    (23.4, 0., '2020-06-21'),
+])
+@pytest.mark.parametrize('step', ['5min', '15min'])
+def test_spa_python_interp(latitude, longitude, start, step):
+    times = pd.date_range(start, periods=3*1440, freq='1min', tz='UTC')
+    expected = solarposition.spa_python(times, latitude, longitude,
+                                        altitude=1000, pressure=90000,
+                                        temperature=20, how='numpy')
+    result = solarposition.spa_python_interp(times, latitude, longitude,
+                                             altitude=1000, pressure=90000,
+                                             temperature=20, step=step)
+    assert list(result.columns) == list(expected.columns)
+    angles = ['apparent_zenith', 'zenith', 'apparent_elevation', 'elevation']
+    assert_frame_equal(expected[angles], result[angles], check_exact=False,
+                       rtol=0, atol=1e-5)
+    azimuth_diff = (result['azimuth'] - expected['azimuth'] + 180) % 360 - 180
+    sin_zenith = np.sin(np.radians(expected['zenith']))
+    assert (np.abs(azimuth_diff) * sin_zenith).max() < 1e-5
+    assert_series_equal(expected['equation_of_time'],
+                        result['equation_of_time'], check_exact=False,
+                        rtol=0, atol=1e-6)
+
+
+@pytest.mark.parametrize('delta_t', [None, 'array'])
+def test_get_solarposition_nrel_interp(golden, delta_t):
+    times = pd.date_range('2003-10-17', periods=720, freq='2min',
+                          tz=golden.tz)
+    if delta_t == 'array':
+        delta_t = np.linspace(60, 70, len(times))
+    expected = solarposition.spa_python(times, golden.latitude,
+                                        golden.longitude, delta_t=delta_t)
+    result = solarposition.get_solarposition(times, golden.latitude,
+                                             golden.longitude,
+                                             method='nrel_interp',
+                                             delta_t=delta_t)
+    assert_frame_equal(expected, result, check_exact=False, rtol=0,
+                       atol=1e-5)
+
+
+def test_spa_python_interp_short_series(golden):
+    # fewer values than the coarse grid, spa_python is used directly
+    times = pd.DatetimeIndex(['2003-10-17 12:00', '2003-10-19 12:00'],
+                             tz=golden.tz)
+    expected = solarposition.spa_python(times, golden.latitude,
+                                        golden.longitude)
+    result = solarposition.spa_python_interp(times, golden.latitude,
+                                             golden.longitude)
+    assert_frame_equal(expected, result)
+
+
 @pytest.mark.parametrize('delta_t', [64.0, None, np.array([64, 64])])
 def test_nrel_earthsun_distance(delta_t):
     times = pd.DatetimeIndex([datetime.datetime(2015, 1, 2),
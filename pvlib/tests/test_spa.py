@@ -248,6 +248,25 @@ class SpaBase:
                             spa_out_0, 5)
         assert_almost_equal(np.array([[v, alpha, delta]]).T, spa_out_1, 5)
 
+    def test_solar_position_per_element_location(self):
+        times = np.repeat(unixtimes, 3)
+        lats = np.array([lat, -lat, lat + 10])
+        lons = np.array([lon, lon + 90, lon])
+        elevs = np.array([elev, 0, elev])
+        with warnings.catch_warnings():
+            # don't warn on method reload
+            warnings.simplefilter("ignore")
+            result = self.spa.solar_position(
+                times, lats, lons, elevs, pressure, temp, delta_t,
+                atmos_refract, numthreads=2)
+            expected = np.concatenate([
+                self.spa.solar_position(unixtimes, la, lo, el, pressure,
+                                        temp, delta_t, atmos_refract)
+                for la, lo, el in zip(lats, lons, elevs)], axis=1)
+        assert_almost_equal(expected, result, 8)
+        assert_almost_equal(np.array([theta, theta0, e, e0, Phi]),
+                            result[:-1, 0], 5)
+
     def test_equation_of_time(self):
         eot = 14.64
         M = self.spa.sun_mean_longitude(JME)
@@ -1,11 +1,14 @@
+import os
+from importlib import reload
+
 import pandas as pd
 import numpy as np
 
 import pytest
-from .conftest import DATA_DIR, assert_series_equal
+from .conftest import DATA_DIR, assert_series_equal, requires_numba
 from numpy.testing import assert_allclose
 
-from pvlib import temperature, tools
+from pvlib import _numba, temperature, tools
 from pvlib._deprecation import pvlibDeprecationWarning
 
 import re
@@ -242,6 +245,60 @@ def test_fuentes_timezone(tz):
                                        name='tmod'))
 
 
+@pytest.fixture
+def fuentes_week():
+    data = _read_pvwatts_8760(DATA_DIR / 'pvwatts_8760_rackmount.csv')
+    data = data.iloc[:24*7, :]
+    return (data['Plane of Array Irradiance (W/m^2)'],
+            data['Ambient Temperature (C)'], data['Wind Speed (m/s)'])
+
+
+def test_fuentes_columns(fuentes_week):
+    poa_global, temp_air, wind_speed = fuentes_week
+    expected = pd.DataFrame({
+        'rack': temperature.fuentes(poa_global, temp_air, wind_speed, 45),
+        'roof': temperature.fuentes(poa_global * 0.9, temp_air, wind_speed,
+                                    49, surface_tilt=10, module_height=3),
+    })
+    poa = pd.DataFrame({'rack': poa_global, 'roof': poa_global * 0.9})
+    out = temperature.fuentes(poa, temp_air, wind_speed, [45, 49],
+                              surface_tilt=[30, 10], module_height=[5, 3])
+    assert isinstance(out, pd.DataFrame)
+    assert_allclose(out, expected, rtol=0, atol=1e-12)
+    # weather given per column
+    out = temperature.fuentes(poa, pd.concat([temp_air] * 2, axis=1),
+                              pd.concat([wind_speed] * 2, axis=1), [45, 49],
+                              surface_tilt=[30, 10], module_height=[5, 3])
+    assert_allclose(out, expected, rtol=0, atol=1e-12)
+
+
+def test_fuentes_tol(fuentes_week):
+    fixed = temperature.fuentes(*fuentes_week, 45, tol=0)
+    out = temperature.fuentes(*fuentes_week, 45)
+    assert_allclose(out, fixed, rtol=0, atol=1e-5)
+    out = temperature.fuentes(*fuentes_week, 45, tol=1e-2)
+    assert_allclose(out, fixed, rtol=0, atol=0.1)
+
+
+@requires_numba
+def test_fuentes_numba(fuentes_week):
+    poa_global, temp_air, wind_speed = fuentes_week
+    poa = pd.DataFrame({'rack': poa_global, 'roof': poa_global * 0.9})
+    args = (poa, temp_air, wind_speed, [45, 49])
+    expected = temperature.fuentes(*args, tol=0)
+    os.environ['PVLIB_USE_NUMBA'] = '1'
+    try:
+        reload(_numba)
+        assert _numba.USE_NUMBA
+        temperature_numba = reload(temperature)
+        out = temperature_numba.fuentes(*args, tol=0)
+    finally:
+        del os.environ['PVLIB_USE_NUMBA']
+        reload(_numba)
+        reload(temperature)
+    assert_allclose(out, expected, rtol=0, atol=1e-10)
+
+
 def test_noct_sam():
     poa_global, temp_air, wind_speed, noct, module_efficiency = (
         1000., 25., 1., 45., 0.2)
@@ -3,7 +3,7 @@ import pytest
 from pvlib import tools
 import numpy as np
 import pandas as pd
-from numpy.testing import assert_allclose
+from numpy.testing import assert_allclose, assert_array_equal
 
 
 @pytest.mark.parametrize('keys, input_dict, expected', [
@@ -92,6 +92,113 @@ def test__golden_sect_DataFrame_nans():
     assert np.allclose(x, expected, atol=1e-8, equal_nan=True)
 
 
+def _obj_test_chandrupatla(x, c, n):
+    return x**n - c
+
+
+def test__chandrupatla():
+    c = np.array([2., 0.5, 10., 1e-6])
+    n = np.array([2., 3., 0.5, 1.])
+    x = tools._chandrupatla(_obj_test_chandrupatla, 0., 200., args=(c, n))
+    assert_allclose(x, c**(1 / n), rtol=1e-12)
+    # 2-D broadcasting with scalar arguments passed through
+    x = tools._chandrupatla(_obj_test_chandrupatla, np.zeros((2, 3)), 10.,
+                            args=(np.array([1., 4., 9.]), 2.))
+    assert x.shape == (2, 3)
+    assert_allclose(x, [[1., 2., 3.]] * 2, rtol=1e-12)
+
+
+def test__chandrupatla_ends_and_nans():
+    c = np.array([0., 4., np.nan])
+    x = tools._chandrupatla(_obj_test_chandrupatla, 0., 2., args=(c, 2.))
+    assert_allclose(x, [0., 2., np.nan], equal_nan=True)
+
+
+def test__chandrupatla_full_output():
+    x, converged, iterations = tools._chandrupatla(
+        _obj_test_chandrupatla, 0., 2., args=(np.array([1., 2.]), 2.),
+        full_output=True)
+    assert_allclose(x, [1., np.sqrt(2)], rtol=1e-12)
+    assert converged.all()
+    assert 0 < iterations < 100
+
+
+def test__chandrupatla_errors():
+    with pytest.raises(ValueError, match='different signs'):
+        tools._chandrupatla(_obj_test_chandrupatla, 0., 1.,
+                            args=(np.array([0.5, 4.]), 2.))
+    with pytest.raises(RuntimeError, match='Failed to converge'):
+        tools._chandrupatla(_obj_test_chandrupatla, 0., 2.,
+                            args=(np.array([2.]), 2.), maxiter=2)
+    x, converged, _ = tools._chandrupatla(
+        _obj_test_chandrupatla, 0., 2., args=(np.array([2.]), 2.),
+        maxiter=2, full_output=True, disp=False)
+    assert not converged.any()
+    assert 0 < x[0] < 2
+
+
+@pytest.mark.parametrize('xtol,maxiter', [(2e-12, 100), (0.01, 25),
+                                          (1e-6, 5)])
+def test__bisect(xtol, maxiter):
+    from scipy.optimize import bisect
+    c = np.array([2., 0.5, 10., 1e-6, 0.1])
+    n = np.array([2., 3., 0.5, 1., 2.])
+    b = np.array([200., 20., 200., 1., 2.])
+    x, converged, iterations = tools._bisect(
+        _obj_test_chandrupatla, 0., b, args=(c, n), xtol=xtol,
+        maxiter=maxiter)
+    for i in range(len(c)):
+        root, result = bisect(_obj_test_chandrupatla, 0., b[i],
+                              args=(c[i], n[i]), xtol=xtol, maxiter=maxiter,
+                              full_output=True, disp=False)
+        assert x[i] == root
+        assert converged[i] == result.converged
+        assert iterations[i] == result.iterations
+
+
+def test__bisect_ends_sign_and_nans():
+    x, converged, iterations = tools._bisect(
+        _obj_test_chandrupatla, 0., np.ones((2, 3)),
+        args=(np.array([[4., 0.5, 0.], [np.nan, 0.25, 1.]]), 2.))
+    assert x.shape == (2, 3)
+    assert_allclose(x, [[np.nan, np.sqrt(0.5), 0.], [np.nan, 0.5, 1.]],
+                    equal_nan=True)
+    assert_array_equal(converged, [[False, True, True], [False, True, True]])
+    assert_array_equal(iterations[:, 0], [-1, -1])
+    assert (iterations[:, 1] > 0).all()
+    assert_array_equal(iterations[:, 2], [0, 0])
+
+
+def _obj_test_masked_newton(x, c):
+    return x**2 - c
+
+
+def _der_test_masked_newton(x, c):
+    return 2 * x
+
+
+def test__masked_newton():
+    c = np.array([[1., 4.], [9., np.nan]])
+    x, converged, zero_der = tools._masked_newton(
+        _obj_test_masked_newton, _der_test_masked_newton, 1., args=(c,))
+    assert_allclose(x, np.sqrt(c), equal_nan=True)
+    assert_array_equal(converged, [[True, True], [True, False]])
+    assert not zero_der.any()
+    # zero derivative
+    x, converged, zero_der = tools._masked_newton(
+        _obj_test_masked_newton, _der_test_masked_newton, 0.,
+        args=(np.array([1., 4.]),))
+    assert zero_der.all()
+    assert not converged.any()
+    # iterates above upper are stopped
+    x, converged, zero_der = tools._masked_newton(
+        _obj_test_masked_newton, _der_test_masked_newton,
+        np.array([0.1, 1.5]), args=(2.,), upper=1.5)
+    assert_array_equal(converged, [False, True])
+    assert_allclose(x[1], np.sqrt(2.))
+    assert x[0] > 1.5
+
+
 def test_degrees_to_index_1():
     """Test that _degrees_to_index raises an error when something other than
     'latitude' or 'longitude' is passed."""
@@ -99,6 +206,27 @@ def test_degrees_to_index_1():
         tools._degrees_to_index(degrees=22.0, coordinate='width')
 
 
+def test_degrees_to_index_array():
+    degrees = np.array([[90., 32.125], [-89.99, -90.]])
+    index = tools._degrees_to_index(degrees, coordinate='latitude')
+    expected = [[tools._degrees_to_index(d, coordinate='latitude')
+                 for d in row] for row in degrees]
+    assert_array_equal(index, expected)
+    assert_array_equal(index, [[0, 694], [2159, 2159]])
+    assert isinstance(tools._degrees_to_index(180., 'longitude'), int)
+    with pytest.raises(IndexError, match='-180.1, is out of range'):
+        tools._degrees_to_index([0., -180.1, 200.], coordinate='longitude')
+
+
+def test__components_to_datetimeindex():
+    out = tools._components_to_datetimeindex(
+        [2019, 2020, 2020, 1969], [1, 2, 12, 12], [1, 29, 31, 31],
+        [0, 23, 24, 5], [5, 0, 0, 30])
+    expected = pd.DatetimeIndex(['2019-01-01 00:05', '2020-02-29 23:00',
+                                 '2021-01-01 00:00', '1969-12-31 05:30'])
+    pd.testing.assert_index_equal(out, expected)
+
+
 @pytest.mark.parametrize('args, args_idx', [
     # no pandas.Series or pandas.DataFrame args
     ((1,), None),
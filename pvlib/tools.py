@@ -253,6 +253,35 @@ def _doy_to_datetimeindex(doy, epoch_year=2014):
     return pd.DatetimeIndex(timestamps)
 
 
+def _components_to_datetimeindex(year, month, day, hour=0, minute=0):
+    """
+    Convert integer date and time components to a pd.DatetimeIndex.
+
+    The components are combined with integer arithmetic rather than by
+    formatting and parsing strings. Hours and minutes beyond the end of a
+    day carry over to the next day, e.g. hour 24 is midnight of the next
+    day.
+
+    Parameters
+    ----------
+    year, month, day : array-like of int
+    hour, minute : array-like of int, default 0
+
+    Returns
+    -------
+    pd.DatetimeIndex
+    """
+    year, month, day, hour, minute = (
+        np.asarray(x, dtype=np.int64) for x in (year, month, day, hour,
+                                                minute))
+    months = (year - 1970) * 12 + month - 1
+    days = months.astype('datetime64[M]').astype('datetime64[D]') \
+        .astype(np.int64) + day - 1
+    minutes = (days * 24 + hour) * 60 + minute
+    return pd.DatetimeIndex(minutes.astype('datetime64[m]')
+                            .astype('datetime64[ns]'))
+
+
 def _datetimelike_scalar_to_doy(time):
     return _pandas_to_doy(_datetimelike_scalar_to_datetimeindex(time))
 
@@ -421,6 +450,331 @@ def _golden_sect_DataFrame(params, lower, upper, func, atol=1e-8):
     return func_result, x
 
 
+def _chandrupatla(func, a, b, args=(), xtol=2e-12,
+                  rtol=4*np.finfo(float).eps, maxiter=100,
+                  full_output=False, disp=True):
+    """
+    Vectorized bracketing root finder using Chandrupatla's method.
+
+    All elements are advanced in lockstep; elements that have converged are
+    masked out so that ``func`` is only evaluated where work remains. Each
+    step is either an inverse quadratic interpolation or a bisection, so
+    convergence is guaranteed like :py:func:`scipy:scipy.optimize.brentq`.
+
+    Parameters
+    ----------
+    func : function
+        Function whose root is sought. Must be in the form
+        ``f(x, *args)`` and accept arrays.
+    a : numeric
+        One end of the bracketing interval.
+    b : numeric
+        The other end of the bracketing interval. ``func(a)`` and
+        ``func(b)`` must have opposite signs.
+    args : tuple, optional
+        Extra arguments to ``func``. Array arguments are broadcast against
+        ``a`` and ``b``; scalar arguments are passed unchanged.
+    xtol : float, default 2e-12
+        Absolute tolerance on the root.
+    rtol : float, default 4*eps
+        Relative tolerance on the root.
+    maxiter : int, default 100
+        Maximum number of iterations.
+    full_output : bool, default False
+        If True, also return convergence information.
+    disp : bool, default True
+        If True, raise RuntimeError if any element has not converged after
+        ``maxiter`` iterations.
+
+    Returns
+    -------
+    root : numeric
+        Roots, with the broadcast shape of ``a``, ``b`` and ``args``. NaN
+        where ``func`` is NaN at either end of the interval.
+    converged : numeric, optional
+        Boolean array, True where the root converged. Only returned if
+        ``full_output`` is True.
+    iterations : int, optional
+        Number of iterations performed. Only returned if ``full_output``
+        is True.
+
+    Raises
+    ------
+    ValueError
+        If ``func(a)`` and ``func(b)`` have the same sign for any element.
+    RuntimeError
+        If ``disp`` is True and any element fails to converge.
+
+    References
+    ----------
+    .. [1] T. R. Chandrupatla, "A new hybrid quadratic/bisection algorithm
+       for finding the zero of a nonlinear function without using
+       derivatives", Advances in Engineering Software 28(3), pp. 145-149,
+       1997. :doi:`10.1016/S0965-9978(96)00051-8`
+    """
+    shape = np.broadcast_shapes(np.shape(a), np.shape(b),
+                                *map(np.shape, args))
+    x0 = np.broadcast_to(a, shape).astype(float).ravel()
+    x1 = np.broadcast_to(b, shape).astype(float).ravel()
+    # scalar arguments are passed through unchanged
+    args = [arg if np.ndim(arg) == 0 else np.broadcast_to(arg, shape).ravel()
+            for arg in args]
+
+    f0 = func(x0, *args)
+    f1 = func(x1, *args)
+
+    root = np.full(x0.shape, np.nan)
+    converged = np.zeros(x0.shape, dtype=bool)
+    valid = ~(np.isnan(f0) | np.isnan(f1))
+    if np.any(np.sign(f0[valid]) * np.sign(f1[valid]) > 0):
+        raise ValueError("f(a) and f(b) must have different signs")
+
+    # roots found at the interval ends
+    at_x0 = valid & (f0 == 0)
+    at_x1 = valid & (f1 == 0) & ~at_x0
+    root[at_x0] = x0[at_x0]
+    root[at_x1] = x1[at_x1]
+    converged[at_x0 | at_x1] = True
+
+    # indices of elements still being iterated; all arrays below are
+    # compressed to these elements
+    idx = np.flatnonzero(valid & ~converged)
+    a, b, fa, fb = x0[idx], x1[idx], f0[idx], f1[idx]
+    c, fc = a, fa
+    args = [arg if np.ndim(arg) == 0 else arg[idx] for arg in args]
+    t = np.full(idx.shape, 0.5)
+
+    iterations = 0
+    while idx.size and iterations < maxiter:
+        iterations += 1
+        xt = a + t * (b - a)
+        ft = func(xt, *args)
+        # keep the root bracketed between the new point and a or b
+        samesign = np.sign(ft) == np.sign(fa)
+        c = np.where(samesign, a, b)
+        fc = np.where(samesign, fa, fb)
+        b = np.where(samesign, b, a)
+        fb = np.where(samesign, fb, fa)
+        a, fa = xt, ft
+
+        # best estimate so far
+        a_best = np.abs(fa) < np.abs(fb)
+        xm = np.where(a_best, a, b)
+        fm = np.where(a_best, fa, fb)
+
+        tol = 0.5 * (xtol + rtol * np.abs(xm))
+        with np.errstate(divide='ignore', invalid='ignore'):
+            tlim = tol / np.abs(b - c)
+        done = (fm == 0) | (tlim > 0.5)
+        if np.any(done):
+            root[idx[done]] = xm[done]
+            converged[idx[done]] = True
+            keep = ~done
+            idx = idx[keep]
+            a, b, c = a[keep], b[keep], c[keep]
+            fa, fb, fc = fa[keep], fb[keep], fc[keep]
+            tlim = tlim[keep]
+            args = [arg if np.ndim(arg) == 0 else arg[keep] for arg in args]
+
+        # use inverse quadratic interpolation where it is well behaved,
+        # bisection otherwise
+        with np.errstate(divide='ignore', invalid='ignore'):
+            xi = (a - b) / (c - b)
+            phi = (fa - fb) / (fc - fb)
+            iqi = (phi**2 < xi) & ((1 - phi)**2 < 1 - xi)
+            t = np.where(
+                iqi,
+                fa / (fb - fa) * fc / (fb - fc)
+                + (c - a) / (b - a) * fa / (fc - fa) * fb / (fc - fb),
+                0.5)
+        t = np.clip(t, tlim, 1 - tlim)
+
+    if idx.size:
+        if disp:
+            raise RuntimeError(
+                f"Failed to converge after {maxiter} iterations")
+        # return the best estimate for unconverged elements
+        a_best = np.abs(fa) < np.abs(fb)
+        root[idx] = np.where(a_best, a, b)
+
+    root = root.reshape(shape)
+    if full_output:
+        return root, converged.reshape(shape), iterations
+    return root
+
+
+def _bisect(func, a, b, args=(), xtol=2e-12, rtol=4*np.finfo(float).eps,
+            maxiter=100):
+    """
+    Vectorized bisection that takes the same steps as
+    :py:func:`scipy:scipy.optimize.bisect` for each element.
+
+    All elements are bisected in lockstep; elements that have converged are
+    masked out so that ``func`` is only evaluated where work remains.
+
+    Parameters
+    ----------
+    func : function
+        Function whose root is sought. Must be in the form
+        ``f(x, *args)`` and accept arrays.
+    a : numeric
+        One end of the bracketing interval.
+    b : numeric
+        The other end of the bracketing interval.
+    args : tuple, optional
+        Extra arguments to ``func``. Array arguments are broadcast against
+        ``a`` and ``b``; scalar arguments are passed unchanged.
+    xtol : float, default 2e-12
+        Absolute tolerance on the root.
+    rtol : float, default 4*eps
+        Relative tolerance on the root.
+    maxiter : int, default 100
+        Maximum number of iterations.
+
+    Returns
+    -------
+    root : numeric
+        Roots, with the broadcast shape of ``a``, ``b`` and ``args``. For
+        elements that did not converge, the end of the final interval
+        on the side of ``a``.
+    converged : numeric
+        Boolean array, True where the root converged.
+    iterations : numeric
+        Number of iterations for each element. -1 where
+        :py:func:`scipy:scipy.optimize.bisect` would raise ValueError,
+        i.e. where ``func(a)`` and ``func(b)`` have the same sign or
+        ``func`` is NaN, in which case ``root`` is NaN.
+    """
+    shape = np.broadcast(np.empty(np.shape(a)), np.empty(np.shape(b)),
+                         *[np.empty(np.shape(arg)) for arg in args]).shape
+    xa = np.broadcast_to(a, shape).astype(float).ravel()
+    xb = np.broadcast_to(b, shape).astype(float).ravel()
+    # scalar arguments are passed through unchanged
+    args = [arg if np.ndim(arg) == 0 else np.broadcast_to(arg, shape).ravel()
+            for arg in args]
+
+    fa = func(xa, *args)
+    fb = func(xb, *args)
+
+    root = np.full(xa.shape, np.nan)
+    converged = np.zeros(xa.shape, dtype=bool)
+    iterations = np.zeros(xa.shape, dtype=int)
+    failed = np.isnan(fa) | np.isnan(fb) | (fa * fb > 0)
+    iterations[failed] = -1
+
+    # roots found at the interval ends
+    at_xa = ~failed & (fa == 0)
+    at_xb = ~failed & (fb == 0) & ~at_xa
+    root[at_xa] = xa[at_xa]
+    root[at_xb] = xb[at_xb]
+    converged[at_xa | at_xb] = True
+
+    # indices of elements still being iterated; all arrays below are
+    # compressed to these elements
+    idx = np.flatnonzero(~failed & ~converged)
+    xa, fa, dm = xa[idx], fa[idx], xb[idx] - xa[idx]
+    args = [arg if np.ndim(arg) == 0 else arg[idx] for arg in args]
+
+    for _ in range(maxiter):
+        if not idx.size:
+            break
+        iterations[idx] += 1
+        dm = dm * 0.5
+        xm = xa + dm
+        fm = func(xm, *args)
+        xa = np.where(fm * fa >= 0, xm, xa)
+        nan = np.isnan(fm)
+        done = ~nan & ((fm == 0) | (np.abs(dm) < xtol + rtol * np.abs(xm)))
+        root[idx[done]] = xm[done]
+        converged[idx[done]] = True
+        iterations[idx[nan]] = -1
+        keep = ~(done | nan)
+        idx = idx[keep]
+        xa, fa, dm = xa[keep], fa[keep], dm[keep]
+        args = [arg if np.ndim(arg) == 0 else arg[keep] for arg in args]
+
+    # elements that did not converge return the last lower end
+    root[idx] = xa
+    return (root.reshape(shape), converged.reshape(shape),
+            iterations.reshape(shape))
+
+
+def _masked_newton(func, fprime, x0, args=(), tol=1.48e-8, rtol=0.0,
+                   maxiter=50, upper=np.inf):
+    """
+    Vectorized Newton's method that only iterates unconverged elements.
+
+    Unlike :py:func:`scipy:scipy.optimize.newton` with array input, which
+    evaluates every element until all have converged, elements are removed
+    from the iteration once their step is within tolerance, so the cost is
+    proportional to the number of iterations each element needs. This is
+    useful when most elements start close to their roots.
+
+    Parameters
+    ----------
+    func : function
+        Function whose root is sought. Must be in the form
+        ``f(x, *args)`` and accept arrays.
+    fprime : function
+        Derivative of ``func``, with the same signature.
+    x0 : numeric
+        Initial guesses.
+    args : tuple, optional
+        Extra arguments to ``func`` and ``fprime``. Array arguments are
+        broadcast against ``x0``; scalar arguments are passed unchanged.
+    tol : float, default 1.48e-8
+        Absolute tolerance on the Newton step.
+    rtol : float, default 0
+        Relative tolerance on the Newton step.
+    maxiter : int, default 50
+        Maximum number of iterations.
+    upper : numeric, default np.inf
+        Elements are stopped, and reported as not converged, once an
+        iterate exceeds ``upper``, which is broadcast against ``x0``.
+
+    Returns
+    -------
+    root : numeric
+        Estimated roots, with the broadcast shape of ``x0`` and ``args``.
+    converged : numeric
+        Boolean array, True where the step fell within tolerance.
+    zero_der : numeric
+        Boolean array, True where the derivative was zero.
+    """
+    shape = np.broadcast_shapes(np.shape(x0), *map(np.shape, args))
+    x = np.broadcast_to(x0, shape).astype(float).ravel()
+    args = [arg if np.ndim(arg) == 0 else np.broadcast_to(arg, shape).ravel()
+            for arg in args]
+    upper = np.broadcast_to(upper, shape).ravel()
+    converged = np.zeros(x.shape, dtype=bool)
+    zero_der = np.zeros(x.shape, dtype=bool)
+
+    idx = np.arange(x.size)
+    xi = x
+    for _ in range(maxiter):
+        if not idx.size:
+            break
+        # poor initial guesses may overflow; those elements are reported
+        # as not converged
+        with np.errstate(all='ignore'):
+            fval = func(xi, *args)
+            fder = fprime(xi, *args)
+            step = fval / fder
+            xi = xi - step
+            done = np.abs(step) <= tol + rtol * np.abs(xi)
+        x[idx] = xi
+        # stop iterating elements that converged or cannot continue
+        zero = fder == 0
+        converged[idx[done]] = True
+        zero_der[idx[zero]] = True
+        keep = ~(done | zero | np.isnan(xi)) & (xi <= upper)
+        idx, xi, upper = idx[keep], xi[keep], upper[keep]
+        args = [arg if np.ndim(arg) == 0 else arg[keep] for arg in args]
+
+    return (x.reshape(shape), converged.reshape(shape),
+            zero_der.reshape(shape))
+
+
 def _get_sample_intervals(times, win_length):
     """ Calculates time interval and samples per window for Reno-style clear
     sky detection functions
@@ -448,16 +802,17 @@ def _degrees_to_index(degrees, coordinate):
     the appropriate index number for these two index numbers.
     Parameters
     ----------
-    degrees : float or int
+    degrees : float, int or array-like
         Degrees of either latitude or longitude.
     coordinate : string
         Specify whether degrees arg is latitude or longitude. Must be set to
         either 'latitude' or 'longitude' or an error will be raised.
     Returns
     -------
-    index : np.int16
+    index : int or np.ndarray of int
         The latitude or longitude index number to use when looking up values
-        in the Linke turbidity lookup table.
+        in the Linke turbidity lookup table. An array if `degrees` is
+        array-like.
     """
     # Assign inputmin, inputmax, and outputmax based on degree type.
     if coordinate == 'latitude':
@@ -475,31 +830,44 @@ def _degrees_to_index(degrees, coordinate):
     scale = outputmax/inputrange  # number of indices per degree
     center = inputmin + 1 / scale / 2  # shift to center of index
     outputmax -= 1  # shift index to zero indexing
+    degrees = np.asarray(degrees, dtype=float)
     index = (degrees - center) * scale
-    err = IndexError('Input, %g, is out of range (%g, %g).' %
-                     (degrees, inputmin, inputmax))
 
     # If the index is still out of bounds after rounding, raise an error.
     # 0.500001 is used in comparisons instead of 0.5 to allow for a small
     # margin of error which can occur when dealing with floating point numbers.
-    if index > outputmax:
-        if index - outputmax <= 0.500001:
-            index = outputmax
-        else:
-            raise err
-    elif index < 0:
-        if -index <= 0.500001:
-            index = 0
-        else:
-            raise err
-    # If the index wasn't set to outputmax or 0, round it and cast it as an
-    # integer so it can be used in integer-based indexing.
-    else:
-        index = int(np.around(index))
-
+    out_of_range = ~((index - outputmax <= 0.500001) & (-index <= 0.500001))
+    if np.any(out_of_range):
+        raise IndexError('Input, %g, is out of range (%g, %g).' %
+                         (degrees[out_of_range].flat[0], inputmin, inputmax))
+    # Indices within the margin are set to outputmax or 0, others are
+    # rounded and cast as integers so they can be used in integer-based
+    # indexing.
+    index = np.clip(np.around(index), 0, outputmax).astype(int)
+    if index.ndim == 0:
+        return int(index)
     return index
 
 
+def _read_h5_grid(filepath, name):
+    """
+    Read the dataset `name` of the HDF5 file `filepath` into a read-only
+    array. The dataset is memory-mapped if it is stored contiguously in the
+    file, otherwise (e.g. if it is compressed) it is read into memory.
+    """
+    import h5py
+    with h5py.File(filepath, 'r') as h5_file:
+        dataset = h5_file[name]
+        offset = dataset.id.get_offset()
+        if offset is None:
+            grid = dataset[()]
+        else:
+            grid = np.memmap(filepath, dtype=dataset.dtype, mode='r',
+                             offset=offset, shape=dataset.shape)
+    grid.flags.writeable = False
+    return grid
+
+
 EPS = np.finfo('float64').eps  # machine precision NumPy-1.20
 DX = EPS**(1/3)  # optimal differential element
 